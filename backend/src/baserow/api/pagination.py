@@ -1,8 +1,28 @@
+import base64
+import binascii
+import datetime
+import json
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from baserow.core.db import (
+    annotate_keyset,
+    filter_after_keyset,
+    get_keyset_values,
+    get_queryset_order_bys,
+    reverse_order_bys,
+)
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -39,3 +59,218 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+def _encode_keyset_value(value: Any) -> Any:
+    """
+    Converts a value of an ordering expression into something that can be stored
+    in a JSON cursor without losing the type information that is needed to compare
+    it again in the database.
+    """
+
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    elif isinstance(value, datetime.date):
+        return {"d": value.isoformat()}
+    elif isinstance(value, datetime.time):
+        return {"t": value.isoformat()}
+    elif isinstance(value, Decimal):
+        return {"n": str(value)}
+    elif isinstance(value, UUID):
+        return {"u": str(value)}
+    elif isinstance(value, (list, tuple)):
+        return {"a": [_encode_keyset_value(v) for v in value]}
+    return value
+
+
+def _decode_keyset_value(value: Any) -> Any:
+    """
+    The inverse of `_encode_keyset_value`.
+    """
+
+    if not isinstance(value, dict):
+        return value
+
+    ((key, raw),) = value.items()
+    if key == "dt":
+        return datetime.datetime.fromisoformat(raw)
+    elif key == "d":
+        return datetime.date.fromisoformat(raw)
+    elif key == "t":
+        return datetime.time.fromisoformat(raw)
+    elif key == "n":
+        return Decimal(raw)
+    elif key == "u":
+        return UUID(raw)
+    elif key == "a":
+        return [_decode_keyset_value(v) for v in raw]
+    raise ValueError(f"Unknown keyset value type {key}.")
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination which uses the ordering of the queryset as keyset. Instead of
+    an `OFFSET`, the values of the ordering expressions of the last row of a page
+    are stored in an opaque cursor and the next page is fetched by filtering on the
+    rows that come after those values. This makes fetching a page deep into a large
+    table as fast as fetching the first one.
+
+    The ordering of the queryset must end with a unique column (the row `id`),
+    which is automatically added if that's not already the case. Null values are
+    respected in the same way as the `nulls_first` and `nulls_last` arguments of the
+    `OrderBy` expressions.
+
+    Because counting is expensive for large tables, the total count is only
+    included in the response if the `include_count` query parameter is provided.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+    count_query_param = "include_count"
+
+    def __init__(self, limit_page_size: Optional[int] = None):
+        self.limit_page_size = limit_page_size
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """
+        Indicates whether the client requested keyset pagination by providing the
+        cursor query parameter. An empty value fetches the first page.
+        """
+
+        return cls.cursor_query_param in request.query_params
+
+    def _raise_error(self, error: str, detail: str):
+        exception = APIException({"error": error, "detail": detail})
+        exception.status_code = HTTP_400_BAD_REQUEST
+        raise exception
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except KeyError:
+            return self.page_size
+        except ValueError:
+            page_size = 0
+
+        if page_size <= 0:
+            self._raise_error(
+                "ERROR_INVALID_PAGE_SIZE", "The page size must be a positive integer."
+            )
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            self._raise_error(
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.limit_page_size}.",
+            )
+
+        return page_size
+
+    def decode_cursor(self, request) -> Optional[Tuple[bool, List[Any]]]:
+        """
+        Decodes the cursor query parameter into a tuple containing whether the
+        previous page is requested and the keyset values. Returns `None` if the first
+        page is requested.
+        """
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            reverse = bool(payload["r"])
+            values = [_decode_keyset_value(value) for value in payload["v"]]
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            TypeError,
+            ValueError,
+            KeyError,
+            AttributeError,
+        ):
+            self._raise_error("ERROR_INVALID_CURSOR", "The provided cursor is invalid.")
+
+        return reverse, values
+
+    def encode_cursor(self, instance, names: List[str], reverse: bool) -> str:
+        payload = {
+            "r": int(reverse),
+            "v": [
+                _encode_keyset_value(value)
+                for value in get_keyset_values(instance, names)
+            ],
+        }
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode()
+        )
+        return encoded.decode().rstrip("=")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.count = None
+
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        order_bys = get_queryset_order_bys(queryset)
+
+        if request.query_params.get(self.count_query_param, "").lower() in (
+            "1",
+            "true",
+        ):
+            self.count = queryset.order_by().count()
+
+        reverse = False
+        if cursor is None:
+            queryset, names = annotate_keyset(queryset, order_bys)
+        else:
+            reverse, values = cursor
+            if len(values) != len(order_bys):
+                self._raise_error(
+                    "ERROR_INVALID_CURSOR",
+                    "The cursor doesn't match the ordering of the rows.",
+                )
+            if reverse:
+                order_bys = reverse_order_bys(order_bys)
+            queryset, names = annotate_keyset(queryset, order_bys)
+            queryset = filter_after_keyset(queryset, names, order_bys, values)
+
+        rows = list(queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_cursor = None
+        self.previous_cursor = None
+        if rows:
+            if has_more or reverse:
+                self.next_cursor = self.encode_cursor(rows[-1], names, False)
+            if (has_more and reverse) or (not reverse and cursor is not None):
+                self.previous_cursor = self.encode_cursor(rows[0], names, True)
+
+        return rows
+
+    def _get_link(self, cursor: Optional[str]) -> Optional[str]:
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "page")
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self) -> Optional[str]:
+        return self._get_link(self.next_cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        return self._get_link(self.previous_cursor)
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response["count"] = self.count
+        response["next"] = self.get_next_link()
+        response["previous"] = self.get_previous_link()
+        response["results"] = data
+        return Response(response)
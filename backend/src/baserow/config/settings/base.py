@@ -339,6 +339,22 @@ CELERY_SINGLETON_BACKEND_CLASS = (
 # This flag enable automatic index creation for table views based on sortings.
 AUTO_INDEX_VIEW_ENABLED = os.getenv("BASEROW_AUTO_INDEX_VIEW_ENABLED", "true") == "true"
 AUTO_INDEX_LOCK_EXPIRY = os.getenv("BASEROW_AUTO_INDEX_LOCK_EXPIRY", 60 * 2)
+# This flag enables the automatic index creation for the filters of the views, like
+# trigram indexes for the contains filters and btree indexes for the range filters.
+AUTO_INDEX_VIEW_FILTERS_ENABLED = (
+    os.getenv("BASEROW_AUTO_INDEX_VIEW_FILTERS_ENABLED", "true") == "true"
+)
+# The automatically created filter indexes that have not been used by any query
+# between two runs of this job are dropped.
+AUTO_INDEX_VIEW_FILTERS_UNUSED_CRONTAB = get_crontab_from_env(
+    "BASEROW_AUTO_INDEX_VIEW_FILTERS_UNUSED_CRONTAB", default_crontab="0 4 * * 0"
+)
+# A filter index that was dropped because it was not used, or that couldn't be
+# created, is not created again for this number of days. After that, it's created
+# the next time the indexes of the view are updated, like when its filters change.
+AUTO_INDEX_VIEW_FILTERS_RETRY_DAYS = int(
+    os.getenv("BASEROW_AUTO_INDEX_VIEW_FILTERS_RETRY_DAYS", 30)
+)
 
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
@@ -843,6 +859,12 @@ THREE_AM_CRONTAB_STR = "0 3 * * *"
 BASEROW_ROW_COUNT_JOB_CRONTAB = get_crontab_from_env(
     "BASEROW_ROW_COUNT_JOB_CRONTAB", default_crontab=THREE_AM_CRONTAB_STR
 )
+# The row counts of the tables are kept up to date when rows are created or deleted.
+# The row count job only recounts the tables that have never been counted, and the
+# ones that have not been recounted for this number of days to fix any drift.
+BASEROW_ROW_COUNT_STALE_AFTER_DAYS = int(
+    os.getenv("BASEROW_ROW_COUNT_STALE_AFTER_DAYS", 7)
+)
 
 EMAIL_BACKEND = "djcelery_email.backends.CeleryEmailBackend"
 
@@ -925,6 +947,12 @@ CELERY_EMAIL_TASK_CONFIG = {
 # Configurable thumbnails that are going to be generated when a user uploads an image
 # file.
 USER_THUMBNAILS = {"tiny": [None, 21], "small": [48, 48], "card_cover": [300, 160]}
+# Generates the thumbnails of the uploaded images in a background task instead of
+# during the upload request. The upload responds with the urls of the thumbnails right
+# away, and a real time event is sent to the uploader when they're ready.
+BASEROW_USER_FILE_THUMBNAILS_ASYNC = (
+    os.getenv("BASEROW_USER_FILE_THUMBNAILS_ASYNC", "true") == "true"
+)
 
 # The directory that contains the all the templates in JSON format. When for example
 # the `sync_templates` management command is called, then the templates in the
@@ -1007,6 +1035,16 @@ BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST = [
 BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS = int(
     os.getenv("BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS", "10")
 )
+# The limit applies to every worker process separately, so the total number of
+# concurrent calls to a host can be this number times the number of processes.
+BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_HOST = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_HOST", 4)
+)
+# The maximum number of consecutive events of the same type and table within one
+# transaction that are merged into one webhook call.
+BASEROW_WEBHOOKS_MAX_EVENTS_PER_CALL = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_EVENTS_PER_CALL", 50)
+)
 
 # ======== WARNING ========
 # Please read and understand everything at:
@@ -1053,6 +1091,12 @@ BASEROW_MAX_SNAPSHOTS_PER_GROUP = int(os.getenv("BASEROW_MAX_SNAPSHOTS_PER_GROUP
 BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS = int(
     os.getenv("BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS", 360)  # 360 days
 )
+# The maximum number of tables of which the rows are exported concurrently when the
+# rows of a database are exported by chunks into a zip file. Set to 1 to export the
+# tables one by one.
+BASEROW_EXPORT_TABLE_ROWS_MAX_WORKERS = int(
+    os.getenv("BASEROW_EXPORT_TABLE_ROWS_MAX_WORKERS", 4)
+)
 
 PERMISSION_MANAGERS = [
     "view_ownership",
@@ -1148,6 +1192,56 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of generated table models, and the maximum total number of
+# fields of those models, that are kept in memory by every process.
+BASEROW_GENERATED_MODEL_L1_CACHE_SIZE = int(
+    os.getenv("BASEROW_GENERATED_MODEL_L1_CACHE_SIZE", 128)
+)
+BASEROW_GENERATED_MODEL_L1_CACHE_MAX_FIELDS = int(
+    os.getenv("BASEROW_GENERATED_MODEL_L1_CACHE_MAX_FIELDS", 20000)
+)
+# The number of seconds the ids of the users permitted to receive the real time
+# events of a scope are cached. Set to 0 to disable the cache.
+BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS", 60)
+)
+# Whether the cached footer aggregations of grid views are updated using only the
+# changed rows instead of being computed again for the whole view.
+BASEROW_INCREMENTAL_VIEW_AGGREGATIONS = str_to_bool(
+    os.getenv("BASEROW_INCREMENTAL_VIEW_AGGREGATIONS", "true")
+)
+# When the estimated row count of a view is requested, tables with fewer rows than
+# this threshold are still counted exactly. Larger tables are estimated using a
+# sample of approximately the configured number of rows, while the exact count is
+# computed in the background and cached for the configured number of seconds.
+BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD = int(
+    os.getenv("BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD", 100000)
+)
+BASEROW_ESTIMATED_ROW_COUNT_SAMPLE_SIZE = int(
+    os.getenv("BASEROW_ESTIMATED_ROW_COUNT_SAMPLE_SIZE", 10000)
+)
+BASEROW_EXACT_ROW_COUNT_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_EXACT_ROW_COUNT_CACHE_TIMEOUT", 60 * 5)
+)
+# The maximum number of related rows that are loaded per link row cell when listing
+# the rows of a grid or gallery view. Set to 0 to load all of them.
+BASEROW_LINK_ROW_LISTING_ITEMS_PER_CELL_LIMIT = int(
+    os.getenv("BASEROW_LINK_ROW_LISTING_ITEMS_PER_CELL_LIMIT", 0)
+)
+# The maximum number of generated row serializer classes that are kept in memory for
+# every generated table model. Set to 0 to disable the cache.
+BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE = int(
+    os.getenv("BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE", 128)
+)
+# The `rows_updated` real time events of a table are coalesced during this number of
+# milliseconds after the previous one. Coalesced events that are bigger than the
+# maximum payload size in bytes are replaced by a message containing only the row ids.
+BASEROW_WS_ROWS_UPDATED_COALESCE_WINDOW_MS = int(
+    os.getenv("BASEROW_WS_ROWS_UPDATED_COALESCE_WINDOW_MS", 500)
+)
+BASEROW_WS_ROWS_UPDATED_MAX_PAYLOAD_SIZE = int(
+    os.getenv("BASEROW_WS_ROWS_UPDATED_MAX_PAYLOAD_SIZE", 256 * 1024)
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1191,6 +1285,18 @@ BASEROW_BUILDER_DOMAINS = os.getenv("BASEROW_BUILDER_DOMAINS", None)
 BASEROW_BUILDER_DOMAINS = (
     BASEROW_BUILDER_DOMAINS.split(",") if BASEROW_BUILDER_DOMAINS is not None else []
 )
+# The maximum number of threads used to dispatch the independent data sources of a
+# builder page concurrently. Every thread uses its own database connection. Set to 1
+# to dispatch the data sources one after another.
+BASEROW_BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS", 4)
+)
+# The number of seconds the dispatch results of the data sources of published builders
+# are cached. They are invalidated when the rows, fields or views of the table change.
+# Set to 0 to disable the cache.
+BASEROW_BUILDER_PUBLIC_DATA_SOURCE_CACHE_TTL_SECONDS = int(
+    os.getenv("BASEROW_BUILDER_PUBLIC_DATA_SOURCE_CACHE_TTL_SECONDS", 60)
+)
 
 # Indicates whether we are running the tests or not. Set to True in the test.py settings
 # file used by pytest.ini
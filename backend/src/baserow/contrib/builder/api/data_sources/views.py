@@ -411,7 +411,8 @@ class DispatchDataSourcesView(APIView):
             ),
         },
     )
-    @transaction.atomic
+    # Not atomic, because the data sources are read only and dispatched concurrently
+    # with separate database connections that can't see a transaction in progress.
     @map_exceptions(
         {
             ServiceImproperlyConfigured: ERROR_DATA_SOURCE_IMPROPERLY_CONFIGURED,
@@ -0,0 +1,142 @@
+"""
+Caches the dispatch results of the data sources of published builders. Every
+anonymous visitor of a published page dispatches the same data sources, which would
+otherwise generate the table model, apply the filters and sorts and serialize the
+rows again for every request.
+
+A result is cached for `BASEROW_BUILDER_PUBLIC_DATA_SOURCE_CACHE_TTL_SECONDS`, and is
+keyed by the data source, the values of the data read by its formulas and the
+requested range. The key also contains a version of the table used by the service,
+which is changed when the rows, fields or views of the table change, so that the
+cached results of the table are not used anymore.
+"""
+
+import hashlib
+import json
+from typing import Any, Optional, Set
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.core.utils import get_nested_value_from_dict, to_path
+
+
+def _table_version_cache_key(table_id: int) -> str:
+    return f"builder_data_source_table_version_{table_id}"
+
+
+def get_table_version(table_id: int) -> str:
+    """
+    Returns the current version of the table, used in the keys of the cached
+    results.
+
+    :param table_id: The id of the table.
+    :return: The version of the table.
+    """
+
+    key = _table_version_cache_key(table_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_table_public_dispatches(table_id: int):
+    """
+    Changes the version of the table, so that none of the cached dispatch results
+    of the data sources using this table are used anymore.
+
+    :param table_id: The id of the table that has changed.
+    """
+
+    if settings.BASEROW_BUILDER_PUBLIC_DATA_SOURCE_CACHE_TTL_SECONDS > 0:
+        cache.set(_table_version_cache_key(table_id), uuid4().hex, timeout=None)
+
+
+def public_dispatch_can_be_cached(data_source: DataSource) -> bool:
+    """
+    Only the data sources of published builders, which have no workspace, whose
+    service uses a table can be cached.
+    """
+
+    return (
+        settings.BASEROW_BUILDER_PUBLIC_DATA_SOURCE_CACHE_TTL_SECONDS > 0
+        and data_source.page.builder.workspace_id is None
+        and getattr(data_source.service.specific, "table_id", None) is not None
+    )
+
+
+def get_public_dispatch_cache_key(
+    data_source: DataSource,
+    data_paths: Optional[Set[str]],
+    dispatch_context: BuilderDispatchContext,
+) -> Optional[str]:
+    """
+    Returns the key of the cached dispatch result of the data source.
+
+    :param data_source: The data source that is dispatched.
+    :param data_paths: The data paths read by the formulas of the data source.
+    :param dispatch_context: The context used to resolve formulas.
+    :return: The key or None if the result can't be cached because the values of
+        the formulas can't be known before the dispatch.
+    """
+
+    if data_paths is None:
+        return None
+
+    service = data_source.service.specific
+    data_source_contents = dispatch_context.cache.get("data_source_contents", {})
+    values = {}
+    for path in sorted(data_paths):
+        provider_name, *rest = to_path(path)
+        try:
+            if provider_name == "data_source":
+                # Reading the value from the context would dispatch the other data
+                # source and add it to the call stack, so only the data sources that
+                # have already been dispatched are used.
+                values[path] = get_nested_value_from_dict(
+                    data_source_contents[int(rest[0])], rest[1:]
+                )
+            else:
+                values[path] = dispatch_context[path]
+        except Exception:
+            return None
+
+    parameters = json.dumps(
+        [dispatch_context.range(service), values], sort_keys=True, default=str
+    )
+    parameters_hash = hashlib.sha256(parameters.encode("utf-8")).hexdigest()
+    table_version = get_table_version(service.table_id)
+    return (
+        f"builder_data_source_dispatch_{data_source.id}_{table_version}_"
+        f"{parameters_hash}"
+    )
+
+
+def get_cached_public_dispatch(cache_key: Optional[str]) -> Optional[Any]:
+    """
+    Returns the cached dispatch result or None if there is none.
+    """
+
+    if cache_key is None:
+        return None
+    return cache.get(cache_key)
+
+
+def set_cached_public_dispatch(cache_key: Optional[str], result: Any):
+    """
+    Caches the dispatch result if it can be cached.
+    """
+
+    if cache_key is not None:
+        cache.set(
+            cache_key,
+            result,
+            timeout=settings.BASEROW_BUILDER_PUBLIC_DATA_SOURCE_CACHE_TTL_SECONDS,
+        )
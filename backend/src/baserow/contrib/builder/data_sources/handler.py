@@ -1,21 +1,34 @@
-from typing import Any, Iterable, Optional, Union
+from copy import copy, deepcopy
+from queue import SimpleQueue
+from threading import Thread
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+from django.conf import settings
+from django.db import connection
 from django.db.models import QuerySet
 
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
 )
+from baserow.contrib.builder.data_sources.cache import (
+    get_cached_public_dispatch,
+    get_public_dispatch_cache_key,
+    public_dispatch_can_be_cached,
+    set_cached_public_dispatch,
+)
 from baserow.contrib.builder.data_sources.exceptions import (
     DataSourceDoesNotExist,
     DataSourceImproperlyConfigured,
 )
 from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.pages.models import Page
+from baserow.core.formula import get_formula_data_paths
+from baserow.core.formula.field import FormulaField
 from baserow.core.integrations.registries import integration_type_registry
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 from baserow.core.services.registries import ServiceType
-from baserow.core.utils import find_unused_name
+from baserow.core.utils import find_unused_name, to_path
 
 from .types import DataSourceForUpdate
 
@@ -270,7 +283,21 @@ class DataSourceHandler:
         """
 
         data_sources_dispatch = {}
+
+        max_workers = settings.BASEROW_BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS
+        # The threads use their own database connections, so they can't see the
+        # changes of a transaction that is still in progress.
+        if max_workers > 1 and len(data_sources) > 1 and not connection.in_atomic_block:
+            data_sources_dispatch = self._dispatch_data_sources_concurrently(
+                data_sources, dispatch_context, max_workers
+            )
+
+        # The data sources that have not been dispatched concurrently, because their
+        # dependencies are unknown or circular, are dispatched one after another.
         for data_source in data_sources:
+            if data_source.id in data_sources_dispatch:
+                continue
+
             # Add the initial call to the call stack
             dispatch_context.add_call(data_source.id)
             try:
@@ -284,6 +311,185 @@ class DataSourceHandler:
 
         return data_sources_dispatch
 
+    def _dispatch_data_sources_concurrently(
+        self,
+        data_sources: List[DataSource],
+        dispatch_context: BuilderDispatchContext,
+        max_workers: int,
+    ) -> Dict[int, Any]:
+        """
+        Dispatches the data sources concurrently in waves. A wave contains all the
+        data sources whose formulas only use data sources of the previous waves.
+        The results of every wave are added to `dispatch_context.cache` before the
+        next one starts, so they're available to the threads of the next waves.
+
+        :param data_sources: The data sources to be dispatched.
+        :param dispatch_context: The context used to resolve formulas.
+        :param max_workers: The maximum number of threads dispatching data sources.
+        :return: The result of dispatching the data sources mapped by data source ID.
+            Data sources whose dependencies are unknown or circular are not
+            dispatched.
+        """
+
+        dependencies = {
+            data_source.id: self.get_data_source_dependencies(data_source)
+            for data_source in data_sources
+        }
+
+        data_source_contents = dispatch_context.cache.setdefault(
+            "data_source_contents", {}
+        )
+        # The lazily parsed data of the request is loaded before the threads only
+        # read it.
+        request = getattr(dispatch_context, "request", None)
+        if request is not None:
+            _ = (request.GET, request.data)
+
+        jobs = SimpleQueue()
+        done = SimpleQueue()
+
+        def work():
+            try:
+                while True:
+                    data_source = jobs.get()
+                    if data_source is None:
+                        return
+                    done.put(
+                        (
+                            data_source.id,
+                            self._dispatch_data_source_in_thread(
+                                data_source, dispatch_context
+                            ),
+                        )
+                    )
+            finally:
+                # Django opens a database connection for every thread. It's reused
+                # for all the data sources that the thread dispatches, and must be
+                # closed because the thread is not managed by the request.
+                connection.close()
+
+        # A bounded number of threads is started once and dispatches the data sources
+        # of all the waves, so that at most `max_workers` connections are opened.
+        workers = [
+            Thread(target=work) for _ in range(min(max_workers, len(data_sources)))
+        ]
+        for worker in workers:
+            worker.start()
+
+        results = {}
+        try:
+            while True:
+                wave = [
+                    data_source
+                    for data_source in data_sources
+                    if data_source.id not in results
+                    and dependencies[data_source.id] is not None
+                    and dependencies[data_source.id].issubset(results)
+                ]
+                if not wave:
+                    break
+
+                for data_source in wave:
+                    jobs.put(data_source)
+                wave_results = dict(done.get() for _ in wave)
+                for data_source in wave:
+                    result, thread_data_source_contents = wave_results[data_source.id]
+                    results[data_source.id] = result
+                    data_source_contents.update(thread_data_source_contents)
+        finally:
+            for _ in workers:
+                jobs.put(None)
+            for worker in workers:
+                worker.join()
+
+        return results
+
+    def _dispatch_data_source_in_thread(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Tuple[Any, Dict[int, Any]]:
+        """
+        Dispatches the data source in a worker thread. The dispatch context is
+        copied to give the thread its own call stack for the recursion detection,
+        and a deep copy of the cache, so that the threads never share the objects
+        in it.
+
+        :return: The result of the dispatch or the exception that occurred, and the
+            data source contents cached by the thread.
+        """
+
+        try:
+            thread_dispatch_context = copy(dispatch_context)
+            thread_dispatch_context.cache = deepcopy(dispatch_context.cache)
+            thread_dispatch_context.reset_call_stack()
+            thread_dispatch_context.add_call(data_source.id)
+            result = self.dispatch_data_source(data_source, thread_dispatch_context)
+        except Exception as e:
+            return e, {}
+
+        return result, thread_dispatch_context.cache["data_source_contents"]
+
+    def get_data_source_data_paths(self, data_source: DataSource) -> Optional[Set[str]]:
+        """
+        Returns the data paths read by the formulas of the service of the given data
+        source, like `data_source.1.field_2` or `page_parameter.id`.
+
+        :param data_source: The data source to analyse.
+        :return: The data paths or None if they can't be known without resolving the
+            formulas.
+        """
+
+        if not data_source.service_id:
+            return set()
+
+        service = data_source.service.specific
+        data_paths = set()
+        for field in service._meta.get_fields():
+            formula = (
+                getattr(service, field.name)
+                if isinstance(field, FormulaField)
+                else None
+            )
+            if not formula:
+                continue
+
+            try:
+                paths = get_formula_data_paths(formula)
+            except Exception:
+                return None
+            if paths is None:
+                return None
+            data_paths.update(paths)
+
+        return data_paths
+
+    def get_data_source_dependencies(
+        self, data_source: DataSource
+    ) -> Optional[Set[int]]:
+        """
+        Returns the ids of the data sources used by the formulas of the service of
+        the given data source.
+
+        :param data_source: The data source to analyse.
+        :return: The ids of the data sources or None if they can't be known without
+            resolving the formulas.
+        """
+
+        data_paths = self.get_data_source_data_paths(data_source)
+        if data_paths is None:
+            return None
+
+        dependencies = set()
+        for path in data_paths:
+            provider_name, *rest = to_path(path)
+            if provider_name != "data_source":
+                continue
+            try:
+                dependencies.add(int(rest[0]))
+            except (IndexError, ValueError):
+                return None
+
+        return dependencies
+
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
     ) -> Any:
@@ -303,9 +509,20 @@ class DataSourceHandler:
         if data_source.id not in dispatch_context.cache.setdefault(
             "data_source_contents", {}
         ):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, dispatch_context
-            )
+            cache_key = None
+            if public_dispatch_can_be_cached(data_source):
+                cache_key = get_public_dispatch_cache_key(
+                    data_source,
+                    self.get_data_source_data_paths(data_source),
+                    dispatch_context,
+                )
+
+            service_dispatch = get_cached_public_dispatch(cache_key)
+            if service_dispatch is None:
+                service_dispatch = self.service_handler.dispatch_service(
+                    data_source.service.specific, dispatch_context
+                )
+                set_cached_public_dispatch(cache_key, service_dispatch)
             # Cache the dispatch in the formula cache if we have formulas that need
             # it later
             dispatch_context.cache["data_source_contents"][
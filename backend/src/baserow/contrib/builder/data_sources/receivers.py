@@ -1,6 +1,14 @@
+from django.db import transaction
 from django.db.models.signals import pre_delete
 
+from baserow.contrib.builder.data_sources.cache import (
+    invalidate_table_public_dispatches,
+)
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.rows import signals as row_signals
+from baserow.contrib.database.table import signals as table_signals
+from baserow.contrib.database.views import signals as view_signals
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.registries import service_type_registry
 
@@ -19,3 +27,54 @@ def before_data_source_permanently_deleted(sender, instance, **kwargs):
 
 def connect_to_data_source_pre_delete_signal():
     pre_delete.connect(before_data_source_permanently_deleted, DataSource)
+
+
+def invalidate_public_dispatches_when_table_changed(sender, **kwargs):
+    """
+    Invalidates the cached dispatch results of the published data sources using
+    the tables changed by the rows, fields or views in the signal arguments.
+    """
+
+    table_ids = set()
+    if "table" in kwargs:
+        table_ids.add(kwargs["table"].id)
+    if kwargs.get("field") is not None:
+        table_ids.add(kwargs["field"].table_id)
+    for related_field in kwargs.get("related_fields") or []:
+        table_ids.add(related_field.table_id)
+    if kwargs.get("view") is not None:
+        table_ids.add(kwargs["view"].table_id)
+    for name in ["view_filter", "view_filter_group", "view_sort"]:
+        if kwargs.get(name) is not None:
+            table_ids.add(kwargs[name].view.table_id)
+
+    # The cache is invalidated after the commit, otherwise a concurrent dispatch
+    # could cache the data from before the change with the new version.
+    for table_id in table_ids:
+        transaction.on_commit(
+            lambda table_id=table_id: invalidate_table_public_dispatches(table_id)
+        )
+
+
+def connect_to_table_change_signals():
+    for signal in [
+        row_signals.rows_created,
+        row_signals.rows_updated,
+        row_signals.rows_deleted,
+        field_signals.field_created,
+        field_signals.field_updated,
+        field_signals.field_deleted,
+        field_signals.field_restored,
+        table_signals.table_updated,
+        view_signals.view_updated,
+        view_signals.view_filter_created,
+        view_signals.view_filter_updated,
+        view_signals.view_filter_deleted,
+        view_signals.view_filter_group_created,
+        view_signals.view_filter_group_updated,
+        view_signals.view_filter_group_deleted,
+        view_signals.view_sort_created,
+        view_signals.view_sort_updated,
+        view_signals.view_sort_deleted,
+    ]:
+        signal.connect(invalidate_public_dispatches_when_table_changed)
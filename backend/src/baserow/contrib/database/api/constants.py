@@ -19,3 +19,40 @@ SEARCH_MODE_API_PARAM = OpenApiParameter(
         "whitespace on each cell. This is the Baserow legacy search behaviour."
     ),
 )
+CURSOR_API_PARAM = OpenApiParameter(
+    name="cursor",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "If provided, the rows are paginated by an opaque cursor instead of a page "
+        "or offset. Provide an empty value to fetch the first page, and follow the "
+        "`next` and `previous` links to fetch the adjacent pages. The cursor is "
+        "based on the sort order of the rows, which makes fetching pages deep into "
+        "a large table as fast as fetching the first one. The `size` parameter "
+        "defines how many rows should be returned. The `count` is only included in "
+        "the response if the `include_count` parameter is provided."
+    ),
+)
+INCLUDE_COUNT_API_PARAM = OpenApiParameter(
+    name="include_count",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.BOOL,
+    description=(
+        "Can only be used in combination with the `cursor` parameter and includes "
+        "the total `count` of the rows in the response."
+    ),
+)
+COUNT_MODE_API_PARAM = OpenApiParameter(
+    name="count_mode",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    enum=["exact", "estimate"],
+    description=(
+        "Can only be used in combination with the `count` parameter. If `estimate` "
+        "is provided, the count of a large table is estimated using the table "
+        "statistics or a sample of the rows instead of counting all of them, and "
+        "the `is_estimate` flag is included in the response. The exact count is "
+        "computed in the background and returned by subsequent requests when it "
+        "becomes available. Defaults to `exact`."
+    ),
+)
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from copy import deepcopy
 from typing import Dict, List
 
@@ -76,10 +77,88 @@ def get_row_serializer_class(
     :param required_fields: List of field names that should be present even when
         performing partial validation.
     :type required_fields: list[str]
-    :return: The generated serializer.
+    :return: The generated serializer. Unless `field_kwargs` are provided, the
+        same class is returned for the same model and arguments.
     :rtype: ModelSerializer
     """
 
+    # The field kwargs can contain unhashable values, and are only used for less
+    # frequent requests like submitting a form, so they're not cached.
+    if field_kwargs:
+        return _generate_row_serializer_class(
+            model,
+            base_class,
+            is_response,
+            field_ids,
+            field_names_to_include,
+            user_field_names,
+            field_kwargs,
+            include_id,
+            required_fields,
+        )
+
+    # Generating a serializer class with a field for every table field is
+    # expensive for wide tables. Models are reused between requests as long as the
+    # table doesn't change, so the generated serializer classes are cached on the
+    # model class itself. A changed table gets a new model class with an empty
+    # cache, and the cached classes are released together with the model.
+    cache_size = settings.BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE
+    cache_key = (
+        base_class,
+        is_response,
+        tuple(sorted(field_ids)) if field_ids is not None else None,
+        tuple(sorted(field_names_to_include))
+        if field_names_to_include is not None
+        else None,
+        user_field_names,
+        include_id,
+        tuple(required_fields) if required_fields is not None else None,
+    )
+    cache = model.__dict__.get("_row_serializer_class_cache")
+    if cache is None:
+        cache = OrderedDict()
+        if cache_size > 0:
+            model._row_serializer_class_cache = cache
+
+    try:
+        cache.move_to_end(cache_key)
+        return cache[cache_key]
+    except KeyError:
+        pass
+
+    serializer_class = _generate_row_serializer_class(
+        model,
+        base_class,
+        is_response,
+        field_ids,
+        field_names_to_include,
+        user_field_names,
+        None,
+        include_id,
+        required_fields,
+    )
+    cache[cache_key] = serializer_class
+    while len(cache) > cache_size:
+        cache.popitem(last=False)
+    return serializer_class
+
+
+def _generate_row_serializer_class(
+    model,
+    base_class,
+    is_response,
+    field_ids,
+    field_names_to_include,
+    user_field_names,
+    field_kwargs,
+    include_id,
+    required_fields,
+):
+    """
+    Generates the row serializer class, see `get_row_serializer_class` for the
+    parameters.
+    """
+
     if not field_kwargs:
         field_kwargs = {}
 
@@ -23,7 +23,7 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -104,7 +104,7 @@ from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 
-from ..constants import SEARCH_MODE_API_PARAM
+from ..constants import CURSOR_API_PARAM, INCLUDE_COUNT_API_PARAM, SEARCH_MODE_API_PARAM
 from .example_serializers import example_pagination_row_serializer_class
 from .schemas import row_names_response_schema
 from .serializers import (
@@ -277,15 +277,17 @@ class RowsView(APIView):
                 description="Includes all the filters and sorts of the provided view.",
             ),
             SEARCH_MODE_API_PARAM,
+            CURSOR_API_PARAM,
+            INCLUDE_COUNT_API_PARAM,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's workspace. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
-            "optional search query, only rows where the data matches the search query "
-            "are going to be returned then. The properties of the returned rows "
+            "paginated by a page/size or cursor style. It is also possible to provide "
+            "an optional search query, only rows where the data matches the search "
+            "query are going to be returned then. The properties of the returned rows "
             "depends on which fields the table has. For a complete overview of fields "
             "use the **list_database_table_fields** endpoint to list them all. In the "
             "example all field types are listed, but normally the number in "
@@ -302,6 +304,7 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -415,7 +418,12 @@ class RowsView(APIView):
                 filter_object, filter_type, user_field_names=user_field_names
             )
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True, user_field_names=user_field_names
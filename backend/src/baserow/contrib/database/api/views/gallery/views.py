@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import transaction
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
@@ -16,7 +17,10 @@ from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
-from baserow.contrib.database.api.constants import SEARCH_MODE_API_PARAM
+from baserow.contrib.database.api.constants import (
+    COUNT_MODE_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FILTER_FIELD_NOT_FOUND,
@@ -40,7 +44,10 @@ from baserow.contrib.database.api.views.serializers import (
     FieldOptionsField,
     validate_api_grouped_filters,
 )
-from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
+from baserow.contrib.database.api.views.utils import (
+    get_public_view_authorization_token,
+    get_view_rows_count_response_data,
+)
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FilterFieldNotFound,
@@ -124,6 +131,7 @@ class GalleryViewView(APIView):
                 "query are going to be returned.",
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
         ],
         tags=["Database table gallery view"],
         operation_id="list_database_table_gallery_view_rows",
@@ -187,8 +195,15 @@ class GalleryViewView(APIView):
         )
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            return Response(
+                get_view_rows_count_response_data(
+                    request, view, queryset, search, search_mode
+                )
+            )
 
+        queryset = queryset.limit_link_row_items_per_cell(
+            settings.BASEROW_LINK_ROW_LISTING_ITEMS_PER_CELL_LIMIT
+        )
         paginator = GalleryLimitOffsetPagination()
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
@@ -367,6 +382,7 @@ class PublicGalleryViewRowsView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
         ],
         tags=["Database table gallery view"],
         operation_id="public_list_database_table_gallery_view_rows",
@@ -487,8 +503,15 @@ class PublicGalleryViewRowsView(APIView):
         )
 
         if count:
-            return Response({"count": queryset.count()})
+            return Response(
+                get_view_rows_count_response_data(
+                    request, view, queryset, search, search_mode
+                )
+            )
 
+        queryset = queryset.limit_link_row_items_per_cell(
+            settings.BASEROW_LINK_ROW_LISTING_ITEMS_PER_CELL_LIMIT
+        )
         paginator = GalleryLimitOffsetPagination()
         page = paginator.paginate_queryset(queryset, request, self)
 
@@ -1,5 +1,7 @@
 from decimal import Decimal
 
+from django.conf import settings
+
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from rest_framework.pagination import LimitOffsetPagination
@@ -15,11 +17,16 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
-from baserow.contrib.database.api.constants import SEARCH_MODE_API_PARAM
+from baserow.contrib.database.api.constants import (
+    COUNT_MODE_API_PARAM,
+    CURSOR_API_PARAM,
+    INCLUDE_COUNT_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FIELD_NOT_IN_TABLE,
@@ -47,7 +54,10 @@ from baserow.contrib.database.api.views.serializers import (
     FieldOptionsField,
     validate_api_grouped_filters,
 )
-from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
+from baserow.contrib.database.api.views.utils import (
+    get_public_view_authorization_token,
+    get_view_rows_count_response_data,
+)
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FieldNotInTable,
@@ -191,14 +201,17 @@ class GridViewView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
+            CURSOR_API_PARAM,
+            INCLUDE_COUNT_API_PARAM,
         ],
         tags=["Database table grid view"],
         operation_id="list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
@@ -224,7 +237,7 @@ class GridViewView(APIView):
                 },
                 serializer_name="PaginationSerializerWithGridViewFieldOptions",
             ),
-            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
+            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP", "ERROR_INVALID_CURSOR"]),
             404: get_error_schema(
                 ["ERROR_GRID_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
             ),
@@ -241,9 +254,10 @@ class GridViewView(APIView):
     @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
     def get(self, request, view_id, field_options, row_metadata, query_params):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the cursor get parameter is provided the keyset pagination will be
+        used, if the limit get parameter is provided the limit/offset pagination will be
+        used else the page number pagination.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
@@ -275,18 +289,30 @@ class GridViewView(APIView):
             view.table, include_fields, exclude_fields
         )
 
+        search = query_params.get("search")
+        search_mode = query_params.get("search_mode")
+
         model = view.table.get_model()
         queryset = view_handler.get_queryset(
             view,
-            search=query_params.get("search"),
-            search_mode=query_params.get("search_mode"),
+            search=search,
+            search_mode=search_mode,
             model=model,
         )
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            return Response(
+                get_view_rows_count_response_data(
+                    request, view, queryset, search, search_mode
+                )
+            )
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        queryset = queryset.limit_link_row_items_per_cell(
+            settings.BASEROW_LINK_ROW_LISTING_ITEMS_PER_CELL_LIMIT
+        )
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
@@ -750,14 +776,17 @@ class PublicGridViewRowsView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
+            CURSOR_API_PARAM,
+            INCLUDE_COUNT_API_PARAM,
         ],
         tags=["Database table grid view"],
         operation_id="public_list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
@@ -785,6 +814,7 @@ class PublicGridViewRowsView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
                 ]
             ),
             401: get_error_schema(["ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW"]),
@@ -812,9 +842,10 @@ class PublicGridViewRowsView(APIView):
         self, request: Request, slug: str, field_options: bool, query_params
     ) -> Response:
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the cursor get parameter is provided the keyset pagination will be
+        used, if the limit get parameter is provided the limit/offset pagination will be
+        used else the page number pagination.
 
         Optionally the field options can also be included in the response if the the
         `field_options` are provided in the include GET parameter.
@@ -869,9 +900,18 @@ class PublicGridViewRowsView(APIView):
         )
 
         if count:
-            return Response({"count": queryset.count()})
+            return Response(
+                get_view_rows_count_response_data(
+                    request, view, queryset, search, search_mode
+                )
+            )
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        queryset = queryset.limit_link_row_items_per_cell(
+            settings.BASEROW_LINK_ROW_LISTING_ITEMS_PER_CELL_LIMIT
+        )
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
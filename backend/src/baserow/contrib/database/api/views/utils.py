@@ -1,9 +1,15 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from django.conf import settings
+from django.db.models import QuerySet
 
 from rest_framework.request import Request
 
+from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.models import View
+
+COUNT_MODE_ESTIMATE = "estimate"
+
 
 def get_public_view_authorization_token(request: Request) -> Optional[str]:
     """
@@ -19,3 +25,33 @@ def get_public_view_authorization_token(request: Request) -> Optional[str]:
     except (AttributeError, ValueError):
         return None
     return token
+
+
+def get_view_rows_count_response_data(
+    request: Request,
+    view: View,
+    queryset: QuerySet,
+    search: Optional[str] = None,
+    search_mode: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Counts the rows of the queryset of the view and returns the response data of
+    the `count` query parameter of the list rows endpoints. If the `count_mode`
+    query parameter is `estimate`, the count of large tables can be an estimate,
+    which is indicated by the `is_estimate` flag.
+
+    :param request: The request containing the query parameters.
+    :param view: The view that the queryset belongs to.
+    :param queryset: The filtered and searched queryset of the view.
+    :param search: The search term applied to the queryset.
+    :param search_mode: The search mode applied to the queryset.
+    :return: The response data containing the count.
+    """
+
+    estimate = request.GET.get("count_mode") == COUNT_MODE_ESTIMATE
+    count, is_estimate = ViewHandler().get_queryset_row_count(
+        view, queryset, estimate=estimate, search=search, search_mode=search_mode
+    )
+    if not estimate:
+        return {"count": count}
+    return {"count": count, "is_estimate": is_estimate}
@@ -1,21 +1,30 @@
+import hashlib
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
 from django.core.management.color import no_style
-from django.db import connection, models
+from django.db import connection, models, transaction
 from django.db.transaction import Atomic
 from django.urls import include, path
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
+from psycopg2 import sql
+
 from baserow.contrib.database.api.serializers import DatabaseSerializer
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
 )
 from baserow.contrib.database.fields.field_cache import FieldCache
+from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.table.handler import TableHandler
@@ -29,12 +38,17 @@ from baserow.core.registries import (
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import ChildProgressBuilder, grouper
 
-from .constants import IMPORT_SERIALIZED_IMPORTING, IMPORT_SERIALIZED_IMPORTING_TABLE
+from .constants import (
+    EXPORT_SERIALIZED_ROWS_CHUNK_SIZE,
+    IMPORT_SERIALIZED_IMPORTING,
+    IMPORT_SERIALIZED_IMPORTING_TABLE,
+)
 from .db.atomic import read_repeatable_single_database_atomic_transaction
 from .export_serialized import DatabaseExportSerializedStructure
 from .fields.deferred_field_fk_updater import DeferredFieldFkUpdater
 from .search.handler import SearchHandler
-from .table.models import Table
+from .table.constants import ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME
+from .table.models import GeneratedTableModel, Table
 
 
 class DatabaseApplicationType(ApplicationType):
@@ -80,6 +94,9 @@ class DatabaseApplicationType(ApplicationType):
         """
 
         serialized_tables: List[Dict[str, Any]] = []
+        # The rows exported by chunks are exported after the structure of all the
+        # tables, so that the tables can be exported concurrently.
+        row_chunks_exports = []
         for table in tables:
             fields = table.field_set.all()
             serialized_fields = []
@@ -102,20 +119,21 @@ class DatabaseApplicationType(ApplicationType):
 
             model = table.get_model(fields=fields, add_dependencies=False)
             serialized_rows = []
-            for row in model.objects.all():
-                serialized_row = DatabaseExportSerializedStructure.row(
-                    id=row.id,
-                    order=str(row.order),
-                    created_on=row.created_on.isoformat(),
-                    updated_on=row.updated_on.isoformat(),
-                )
-                for field_object in model._field_objects.values():
-                    field_name = field_object["name"]
-                    field_type = field_object["type"]
-                    serialized_row[field_name] = field_type.get_export_serialized_value(
-                        row, field_name, table_cache, files_zip, storage
+            # The rows are not exported if they're copied from this table with SQL
+            # when importing.
+            export_rows = not import_export_config.copy_rows_in_database
+            export_row_chunks = (
+                export_rows
+                and import_export_config.export_rows_in_chunks
+                and files_zip is not None
+            )
+            if export_rows and not export_row_chunks:
+                serialized_rows = [
+                    self._export_serialized_row(
+                        model, row, table_cache, files_zip, storage
                     )
-                serialized_rows.append(serialized_row)
+                    for row in model.objects.all()
+                ]
 
             structure = DatabaseExportSerializedStructure.table(
                 id=table.id,
@@ -125,6 +143,10 @@ class DatabaseApplicationType(ApplicationType):
                 views=serialized_views,
                 rows=serialized_rows,
             )
+            if import_export_config.copy_rows_in_database:
+                structure["rows_source_table_id"] = table.id
+            if export_row_chunks:
+                row_chunks_exports.append((table, model, table_cache, structure))
 
             for serialized_structure in serialization_processor_registry.get_all():
                 extra_data = serialized_structure.export_serialized(
@@ -133,8 +155,185 @@ class DatabaseApplicationType(ApplicationType):
                 if extra_data is not None:
                     structure.update(**extra_data)
             serialized_tables.append(structure)
+
+        if row_chunks_exports:
+            self._export_tables_row_chunks(row_chunks_exports, files_zip, storage)
+
         return serialized_tables
 
+    def _export_tables_row_chunks(
+        self,
+        row_chunks_exports: List[
+            Tuple[Table, Type[GeneratedTableModel], Dict[str, Any], Dict[str, Any]]
+        ],
+        files_zip: ZipFile,
+        storage: Optional[Storage] = None,
+    ):
+        """
+        Exports the rows of the provided tables by chunks into the zip file, and adds
+        the chunks to the serialized structure of every table.
+
+        If there are multiple tables and the export runs inside a transaction, up to
+        `BASEROW_EXPORT_TABLE_ROWS_MAX_WORKERS` tables are exported concurrently.
+        Every thread reads the rows in its own transaction that imports the snapshot
+        of the current transaction, so that all the rows are read from the same
+        consistent snapshot. If the transaction has already written anything, the
+        tables are exported sequentially, because those changes are not visible to
+        the threads.
+
+        :param row_chunks_exports: A list of (table, model, table cache, serialized
+            structure) for every table of which the rows must be exported.
+        :param files_zip: The zip file where the chunks must be written to.
+        :param storage: The storage where the user files can be loaded from.
+        """
+
+        max_workers = min(
+            settings.BASEROW_EXPORT_TABLE_ROWS_MAX_WORKERS, len(row_chunks_exports)
+        )
+        snapshot_id = None
+        if max_workers > 1 and connection.in_atomic_block:
+            with connection.cursor() as cursor:
+                # A transaction id is only assigned once the transaction writes.
+                cursor.execute("SELECT txid_current_if_assigned()")
+                if cursor.fetchone()[0] is None:
+                    cursor.execute("SELECT pg_export_snapshot()")
+                    snapshot_id = cursor.fetchone()[0]
+
+        if snapshot_id is None:
+            for table, model, table_cache, structure in row_chunks_exports:
+                structure["row_chunks"] = self._export_serialized_row_chunks(
+                    table, model, table_cache, files_zip, storage
+                )
+            return
+
+        locked_files_zip = LockedZipFile(files_zip)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._export_serialized_row_chunks_in_snapshot,
+                    snapshot_id,
+                    table,
+                    model,
+                    table_cache,
+                    locked_files_zip,
+                    storage,
+                )
+                for table, model, table_cache, _ in row_chunks_exports
+            ]
+
+        for row_chunks_export, future in zip(row_chunks_exports, futures):
+            structure = row_chunks_export[3]
+            structure["row_chunks"] = future.result()
+
+    def _export_serialized_row_chunks_in_snapshot(
+        self,
+        snapshot_id: str,
+        table: Table,
+        model: Type[GeneratedTableModel],
+        table_cache: Dict[str, Any],
+        files_zip: "LockedZipFile",
+        storage: Optional[Storage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Exports the rows of the table by chunks in a new transaction that imports
+        the provided snapshot. This must be called from a separate thread, because
+        the database connection of the thread is closed afterwards.
+        """
+
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                    cursor.execute("SET TRANSACTION SNAPSHOT %s", [snapshot_id])
+                return self._export_serialized_row_chunks(
+                    table, model, table_cache, files_zip, storage
+                )
+        finally:
+            connection.close()
+
+    def _export_serialized_row(
+        self,
+        model: Type[GeneratedTableModel],
+        row: GeneratedTableModel,
+        table_cache: Dict[str, Any],
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ) -> Dict[str, Any]:
+        serialized_row = DatabaseExportSerializedStructure.row(
+            id=row.id,
+            order=str(row.order),
+            created_on=row.created_on.isoformat(),
+            updated_on=row.updated_on.isoformat(),
+        )
+        for field_object in model._field_objects.values():
+            field_name = field_object["name"]
+            field_type = field_object["type"]
+            serialized_row[field_name] = field_type.get_export_serialized_value(
+                row, field_name, table_cache, files_zip, storage
+            )
+        return serialized_row
+
+    def _export_serialized_row_chunks(
+        self,
+        table: Table,
+        model: Type[GeneratedTableModel],
+        table_cache: Dict[str, Any],
+        files_zip: ZipFile,
+        storage: Optional[Storage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Exports the rows of the table into the zip file by chunks of
+        `EXPORT_SERIALIZED_ROWS_CHUNK_SIZE` rows. Every chunk is a separate file
+        containing one JSON serialized row per line, so that the rows never have to
+        be all in memory, neither when exporting nor when importing.
+
+        :return: The serialized chunks containing the name of the file in the zip,
+            the number of rows and the hash of the content.
+        """
+
+        row_chunks = []
+        chunk_size = EXPORT_SERIALIZED_ROWS_CHUNK_SIZE
+        rows = model.objects.all().iterator(chunk_size=chunk_size)
+        for index, chunk in enumerate(grouper(chunk_size, rows)):
+            content = "".join(
+                json.dumps(
+                    self._export_serialized_row(
+                        model, row, table_cache, files_zip, storage
+                    )
+                )
+                + "\n"
+                for row in chunk
+            ).encode("utf-8")
+            name = f"database_rows/table_{table.id}_{index}.jsonl"
+            files_zip.writestr(name, content)
+            row_chunks.append(
+                DatabaseExportSerializedStructure.row_chunk(
+                    name=name,
+                    count=len(chunk),
+                    sha256=hashlib.sha256(content).hexdigest(),
+                )
+            )
+        return row_chunks
+
+    def _iterate_serialized_rows(
+        self, serialized_table: Dict[str, Any], files_zip: Optional[ZipFile] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the serialized rows of the table, whether they're in the serialized
+        table or in chunk files in the zip file. Only one chunk is read at a time.
+        """
+
+        yield from serialized_table["rows"]
+        for row_chunk in serialized_table.get("row_chunks", []):
+            with files_zip.open(row_chunk["name"]) as chunk_file:
+                for line in io.TextIOWrapper(chunk_file, encoding="utf-8"):
+                    yield json.loads(line)
+
+    def _get_serialized_row_count(self, serialized_table: Dict[str, Any]) -> int:
+        return len(serialized_table["rows"]) + sum(
+            row_chunk["count"] for row_chunk in serialized_table.get("row_chunks", [])
+        )
+
     def export_serialized(
         self,
         database: Database,
@@ -188,9 +387,9 @@ class DatabaseApplicationType(ApplicationType):
                     # Inserting every field
                     len(table["views"]) +
                     # Converting every row
-                    len(table["rows"]) +
+                    self._get_serialized_row_count(table) +
                     # Inserting every row
-                    len(table["rows"]) +
+                    self._get_serialized_row_count(table) +
                     # After each field
                     len(table["fields"])
                     for table in serialized_tables
@@ -393,9 +592,16 @@ class DatabaseApplicationType(ApplicationType):
         # so we keep track of m2m/through tables we've already inserted all the data
         # for.
         already_filled_up_through_table_names = set()
+        m2m_fields_to_copy_in_database = []
         for serialized_table in serialized_tables:
             table_model = serialized_table["_model"]
-            rows_to_be_inserted = []
+
+            if "rows_source_table_id" in serialized_table:
+                m2m_fields_to_copy_in_database += self._copy_rows_in_database(
+                    serialized_table, id_mapping
+                )
+                self._reset_table_sequence(table_model)
+                continue
 
             m2m_fields_to_not_import_as_already_done = set()
             for field in table_model._meta.get_fields():
@@ -407,69 +613,78 @@ class DatabaseApplicationType(ApplicationType):
                     else:
                         already_filled_up_through_table_names.add(db_table)
 
-            for serialized_row in serialized_table["rows"]:
-                created_on = serialized_row.get("created_on")
-                updated_on = serialized_row.get("updated_on")
-
-                if created_on:
-                    created_on = datetime.fromisoformat(created_on)
-                else:
-                    created_on = timezone.now()
-
-                if updated_on:
-                    updated_on = datetime.fromisoformat(updated_on)
-                else:
-                    updated_on = timezone.now()
-
-                row_instance = table_model(
-                    id=serialized_row["id"],
-                    order=serialized_row["order"],
-                    created_on=created_on,
-                    updated_on=updated_on,
-                )
+            # The rows are converted and inserted by chunks, because there could
+            # potentially be hundreds of thousands of rows in there, which don't
+            # necessarily fit in memory.
+            serialized_rows = self._iterate_serialized_rows(serialized_table, files_zip)
+            for serialized_rows_chunk in grouper(512, serialized_rows):
+                rows_to_be_inserted = []
+                for serialized_row in serialized_rows_chunk:
+                    created_on = serialized_row.get("created_on")
+                    updated_on = serialized_row.get("updated_on")
+
+                    if created_on:
+                        created_on = datetime.fromisoformat(created_on)
+                    else:
+                        created_on = timezone.now()
 
-                for serialized_field in serialized_table["fields"]:
-                    field_type = field_type_registry.get(serialized_field["type"])
-                    new_field_id = id_mapping["database_fields"][serialized_field["id"]]
-                    new_field_name = f"field_{new_field_id}"
-                    field_name = f'field_{serialized_field["id"]}'
-
-                    if (
-                        field_name in serialized_row
-                        and new_field_name
-                        not in m2m_fields_to_not_import_as_already_done
-                    ):
-                        field_type.set_import_serialized_value(
-                            row_instance,
-                            new_field_name,
-                            serialized_row[field_name],
-                            id_mapping,
-                            table_cache,
-                            files_zip,
-                            storage,
-                        )
-
-                rows_to_be_inserted.append(row_instance)
-                progress.increment(
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}"
-                )
+                    if updated_on:
+                        updated_on = datetime.fromisoformat(updated_on)
+                    else:
+                        updated_on = timezone.now()
+
+                    row_instance = table_model(
+                        id=serialized_row["id"],
+                        order=serialized_row["order"],
+                        created_on=created_on,
+                        updated_on=updated_on,
+                    )
+
+                    for serialized_field in serialized_table["fields"]:
+                        field_type = field_type_registry.get(serialized_field["type"])
+                        new_field_id = id_mapping["database_fields"][
+                            serialized_field["id"]
+                        ]
+                        new_field_name = f"field_{new_field_id}"
+                        field_name = f'field_{serialized_field["id"]}'
+
+                        if (
+                            field_name in serialized_row
+                            and new_field_name
+                            not in m2m_fields_to_not_import_as_already_done
+                        ):
+                            field_type.set_import_serialized_value(
+                                row_instance,
+                                new_field_name,
+                                serialized_row[field_name],
+                                id_mapping,
+                                table_cache,
+                                files_zip,
+                                storage,
+                            )
+
+                    rows_to_be_inserted.append(row_instance)
+                    progress.increment(
+                        state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}"
+                        f"{serialized_table['id']}"
+                    )
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                table_model.objects.bulk_create(chunk, batch_size=512)
+                # We want to insert the rows in bulk because this will result in
+                # better performance.
+                table_model.objects.bulk_create(rows_to_be_inserted, batch_size=512)
                 progress.increment(
-                    len(chunk),
+                    len(rows_to_be_inserted),
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}",
                 )
 
-            # When the rows are inserted we keep the provide the old ids and because of
-            # that the auto increment is still set at `1`. This needs to be set to the
-            # maximum value because otherwise creating a new row could later fail.
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [table_model])
-            with connection.cursor() as cursor:
-                cursor.execute(sequence_sql[0])
+            self._reset_table_sequence(table_model)
+
+        # The relations can only be copied after the rows of all the tables exist.
+        self._copy_m2m_relations_in_database(
+            m2m_fields_to_copy_in_database,
+            id_mapping,
+            already_filled_up_through_table_names,
+        )
 
         # The progress off `apply_updates_and_get_updated_fields` takes 5% of the
         # total progress of this import.
@@ -500,6 +715,144 @@ class DatabaseApplicationType(ApplicationType):
 
         return imported_tables
 
+    def _reset_table_sequence(self, table_model: Type[GeneratedTableModel]):
+        # When the rows are inserted we keep the provide the old ids and because of
+        # that the auto increment is still set at `1`. This needs to be set to the
+        # maximum value because otherwise creating a new row could later fail.
+        sequence_sql = connection.ops.sequence_reset_sql(no_style(), [table_model])
+        with connection.cursor() as cursor:
+            cursor.execute(sequence_sql[0])
+
+    def _copy_rows_in_database(
+        self, serialized_table: Dict[str, Any], id_mapping: Dict[str, Any]
+    ) -> List[Tuple[models.ManyToManyField, models.ManyToManyField, Field]]:
+        """
+        Copies the rows of the table the serialized table has been exported from into
+        the newly created table with one `INSERT ... SELECT` query. The row ids are
+        kept, and the values of the fields are converted in SQL by the field types.
+        Trashed rows are not copied, like with the serialized export.
+
+        :param serialized_table: The serialized table that has been exported with the
+            `copy_rows_in_database` import export config.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :return: The many to many model fields of the source and new table, and the
+            new field, whose relations must be copied after all the rows exist.
+        """
+
+        table_model = serialized_table["_model"]
+        source_model = Table.objects.get(
+            id=serialized_table["rows_source_table_id"]
+        ).get_model(add_dependencies=False)
+
+        columns = ["id", "order", "created_on", "updated_on"]
+        values = [sql.Identifier("source", column) for column in columns]
+        # These columns don't have a default value in the database. Only the rows
+        # that are not trashed are copied, and they're all marked as needing a
+        # background update, so that their search data is computed again.
+        columns += ["trashed", ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME]
+        values += [sql.Literal(False), sql.Literal(True)]
+        m2m_fields = []
+        for serialized_field in serialized_table["fields"]:
+            new_field_id = id_mapping["database_fields"][serialized_field["id"]]
+            field_object = table_model._field_objects[new_field_id]
+            model_field = table_model._meta.get_field(field_object["name"])
+            source_model_field = source_model._meta.get_field(
+                f'field_{serialized_field["id"]}'
+            )
+
+            if isinstance(model_field, models.ManyToManyField):
+                m2m_fields.append(
+                    (source_model_field, model_field, field_object["field"])
+                )
+                continue
+
+            columns.append(model_field.column)
+            values.append(
+                field_object["type"].get_in_database_copy_value_sql(
+                    field_object["field"],
+                    sql.Identifier("source", source_model_field.column),
+                    id_mapping,
+                )
+            )
+
+        query = sql.SQL(
+            """
+            INSERT INTO {table} ({columns})
+            SELECT {values} FROM {source_table} source
+            WHERE NOT source.trashed
+            """
+        ).format(
+            table=sql.Identifier(table_model._meta.db_table),
+            columns=sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+            values=sql.SQL(", ").join(values),
+            source_table=sql.Identifier(source_model._meta.db_table),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(query)
+
+        return m2m_fields
+
+    def _copy_m2m_relations_in_database(
+        self,
+        m2m_fields: List[Tuple[models.ManyToManyField, models.ManyToManyField, Field]],
+        id_mapping: Dict[str, Any],
+        already_filled_up_through_table_names: Set[str],
+    ):
+        """
+        Copies the relations of the provided many to many fields from the through
+        tables of the source tables into the through tables of the new tables. Only
+        relations between rows that have been copied are kept.
+
+        :param m2m_fields: The many to many model fields of the source and new table,
+            and the new field as returned by `_copy_rows_in_database`.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :param already_filled_up_through_table_names: The names of the through tables
+            that have already been filled, because related fields share the same
+            through table.
+        """
+
+        for source_model_field, model_field, field in m2m_fields:
+            through_table = model_field.remote_field.through._meta.db_table
+            if through_table in already_filled_up_through_table_names:
+                continue
+            already_filled_up_through_table_names.add(through_table)
+
+            field_type = field_type_registry.get_by_model(field)
+            related_model = model_field.remote_field.model
+            query = sql.SQL(
+                """
+                INSERT INTO {through_table} ({row_column}, {related_column})
+                SELECT row_id, related_id FROM (
+                    SELECT
+                        source.id,
+                        source.{source_row_column} AS row_id,
+                        {related_id} AS related_id
+                    FROM {source_through_table} source
+                ) relations
+                WHERE row_id IN (SELECT id FROM {table})
+                    AND related_id IN (SELECT {related_pk} FROM {related_table})
+                ORDER BY id
+                """
+            ).format(
+                through_table=sql.Identifier(through_table),
+                row_column=sql.Identifier(model_field.m2m_column_name()),
+                related_column=sql.Identifier(model_field.m2m_reverse_name()),
+                source_row_column=sql.Identifier(source_model_field.m2m_column_name()),
+                related_id=field_type.get_in_database_copy_value_sql(
+                    field,
+                    sql.Identifier("source", source_model_field.m2m_reverse_name()),
+                    id_mapping,
+                ),
+                source_through_table=sql.Identifier(
+                    source_model_field.remote_field.through._meta.db_table
+                ),
+                table=sql.Identifier(model_field.model._meta.db_table),
+                related_pk=sql.Identifier(related_model._meta.pk.column),
+                related_table=sql.Identifier(related_model._meta.db_table),
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(query)
+
     def import_serialized(
         self,
         workspace: Workspace,
@@ -548,3 +901,26 @@ class DatabaseApplicationType(ApplicationType):
 
     def enhance_queryset(self, queryset):
         return queryset.prefetch_related("table_set")
+
+
+class LockedZipFile:
+    """
+    Wraps a zip file so that multiple threads can write to it. Writing a file
+    that's already in the zip file is ignored, because concurrent threads can both
+    find out that a user file is missing and write it.
+    """
+
+    def __init__(self, files_zip: ZipFile):
+        self.files_zip = files_zip
+        self.lock = threading.Lock()
+        self.names = set(files_zip.namelist())
+
+    def namelist(self) -> List[str]:
+        with self.lock:
+            return self.files_zip.namelist()
+
+    def writestr(self, name: str, data: Any):
+        with self.lock:
+            if name not in self.names:
+                self.files_zip.writestr(name, data)
+                self.names.add(name)
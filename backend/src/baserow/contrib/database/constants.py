@@ -1,2 +1,4 @@
 IMPORT_SERIALIZED_IMPORTING = "importing"
 IMPORT_SERIALIZED_IMPORTING_TABLE = "importing-table-"
+# The number of rows per chunk file when the rows are exported into the zip file.
+EXPORT_SERIALIZED_ROWS_CHUNK_SIZE = 1000
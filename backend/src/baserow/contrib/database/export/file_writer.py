@@ -2,7 +2,6 @@ import abc
 import time
 from typing import Any, Callable
 
-from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
 import unicodecsv as csv
@@ -11,6 +10,7 @@ from baserow.contrib.database.export.exceptions import ExportJobCanceledExceptio
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import get_estimated_row_count, keyset_iterator
 
 
 class FileWriter(abc.ABC):
@@ -61,12 +61,15 @@ class FileWriter(abc.ABC):
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Streams querysets to files in a memory efficient manner by fetching the rows in
+    keyset batches, so that fetching a batch deep into a large table is as fast as
+    fetching the first one and no long-running transaction is needed. Also updates
+    the provided job as it progresses through any queryset writes every
+    EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    BATCH_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -94,16 +97,40 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.last_check = time.perf_counter()
-        paginator = Paginator(queryset.all(), 2000)
+        estimated_total_rows = self._estimate_row_count(queryset)
+
         i = 0
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+        previous_row = None
+        for row in keyset_iterator(queryset.all(), self.BATCH_SIZE):
+            # The row is written one iteration later because we can only know
+            # whether a row is the last one after trying to fetch the next one.
+            if previous_row is not None:
                 i = i + 1
-                is_last_row = i == paginator.count
-                write_row(row, is_last_row)
-                self._check_and_update_job(i, paginator.count)
+                write_row(previous_row, False)
+                self._check_and_update_job(i, estimated_total_rows)
+            previous_row = row
+
+        if previous_row is not None:
+            write_row(previous_row, True)
+            self._check_and_update_job(i + 1, estimated_total_rows, is_last_row=True)
+
+    def _estimate_row_count(self, queryset: QuerySet) -> int:
+        """
+        Estimates the number of rows that are going to be written, which is only
+        used to update the progress of the job. The planner statistics of the table
+        are used because an exact count requires a full scan of the table. If the
+        table has not been analyzed yet, we fall back on the exact count.
+
+        :param queryset: The queryset that's going to be written.
+        :return: The estimated number of rows.
+        """
+
+        estimate = get_estimated_row_count(queryset.model)
+        if estimate <= 0:
+            estimate = queryset.order_by().count()
+        return estimate
 
-    def _check_and_update_job(self, current_row, total_rows):
+    def _check_and_update_job(self, current_row, total_rows, is_last_row=False):
         """
         Checks if enough time has passed and if so checks the state of the job and
         updates its progress percentage.
@@ -112,7 +139,9 @@ class PaginatedExportJobFileWriter(FileWriter):
 
         :param current_row: An int indicating the current row this export job has
             exported upto
-        :param total_rows: An int of the total number of rows this job is exporting.
+        :param total_rows: An int of the estimated total number of rows this job is
+            exporting. This can be lower or higher than the real number.
+        :param is_last_row: Indicates whether the current row is the last one.
         """
 
         current_time = time.perf_counter()
@@ -121,14 +150,20 @@ class PaginatedExportJobFileWriter(FileWriter):
         enough_time_has_passed = (
             current_time - self.last_check > self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS
         )
-        is_last_row = current_row == total_rows
         if enough_time_has_passed or is_last_row:
             self.last_check = time.perf_counter()
             self.job.refresh_from_db()
             if self.job.is_cancelled_or_expired():
                 raise ExportJobCanceledException()
             else:
-                self.job.progress_percentage = current_row / total_rows * 100
+                if is_last_row:
+                    self.job.progress_percentage = 100.0
+                else:
+                    # Because the total is an estimate, the progress must never
+                    # reach 100% before the last row has been written.
+                    self.job.progress_percentage = min(
+                        current_row / max(total_rows, 1) * 100, 99.0
+                    )
                 self.job.save()
 
 
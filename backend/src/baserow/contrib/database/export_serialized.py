@@ -23,6 +23,14 @@ class DatabaseExportSerializedStructure:
             "updated_on": updated_on,
         }
 
+    @staticmethod
+    def row_chunk(name, count, sha256):
+        return {
+            "name": name,
+            "count": count,
+            "sha256": sha256,
+        }
+
     @staticmethod
     def file_field_value(name, visible_name, original_name):
         return {
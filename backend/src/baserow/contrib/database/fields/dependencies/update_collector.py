@@ -1,11 +1,16 @@
 from collections import defaultdict
+from functools import reduce
 from typing import Dict, List, NamedTuple, Optional, Set, Tuple, cast
 
-from django.db.models import Expression, Q, Value
+from django.db.models import BooleanField, Expression, F, Q, Value
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.signals import field_updated
+from baserow.contrib.database.formula.expression_generator.django_expressions import (
+    IsDistinctFromExpr,
+    OrExpr,
+)
 from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
@@ -22,6 +27,7 @@ class PathBasedUpdateStatementCollector:
         table: Table,
         connection_here: Optional[LinkRowField],
         connection_is_broken: bool,
+        only_update_changed_values: bool = False,
     ):
         """
         Collects updates statements for a particular table and then can execute them
@@ -31,6 +37,8 @@ class PathBasedUpdateStatementCollector:
         :param table: The table this collector is holding updates for.
         :param connection_here: The link row field that was used to connect this
             collector to its parent collector, if it has one.
+        :param only_update_changed_values: If True, only the rows where at least one
+            of the updated cells gets a different value are rewritten.
         """
 
         self.update_statements: Dict[str, Expression] = {}
@@ -38,6 +46,7 @@ class PathBasedUpdateStatementCollector:
         self.sub_paths: Dict[str, PathBasedUpdateStatementCollector] = {}
         self.connection_here: Optional[LinkRowField] = connection_here
         self.connection_is_broken = connection_is_broken
+        self.only_update_changed_values = only_update_changed_values
 
     def add_update_statement(
         self,
@@ -90,6 +99,7 @@ class PathBasedUpdateStatementCollector:
                     next_via_field_link.table,
                     next_via_field_link,
                     connection_is_broken=self.connection_is_broken,
+                    only_update_changed_values=self.only_update_changed_values,
                 )
             self.sub_paths[
                 next_link_db_column
@@ -107,7 +117,10 @@ class PathBasedUpdateStatementCollector:
         broken_name = f"broken_connection_to_table_{field.table_id}"
         if broken_name not in self.sub_paths:
             collector = PathBasedUpdateStatementCollector(
-                field.table, None, connection_is_broken=True
+                field.table,
+                None,
+                connection_is_broken=True,
+                only_update_changed_values=self.only_update_changed_values,
             )
             self.sub_paths[broken_name] = collector
         else:
@@ -120,11 +133,18 @@ class PathBasedUpdateStatementCollector:
         starting_row_ids: StartingRowIdsType = None,
         path_to_starting_table: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
-    ):
+    ) -> int:
+        """
+        Executes the update statements of this collector and then the ones of the
+        connected collectors.
+
+        :return: The total number of rows updated.
+        """
+
         path_to_starting_table = path_to_starting_table or []
         if self.connection_here is not None:
             path_to_starting_table = [self.connection_here] + path_to_starting_table
-        self._execute_pending_update_statements(
+        updated_rows_count = self._execute_pending_update_statements(
             field_cache,
             path_to_starting_table,
             starting_row_ids,
@@ -132,12 +152,13 @@ class PathBasedUpdateStatementCollector:
         )
 
         for sub_path in self.sub_paths.values():
-            sub_path.execute_all(
+            updated_rows_count += sub_path.execute_all(
                 starting_row_ids=starting_row_ids,
                 path_to_starting_table=path_to_starting_table,
                 field_cache=field_cache,
                 deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
             )
+        return updated_rows_count
 
     def _execute_pending_update_statements(
         self,
@@ -145,7 +166,7 @@ class PathBasedUpdateStatementCollector:
         path_to_starting_table: List[LinkRowField],
         starting_row_ids: StartingRowIdsType,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
-    ):
+    ) -> int:
         model = field_cache.get_model(self.table)
         qs = model.objects_and_trash
         # If the connection is broken back to the starting table then there is no
@@ -167,11 +188,36 @@ class PathBasedUpdateStatementCollector:
             )
 
             qs = qs.filter(filter_for_rows_connected_to_starting_row)
-        if starting_row_ids is None:
+        if self.only_update_changed_values:
+            qs = self._filter_rows_with_changed_values(qs)
+        elif starting_row_ids is None:
             # We aren't updating individual rows but instead entire columns, so don't
             # set this per row attribute.
             self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
-        qs.update(**self.update_statements)
+        return qs.update(**self.update_statements)
+
+    def _filter_rows_with_changed_values(self, qs):
+        """
+        Filters the queryset to only the rows where at least one of the update
+        statements results in a different value than the one already stored. This
+        avoids rewriting rows, and so creating dead tuples, when nothing changes.
+        The per row background update attribute is kept, so that only the rewritten
+        rows get their search data updated.
+        """
+
+        changed_conditions = [
+            IsDistinctFromExpr(F(db_column), statement, output_field=BooleanField())
+            for db_column, statement in self.update_statements.items()
+            if db_column != ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME
+        ]
+        if not changed_conditions:
+            return qs
+        return qs.filter(
+            reduce(
+                lambda a, b: OrExpr(a, b, output_field=BooleanField()),
+                changed_conditions,
+            )
+        )
 
     def _include_rows_connected_to_deleted_m2m_relationships(
         self,
@@ -235,6 +281,7 @@ class FieldUpdateCollector:
         starting_table: Table,
         starting_row_ids: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+        only_update_changed_values: bool = False,
     ):
         """
 
@@ -242,6 +289,9 @@ class FieldUpdateCollector:
         :param starting_row_ids: If the update starts from specific rows in the
             starting table set this and all update statements executed by this collector
             will only update rows which join back to these starting rows.
+        :param only_update_changed_values: If True, the update statements only
+            rewrite the rows where the new value is distinct from the stored one. The
+            search data is then only updated for those rows.
         """
 
         self._updated_fields_per_table: Dict[
@@ -251,9 +301,14 @@ class FieldUpdateCollector:
         self._starting_row_ids = starting_row_ids
         self._starting_table = starting_table
         self._deleted_m2m_rels_per_link_field = deleted_m2m_rels_per_link_field
+        self._only_update_changed_values = only_update_changed_values
+        self.updated_rows_count = 0
 
         self._update_statement_collector = PathBasedUpdateStatementCollector(
-            self._starting_table, connection_here=None, connection_is_broken=False
+            self._starting_table,
+            connection_here=None,
+            connection_is_broken=False,
+            only_update_changed_values=only_update_changed_values,
         )
 
     def add_field_with_pending_update_statement(
@@ -322,20 +377,30 @@ class FieldUpdateCollector:
     ) -> List[Field]:
         """
         Triggers all update statements to be executed in the correct order in as few
-        update queries as possible.
+        update queries as possible. The number of updated rows is stored in
+        `self.updated_rows_count`.
         :return: The list of all fields which have been updated in the starting table.
         """
 
-        self._update_statement_collector.execute_all(
+        self.updated_rows_count += self._update_statement_collector.execute_all(
             field_cache,
             self._starting_row_ids,
             deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
         )
 
+        # Formulas and lookups that are recalculated here change the rows of the
+        # updated tables without sending any row signals.
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        ViewHandler().invalidate_exact_row_counts_on_commit(self._updated_tables.keys())
+
         if not skip_search_updates:
             for table in self._updated_tables.values():
                 if not self._starting_table or table.id != self._starting_table.id:
-                    if self._starting_row_ids is not None:
+                    if (
+                        self._starting_row_ids is not None
+                        or self._only_update_changed_values
+                    ):
                         # The cascade was only for some specific rows and not the
                         # entire field
                         SearchHandler.field_value_updated_or_created(
@@ -35,6 +35,7 @@ import pytz
 from dateutil import parser
 from dateutil.parser import ParserError
 from loguru import logger
+from psycopg2 import sql
 from pytz import timezone
 from rest_framework import serializers
 
@@ -139,6 +140,7 @@ from .fields import (
     SingleSelectForeignKey,
 )
 from .handler import FieldHandler
+from .link_row_prefetch import LinkRowMultipleFieldPrefetch
 from .models import (
     AbstractSelectOption,
     BooleanField,
@@ -1362,6 +1364,29 @@ class LinkRowFieldType(FieldType):
             models.Prefetch(name, queryset=related_queryset)
         )
 
+    def enhance_queryset_in_bulk(self, queryset, field_objects):
+        """
+        Prefetches the related rows of all the `link_row` fields together, so that
+        the number of queries doesn't grow with the number of fields.
+        """
+
+        link_row_prefetch = next(
+            (
+                prefetch
+                for prefetch in queryset.get_multi_field_prefetches()
+                if isinstance(prefetch, LinkRowMultipleFieldPrefetch)
+            ),
+            None,
+        )
+        if not link_row_prefetch:
+            link_row_prefetch = LinkRowMultipleFieldPrefetch()
+            queryset = queryset.multi_field_prefetch(link_row_prefetch)
+
+        link_row_prefetch.add_field_names(
+            [field_object["name"] for field_object in field_objects]
+        )
+        return queryset
+
     def prepare_value_for_db(self, instance, value):
         return self.prepare_value_for_db_in_bulk(
             instance, {0: value}, continue_on_error=False
@@ -2706,6 +2731,25 @@ class SelectOptionBaseFieldType(FieldType):
 
         return queryset
 
+    def get_in_database_copy_value_sql(self, field, value_sql, id_mapping):
+        # Maps the ids of the select options of the exported field to the ids of the
+        # newly created ones.
+        new_option_ids = set(field.select_options.values_list("id", flat=True))
+        mapping = {
+            old_id: new_id
+            for old_id, new_id in id_mapping.get(
+                "database_field_select_options", {}
+            ).items()
+            if new_id in new_option_ids
+        }
+        return sql.SQL(
+            "({new_ids}::int[])[array_position({old_ids}::int[], {value}::int)]"
+        ).format(
+            new_ids=sql.Literal(list(mapping.values())),
+            old_ids=sql.Literal(list(mapping.keys())),
+            value=value_sql,
+        )
+
 
 class SingleSelectFieldType(SelectOptionBaseFieldType):
     type = "single_select"
@@ -3708,7 +3752,7 @@ class FormulaFieldType(ReadOnlyFieldType):
         update_collector: "Optional[FieldUpdateCollector]" = None,
         field_cache: "Optional[FieldCache]" = None,
         via_path_to_starting_table: Optional[List[LinkRowField]] = None,
-    ):
+    ) -> Optional[int]:
         from baserow.contrib.database.fields.dependencies.update_collector import (
             FieldUpdateCollector,
         )
@@ -3717,9 +3761,12 @@ class FormulaFieldType(ReadOnlyFieldType):
 
         if update_collector is None:
             # We are the outermost call, and so we should send all the signals
-            # when we finish.
+            # when we finish. Most of the time a `now()` or `today()` refresh doesn't
+            # change the value of most rows, so only the changed rows are rewritten.
             should_send_signals_at_end = True
-            update_collector = FieldUpdateCollector(field.table)
+            update_collector = FieldUpdateCollector(
+                field.table, only_update_changed_values=True
+            )
 
         if field_cache is None:
             field_cache = FieldCache()
@@ -3744,8 +3791,10 @@ class FormulaFieldType(ReadOnlyFieldType):
 
         if should_send_signals_at_end:
             update_collector.apply_updates_and_get_updated_fields(field_cache)
-            SearchHandler().entire_field_values_changed_or_created(field.table, [field])
-            update_collector.send_force_refresh_signals_for_all_updated_tables()
+            if update_collector.updated_rows_count > 0:
+                SearchHandler().field_value_updated_or_created(field.table)
+                update_collector.send_force_refresh_signals_for_all_updated_tables()
+            return update_collector.updated_rows_count
 
     def row_of_dependency_updated(
         self,
@@ -0,0 +1,239 @@
+from collections import defaultdict
+from copy import copy
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection
+from django.db.models import ManyToManyField, Model, QuerySet
+from django.db.models.query import ModelIterable
+
+from psycopg2 import sql
+
+from baserow.core.db import ModelInstance
+
+# Maps a field name and a row id to the ordered ids of the related rows.
+RelatedIds = Dict[Tuple[str, int], List[int]]
+
+
+class LinkRowMultipleFieldPrefetch:
+    """
+    This prefetch class can be used as argument of the `multi_field_prefetch` method
+    of a table model queryset. It prefetches the related rows of all the provided
+    `link_row` field names at once. Regardless of the number of fields, the
+    relations in all through tables are fetched in one `UNION ALL` query. After that,
+    one query per related table is executed to fetch the primary values of the
+    related rows. Without this, every field would execute two queries.
+
+    Optionally, the number of related rows loaded per cell can be limited. This is
+    useful when listing many rows, because only the first related rows are shown.
+
+    Example:
+
+    results = list(
+        model.objects.all().multi_field_prefetch(
+            LinkRowMultipleFieldPrefetch(["field_1", "field_2"], limit_per_cell=10)
+        )
+    )
+
+    results[0].field_1.all()  # is prefetched
+    results[0].field_2.all()  # is prefetched
+    """
+
+    def __init__(
+        self,
+        field_names: Optional[Iterable[str]] = None,
+        limit_per_cell: Optional[int] = None,
+    ):
+        """
+        :param field_names: The names of the `link_row` fields that must be
+            prefetched.
+        :param limit_per_cell: If provided, at most this number of related rows is
+            prefetched for every field of every row.
+        """
+
+        self.field_names = set(field_names or [])
+        self.limit_per_cell = limit_per_cell
+
+    def add_field_names(self, field_names: Iterable[str]):
+        """
+        Adds additional field names to the prefetch.
+
+        :param field_names: The names of the fields that must be included in the
+            prefetch query.
+        :return: Self to allow chaining.
+        """
+
+        self.field_names.update(field_names)
+        return self
+
+    def with_limit_per_cell(
+        self, limit_per_cell: Optional[int]
+    ) -> "LinkRowMultipleFieldPrefetch":
+        """
+        Returns a copy of this prefetch that loads at most `limit_per_cell` related
+        rows per field of every row.
+
+        :param limit_per_cell: The maximum number of related rows per cell or None
+            to load all of them.
+        :return: The copied prefetch.
+        """
+
+        clone = copy(self)
+        clone.field_names = set(self.field_names)
+        clone.limit_per_cell = limit_per_cell
+        return clone
+
+    def __call__(self, queryset: QuerySet, result_set: List[ModelInstance]):
+        """
+        Called when the queryset is resolved. Fetches the related rows of all the
+        fields, and sets them as prefetched objects on the rows in the result set.
+
+        :param queryset: The queryset that is being resolved.
+        :param result_set: The fetched rows where the prefetched results must be
+            added to.
+        """
+
+        # The rows can't be enhanced if the queryset returns values instead of model
+        # instances.
+        if (
+            not self.field_names
+            or not result_set
+            or not issubclass(queryset._iterable_class, ModelIterable)
+        ):
+            return
+
+        model_fields = {
+            field_name: queryset.model._meta.get_field(field_name)
+            for field_name in sorted(self.field_names)
+        }
+        row_ids = [row.id for row in result_set]
+        related_ids = self.fetch_related_ids(model_fields, row_ids)
+        related_instances = self.fetch_related_instances(model_fields, related_ids)
+
+        for row in result_set:
+            prefetched_objects_cache = getattr(row, "_prefetched_objects_cache", {})
+            for field_name, model_field in model_fields.items():
+                instances = related_instances[model_field.remote_field.model]
+                related_queryset = getattr(row, field_name).get_queryset()
+                related_queryset._result_cache = [
+                    instances[related_id]
+                    for related_id in related_ids.get((field_name, row.id), [])
+                    if related_id in instances
+                ]
+                related_queryset._prefetch_done = True
+                prefetched_objects_cache[field_name] = related_queryset
+            row._prefetched_objects_cache = prefetched_objects_cache
+
+    def fetch_related_ids(
+        self, model_fields: Dict[str, ManyToManyField], row_ids: List[int]
+    ) -> RelatedIds:
+        """
+        Fetches the ids of the related rows of all the fields in one query. The
+        through tables are joined with the related tables to exclude trashed rows, and
+        to order the related rows in the same way as the related table.
+
+        :param model_fields: The many to many model fields by name.
+        :param row_ids: The ids of the rows for which the relations must be fetched.
+        :return: The ordered related row ids by field name and row id.
+        """
+
+        sub_queries = []
+        for field_name, model_field in model_fields.items():
+            through_table = model_field.remote_field.through._meta.db_table
+            related_table = model_field.remote_field.model._meta.db_table
+            sub_queries.append(
+                sql.SQL(
+                    """
+                    SELECT
+                        {field_name} AS field_name,
+                        through.{row_column} AS row_id,
+                        through.{related_column} AS related_id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY through.{row_column}
+                            ORDER BY related."order", related.id
+                        ) AS related_position
+                    FROM {through_table} through
+                    INNER JOIN {related_table} related
+                        ON related.id = through.{related_column}
+                    WHERE through.{row_column} = ANY(%(row_ids)s)
+                        AND NOT related.trashed
+                    """
+                ).format(
+                    field_name=sql.Literal(field_name),
+                    through_table=sql.Identifier(through_table),
+                    related_table=sql.Identifier(related_table),
+                    row_column=sql.Identifier(model_field.m2m_column_name()),
+                    related_column=sql.Identifier(model_field.m2m_reverse_name()),
+                )
+            )
+
+        query = sql.SQL(
+            """
+            SELECT field_name, row_id, related_id
+            FROM ({sub_queries}) relations
+            {limit}
+            ORDER BY related_position
+            """
+        ).format(
+            sub_queries=sql.SQL(" UNION ALL ").join(sub_queries),
+            limit=sql.SQL(
+                "WHERE related_position <= %(limit)s" if self.limit_per_cell else ""
+            ),
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(query, {"row_ids": row_ids, "limit": self.limit_per_cell})
+            relations = cursor.fetchall()
+
+        related_ids = defaultdict(list)
+        for field_name, row_id, related_id in relations:
+            related_ids[(field_name, row_id)].append(related_id)
+        return related_ids
+
+    def fetch_related_instances(
+        self, model_fields: Dict[str, ManyToManyField], related_ids: RelatedIds
+    ) -> Dict[Model, Dict[int, ModelInstance]]:
+        """
+        Fetches the related rows with one query per related table. Only the primary
+        field is selected, because that's the only value needed to serialize a
+        related row.
+
+        :param model_fields: The many to many model fields by name.
+        :param related_ids: The ordered related row ids by field name and row id.
+        :return: The fetched instances by id, grouped by the related model.
+        """
+
+        ids_by_related_model = {
+            model_field.remote_field.model: set()
+            for model_field in model_fields.values()
+        }
+        for (field_name, _), ids in related_ids.items():
+            related_model = model_fields[field_name].remote_field.model
+            ids_by_related_model[related_model].update(ids)
+
+        related_instances = {}
+        for related_model, ids in ids_by_related_model.items():
+            if not ids:
+                related_instances[related_model] = {}
+                continue
+
+            related_queryset = related_model.objects.filter(id__in=ids)
+            primary_field_object = next(
+                (
+                    field_object
+                    for field_object in related_model._field_objects.values()
+                    if field_object["field"].primary
+                ),
+                None,
+            )
+            if primary_field_object is not None:
+                related_queryset = related_queryset.only(primary_field_object["name"])
+                related_queryset = primary_field_object["type"].enhance_queryset(
+                    related_queryset,
+                    primary_field_object["field"],
+                    primary_field_object["name"],
+                )
+            related_instances[related_model] = {
+                instance.id: instance for instance in related_queryset
+            }
+
+        return related_instances
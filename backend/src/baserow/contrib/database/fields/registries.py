@@ -19,6 +19,8 @@ from django.db.models import (
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.db.models.functions import Cast
 
+from psycopg2 import sql
+
 from baserow.contrib.database.fields.constants import UPSERT_OPTION_DICT_KEY
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
 from baserow.contrib.database.types import SerializedRowHistoryFieldMetadata
@@ -1025,6 +1027,29 @@ class FieldType(
 
         setattr(row, field_name, value)
 
+    def get_in_database_copy_value_sql(
+        self,
+        field: Field,
+        value_sql: sql.Composable,
+        id_mapping: Dict[str, Any],
+    ) -> sql.Composable:
+        """
+        Returns the SQL expression that computes the value of the field when a row is
+        copied in the database from the table it was exported from. This happens
+        instead of `get_export_serialized_value` and `set_import_serialized_value`
+        when the `copy_rows_in_database` import export config is enabled. For many to
+        many fields, the expression is used for the related column of the through
+        table.
+
+        :param field: The newly imported field instance.
+        :param value_sql: The SQL expression of the value in the source table.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :return: The SQL expression of the value in the new table. If `NULL`, a
+            relation in the through table is not copied.
+        """
+
+        return value_sql
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
@@ -1159,7 +1184,7 @@ class FieldType(
         update_collector: "Optional[FieldUpdateCollector]" = None,
         field_cache: "Optional[FieldCache]" = None,
         via_path_to_starting_table: Optional[List[LinkRowField]] = None,
-    ):
+    ) -> Optional[int]:
         """
         This method is called periodically for all the fields of the same type
         that need to be periodically updated. It should be possible to call this method
@@ -1172,6 +1197,8 @@ class FieldType(
         :param field_cache: A field cache to be used when fetching fields.
         :param via_path_to_starting_table: A list of link row fields if any leading
             back to the starting table where the row was created.
+        :return: The number of rows that have been updated, if known, when called
+            without an update collector.
         """
 
         pass
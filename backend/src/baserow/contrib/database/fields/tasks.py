@@ -1,5 +1,5 @@
 import traceback
-from typing import Optional
+from typing import List, Optional
 
 from django.conf import settings
 from django.db import transaction
@@ -36,6 +36,30 @@ def filter_distinct_workspace_ids_per_fields(
     return queryset.distinct().order_by("now")
 
 
+def get_workspace_ids_needing_periodic_fields_updates(
+    workspace_id: Optional[int] = None,
+) -> List[int]:
+    """
+    Returns the ids of the workspaces containing at least one field that must be
+    updated periodically, ordered by the least recently updated first.
+
+    :param workspace_id: If provided, only this workspace id is returned if it
+        needs to be updated.
+    """
+
+    # A dict is used to keep the least recently updated workspaces first.
+    workspace_ids = {}
+    for field_type_instance in field_type_registry.get_all():
+        field_qs = field_type_instance.get_fields_needing_periodic_update()
+        if field_qs is None:
+            continue
+
+        workspace_qs = filter_distinct_workspace_ids_per_fields(field_qs, workspace_id)
+        for id_ in workspace_qs.values_list("id", flat=True):
+            workspace_ids.setdefault(id_, None)
+    return list(workspace_ids)
+
+
 @app.task(
     bind=True,
     queue=settings.PERIODIC_FIELD_UPDATE_QUEUE_NAME,
@@ -45,10 +69,39 @@ def run_periodic_fields_updates(
     self, workspace_id: Optional[int] = None, update_now: bool = True
 ):
     """
-    Refreshes all the fields that need to be updated periodically for all
-    workspaces.
+    Refreshes all the fields that need to be updated periodically. If no workspace
+    id is provided, a separate task is dispatched for every workspace, so that the
+    workload is spread across the workers and a big workspace doesn't delay or
+    time out the updates of all the others.
+
+    :param workspace_id: The id of the workspace that must be updated.
+    :param update_now: Whether the `now` value of the workspace must be refreshed
+        before updating the fields.
     """
 
+    if workspace_id is None:
+        for workspace_id in get_workspace_ids_needing_periodic_fields_updates():
+            run_periodic_fields_updates.delay(
+                workspace_id=workspace_id, update_now=update_now
+            )
+        return
+
+    run_periodic_fields_updates_for_workspace(workspace_id, update_now)
+
+
+def run_periodic_fields_updates_for_workspace(
+    workspace_id: int, update_now: bool = True
+) -> int:
+    """
+    Refreshes all the fields of the workspace that need to be updated periodically.
+
+    :param workspace_id: The id of the workspace that must be updated.
+    :param update_now: Whether the `now` value of the workspace must be refreshed
+        before updating the fields.
+    :return: The number of rows that have been updated.
+    """
+
+    updated_rows_count = 0
     for field_type_instance in field_type_registry.get_all():
         field_qs = field_type_instance.get_fields_needing_periodic_update()
         if field_qs is None:
@@ -57,23 +110,25 @@ def run_periodic_fields_updates(
         workspace_qs = filter_distinct_workspace_ids_per_fields(field_qs, workspace_id)
 
         for workspace in workspace_qs.all():
-            _run_periodic_field_type_update_per_workspace(
+            updated_rows_count += _run_periodic_field_type_update_per_workspace(
                 field_type_instance, workspace, update_now
             )
+    return updated_rows_count
 
 
 @baserow_trace(tracer)
 def _run_periodic_field_type_update_per_workspace(
     field_type_instance, workspace: Workspace, update_now=True
-):
+) -> int:
     qs = field_type_instance.get_fields_needing_periodic_update()
     if qs is None:
-        return
+        return 0
 
     if update_now:
         workspace.refresh_now()
     add_baserow_trace_attrs(update_now=update_now, workspace_id=workspace.id)
 
+    updated_rows_count = 0
     for field in qs.filter(
         table__database__workspace_id=workspace.id,
         table__trashed=False,
@@ -81,7 +136,7 @@ def _run_periodic_field_type_update_per_workspace(
     ):
         # noinspection PyBroadException
         try:
-            _run_periodic_field_update(field, field_type_instance)
+            updated_rows_count += _run_periodic_field_update(field, field_type_instance)
         except Exception:
             tb = traceback.format_exc()
             logger.error(
@@ -91,12 +146,22 @@ def _run_periodic_field_type_update_per_workspace(
             )
             continue
 
+    add_baserow_trace_attrs(updated_rows_count=updated_rows_count)
+    logger.info(
+        "Periodic {field_type} fields update of workspace {workspace_id} updated "
+        "{updated_rows_count} rows.",
+        field_type=field_type_instance.type,
+        workspace_id=workspace.id,
+        updated_rows_count=updated_rows_count,
+    )
+    return updated_rows_count
+
 
 @baserow_trace(tracer)
-def _run_periodic_field_update(field, field_type_instance):
+def _run_periodic_field_update(field, field_type_instance) -> int:
     add_baserow_trace_attrs(field_id=field.id)
     with transaction.atomic():
-        field_type_instance.run_periodic_update(field)
+        return field_type_instance.run_periodic_update(field) or 0
 
 
 @app.on_after_finalize.connect
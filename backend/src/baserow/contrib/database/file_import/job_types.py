@@ -1,4 +1,6 @@
 import json
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Tuple
 
 from django.core.files.base import ContentFile
 from django.db import transaction
@@ -94,14 +96,34 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The first line contains a
+        header with the number of rows, and every following line contains one row
+        encoded as JSON. This allows the rows to be read one by one when the job
+        runs, instead of loading the whole file into memory.
         """
 
-        data_file = ContentFile(
-            json.dumps(values["data"], ensure_ascii=False).encode("utf8")
-        )
+        data = values["data"]
+        lines = [json.dumps({"row_count": len(data)})] + [
+            json.dumps(row, ensure_ascii=False) for row in data
+        ]
+        data_file = ContentFile("\n".join(lines).encode("utf8"))
         job.data_file.save(None, data_file)
 
+    @contextmanager
+    def open_data_file(self, job) -> Iterator[Tuple[int, Iterator[List[Any]]]]:
+        """
+        Opens the data file of the job and returns the number of rows and an iterator
+        that parses the rows one by one. Data files created before the rows were
+        stored line by line contain one JSON array, and are loaded at once.
+        """
+
+        with job.data_file.open("r") as fin:
+            header = json.loads(fin.readline() or "[]")
+            if isinstance(header, list):
+                yield len(header), iter(header)
+            else:
+                yield header["row_count"], (json.loads(line) for line in fin)
+
     def before_delete(self, job):
         """
         Try to delete the data file of a job before deleting the job.
@@ -133,30 +155,34 @@ class FileImportJobType(JobType):
         creation of the table.
         """
 
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
-
-        if job.table is None:
-            new_table, error_report = action_type_registry.get_by_type(
-                CreateTableActionType
-            ).do(
-                job.user,
-                job.database,
-                name=job.name,
-                data=data,
-                first_row_header=job.first_row_header,
-                progress=progress,
-            )
-
-            job.table = new_table
-            job.save(update_fields=("table",))
-        else:
-            _, error_report = action_type_registry.get_by_type(ImportRowsActionType).do(
-                job.user,
-                table=job.table,
-                data=data,
-                progress=progress,
-            )
+        with self.open_data_file(job) as (row_count, rows):
+            if job.table is None:
+                # The fields of the new table depend on all the rows, so they're
+                # loaded at once. The number of rows is limited by the
+                # `INITIAL_TABLE_DATA_LIMIT` setting in this case.
+                new_table, error_report = action_type_registry.get_by_type(
+                    CreateTableActionType
+                ).do(
+                    job.user,
+                    job.database,
+                    name=job.name,
+                    data=list(rows),
+                    first_row_header=job.first_row_header,
+                    progress=progress,
+                )
+
+                job.table = new_table
+                job.save(update_fields=("table",))
+            else:
+                _, error_report = action_type_registry.get_by_type(
+                    ImportRowsActionType
+                ).do(
+                    job.user,
+                    table=job.table,
+                    data=rows,
+                    progress=progress,
+                    row_count=row_count,
+                )
 
         def after_commit():
             """
@@ -46,6 +46,12 @@ class LessThanEqualOrExpr(BinaryOpExpr):
     arg_joiner = "<="
 
 
+# A null safe not equals, which is true if only one of the two sides is null.
+# noinspection PyAbstractClass
+class IsDistinctFromExpr(BinaryOpExpr):
+    arg_joiner = " IS DISTINCT FROM "
+
+
 # noinspection PyAbstractClass
 class AndExpr(BinaryOpExpr):
     arg_joiner = " AND "
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 
 from baserow.contrib.database.formula.ast.tree import (
     BaserowBooleanLiteral,
@@ -9,6 +10,7 @@ from baserow.contrib.database.formula.ast.tree import (
     BaserowIntegerLiteral,
     BaserowStringLiteral,
 )
+from baserow.contrib.database.formula.ast.visitors import BaserowFormulaASTVisitor
 from baserow.contrib.database.formula.registries import formula_function_registry
 from baserow.contrib.database.formula.types.formula_type import UnTyped
 from baserow.core.formula.parser.exceptions import (
@@ -28,6 +30,9 @@ from baserow.core.formula.parser.parser import (
     get_parse_tree_for_formula,
 )
 
+# The maximum number of parsed formulas kept in memory by every process.
+UNTYPED_EXPRESSION_CACHE_SIZE = 4096
+
 
 def raw_formula_to_untyped_expression(
     formula: str,
@@ -37,6 +42,10 @@ def raw_formula_to_untyped_expression(
     a Baserow Formula (raises a BaserowFormulaSyntaxError if not) and converts it into
     an untyped BaserowExpression.
 
+    Parsing with antlr is slow, and the same formulas are parsed again every time a
+    table model is generated. The parsed expressions are therefore cached, and a copy
+    is returned because the expressions are mutated while they're being typed.
+
     :param formula: A raw user supplied string possibly in the format of a Baserow
         Formula.
     :return: An untyped BaserowExpression which represents the provided raw formula.
@@ -45,12 +54,68 @@ def raw_formula_to_untyped_expression(
     """
 
     try:
-        tree = get_parse_tree_for_formula(formula)
-        return BaserowFormulaToBaserowASTMapper().visit(tree)
+        return _cached_raw_formula_to_untyped_expression(formula).accept(
+            UntypedExpressionCopier()
+        )
     except RecursionError:
         raise MaximumFormulaSizeError()
 
 
+@lru_cache(maxsize=UNTYPED_EXPRESSION_CACHE_SIZE)
+def _cached_raw_formula_to_untyped_expression(
+    formula: str,
+) -> BaserowExpression[UnTyped]:
+    # Formulas that can't be parsed raise an exception, which is not cached.
+    tree = get_parse_tree_for_formula(formula)
+    return BaserowFormulaToBaserowASTMapper().visit(tree)
+
+
+class UntypedExpressionCopier(BaserowFormulaASTVisitor[UnTyped, BaserowExpression]):
+    """
+    Returns a copy of an untyped expression, so that the copy can be typed without
+    changing the original. The function definitions are shared, because they're the
+    registered instances.
+    """
+
+    def visit_string_literal(
+        self, string_literal: BaserowStringLiteral[UnTyped]
+    ) -> BaserowExpression:
+        return BaserowStringLiteral(string_literal.literal, None)
+
+    def visit_function_call(
+        self, function_call: BaserowFunctionCall[UnTyped]
+    ) -> BaserowExpression:
+        args = [arg.accept(self) for arg in function_call.args]
+        return BaserowFunctionCall(
+            function_call.function_def,
+            args,
+            None,
+            requires_aggregate_wrapper=function_call.requires_aggregate_wrapper,
+        )
+
+    def visit_int_literal(
+        self, int_literal: BaserowIntegerLiteral[UnTyped]
+    ) -> BaserowExpression:
+        return BaserowIntegerLiteral(int_literal.literal, None)
+
+    def visit_field_reference(
+        self, field_reference: BaserowFieldReference[UnTyped]
+    ) -> BaserowExpression:
+        return BaserowFieldReference(
+            field_reference.referenced_field_name, field_reference.target_field, None
+        )
+
+    def visit_decimal_literal(
+        self, decimal_literal: BaserowDecimalLiteral[UnTyped]
+    ) -> BaserowExpression:
+        return BaserowDecimalLiteral(decimal_literal.literal, None)
+
+    def visit_boolean_literal(
+        self, boolean_literal: BaserowBooleanLiteral[UnTyped]
+    ) -> BaserowExpression:
+        return BaserowBooleanLiteral(boolean_literal.literal, None)
+
+
 class BaserowFormulaToBaserowASTMapper(BaserowFormulaVisitor):
     """
     A Visitor which transforms an Antlr parse tree into a BaserowExpression AST.
@@ -8,8 +8,16 @@ class Command(BaseCommand):
         "Runs the periodic count rows task without having to wait for the time trigger"
     )
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Counts the rows of all the tables instead of only the ones that "
+            "have never been counted or whose count is stale.",
+        )
+
     def handle(self, *args, **options):
-        tables_counted = TableHandler.count_rows()
+        tables_counted = TableHandler.count_rows(only_stale=not options["all"])
         self.stdout.write(
             self.style.SUCCESS(f"{tables_counted} table(s) have been counted.")
         )
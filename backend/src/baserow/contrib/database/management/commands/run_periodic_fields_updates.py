@@ -1,7 +1,10 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
-from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
+from baserow.contrib.database.fields.tasks import (
+    get_workspace_ids_needing_periodic_fields_updates,
+    run_periodic_fields_updates_for_workspace,
+)
 
 
 class Command(BaseCommand):
@@ -23,6 +26,11 @@ class Command(BaseCommand):
 
     @transaction.atomic
     def handle(self, *args, **options):
-        run_periodic_fields_updates(
-            options["workspace_id"], not options["dont_update_now"]
-        )
+        updated_rows_count = 0
+        for workspace_id in get_workspace_ids_needing_periodic_fields_updates(
+            options["workspace_id"] or None
+        ):
+            updated_rows_count += run_periodic_fields_updates_for_workspace(
+                workspace_id, not options["dont_update_now"]
+            )
+        self.stdout.write(f"{updated_rows_count} rows have been updated.")
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.20 on 2026-10-17 12:00
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0133_formviewfieldoptions_field_component"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="view",
+            name="db_filter_index_names",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=63),
+                blank=True,
+                default=list,
+                help_text="The names of the database indexes needed by the filters of the view, when they were last updated.",
+                size=None,
+            ),
+        ),
+    ]
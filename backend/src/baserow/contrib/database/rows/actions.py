@@ -1,7 +1,7 @@
 import dataclasses
 from copy import deepcopy
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -207,9 +207,10 @@ class ImportRowsActionType(UndoableActionType):
         cls,
         user: AbstractUser,
         table: Table,
-        data=List[List[Any]],
+        data=Iterable[List[Any]],
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+        row_count: Optional[int] = None,
+    ) -> Tuple[List[int], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -224,11 +225,13 @@ class ImportRowsActionType(UndoableActionType):
         :param table: The table for which the rows should be imported.
         :param data: List of rows values for rows that need to be created.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :param row_count: The number of rows in data. Must be provided together with
+            the progress if data is an iterator.
+        :return: The ids of the created rows and the error report.
         """
 
-        created_rows, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress
+        created_row_ids, error_report = RowHandler().import_rows(
+            user, table, data, progress=progress, row_count=row_count
         )
 
         workspace = table.database.workspace
@@ -237,13 +240,13 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            created_row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
         )
 
-        return created_rows, error_report
+        return created_row_ids, error_report
 
     @classmethod
     def scope(cls, table_id) -> ActionScopeStr:
@@ -21,12 +21,24 @@ class RowErrorReport:
         :param error_limit: if the error limit is exceeded, an exception is raised.
         """
 
-        self._indexed_rows = {
-            index: {"row": row, "error": None} for index, row in enumerate(rows)
-        }
-        self._rows = rows
+        self._errors = {}
         self.error_count = 0
         self.error_limit = error_limit
+        self.set_rows(rows)
+
+    def set_rows(self, rows: List[Dict[str, Any]], start_index: RowIndex = 0):
+        """
+        Replaces the tracked rows by the provided ones, while keeping the errors of
+        the previous rows. This allows to generate a report of a large import that
+        is processed by chunks, without keeping all the rows in memory.
+
+        :param rows: the rows list.
+        :param start_index: the index of the first provided row in the import.
+        """
+
+        self._indexed_rows = {
+            start_index + index: {"row": row} for index, row in enumerate(rows)
+        }
 
     def add_error(self, row_index: RowIndex, error: Dict[str, Any]):
         """
@@ -42,7 +54,7 @@ class RowErrorReport:
         if self.error_count > self.error_limit:
             raise ReportMaxErrorCountExceeded(self.to_dict())
 
-        self._indexed_rows[row_index]["error"] = error
+        self._errors[row_index] = error
 
     def update_row(self, row_index: RowIndex, new_row: Dict[str, Any]):
         self._indexed_rows[row_index]["row"] = new_row
@@ -57,10 +69,10 @@ class RowErrorReport:
 
         valid_rows = []
         mapping = {}
-        for index, _ in enumerate(self._rows):
-            if not self._indexed_rows[index]["error"]:
+        for index, indexed_row in self._indexed_rows.items():
+            if index not in self._errors:
                 mapping[len(valid_rows)] = index
-                valid_rows.append(self._indexed_rows[index]["row"])
+                valid_rows.append(indexed_row["row"])
         return valid_rows, mapping
 
     def to_dict(self) -> Dict[RowIndex, Dict[str, Any]]:
@@ -68,8 +80,4 @@ class RowErrorReport:
         Generates the report as a dict.
         """
 
-        report = {}
-        for index, _ in enumerate(self._rows):
-            if self._indexed_rows[index]["error"]:
-                report[index] = self._indexed_rows[index]["error"]
-        return report
+        return {index: self._errors[index] for index in sorted(self._errors)}
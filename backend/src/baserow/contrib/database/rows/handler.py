@@ -46,6 +46,7 @@ from baserow.contrib.database.table.operations import (
 from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.trash.models import TrashedRows
 from baserow.core.db import (
+    bulk_insert_with_copy,
     get_highest_order_of_queryset,
     get_unique_orders_before_item,
     recalculate_full_orders,
@@ -1024,6 +1025,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_webhook_events: bool = True,
         generate_error_report: bool = False,
         skip_search_update: bool = False,
+        use_copy: bool = False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -1042,6 +1044,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_search_update: If you want to to instead
             trigger the search handler cells update later on after many create_rows
             calls then set this to True but make sure you trigger it eventually.
+        :param use_copy: If True, the rows are inserted with the `COPY` command,
+            which is faster when creating many rows at once.
         :return: The created row instances.
         """
 
@@ -1083,9 +1087,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             }
             rows_relationships.append((instance, relations))
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, _) in rows_relationships]
-        )
+        rows_to_insert = [row for (row, _) in rows_relationships]
+        if use_copy:
+            inserted_rows = bulk_insert_with_copy(model, rows_to_insert)
+        else:
+            inserted_rows = model.objects.bulk_create(rows_to_insert)
         rows_created_counter.add(len(rows_relationships))
 
         many_to_many = defaultdict(list)
@@ -1217,6 +1223,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         table: Table,
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Validates rows by batch and generates an error report.
@@ -1225,6 +1232,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param table: The table for which the rows should be created.
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
+        :param model: Optional model to prevent recomputing table model.
         :return: The error report.
         """
 
@@ -1240,7 +1248,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(state=ROW_IMPORT_VALIDATION)
 
-        model = table.get_model()
+        if model is None:
+            model = table.get_model()
         # Use serializer to validate incoming data
         validation_serializer = get_row_serializer_class(model)
         report = {}
@@ -1257,75 +1266,16 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return report
 
-    def create_rows_by_batch(
-        self,
-        user: AbstractUser,
-        table: Table,
-        rows: List[Dict[str, Any]],
-        progress: Optional[Progress] = None,
-        model: Optional[Type[GeneratedTableModel]] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
-        """
-        Creates rows by batch and generates an error report instead of failing on first
-        error.
-
-        :param user: The user of whose behalf the rows are created.
-        :param table: The table for which the rows should be created.
-        :param rows: List of rows values for rows that need to be created.
-        :param progress: Give a progress instance to track the progress of the import.
-        :param model: Optional model to prevent recomputing table model.
-        :return: The created rows and the error report.
-        """
-
-        if not rows:
-            return [], {}
-
-        if progress:
-            progress.increment(state=ROW_IMPORT_CREATION)
-
-        if model is None:
-            model = table.get_model()
-
-        report = {}
-        all_created_rows = []
-        for count, chunk in enumerate(grouper(BATCH_SIZE, rows)):
-            row_start_index = count * BATCH_SIZE
-            created_rows, creation_report = self.create_rows(
-                user=user,
-                table=table,
-                model=model,
-                rows_values=chunk,
-                generate_error_report=True,
-                send_realtime_update=False,
-                send_webhook_events=False,
-                # Don't trigger loads of search updates for every batch of rows we
-                # create but instead a single one for this entire table at the end.
-                skip_search_update=True,
-            )
-
-            for valid_index, field_errors in creation_report.items():
-                report[int(valid_index) + row_start_index] = prepare_field_errors(
-                    field_errors
-                )
-
-            if progress:
-                progress.increment(len(chunk))
-
-            all_created_rows += created_rows
-
-        SearchHandler.field_value_updated_or_created(table)
-
-        return all_created_rows, report
-
     def import_rows(
         self,
         user: AbstractUser,
         table: Table,
-        data: List[List[Any]],
+        data: Iterable[List[Any]],
         validate: bool = True,
         progress: Optional[Progress] = None,
         send_realtime_update: bool = True,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
+        row_count: Optional[int] = None,
+    ) -> Tuple[List[int], Dict[str, Dict[str, Any]]]:
         """
         Creates new rows for a given table if the user belongs to the related
         workspace. It also calls the rows_created passing the
@@ -1334,16 +1284,25 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         stop the import. Instead an error report is created with the raised
         error for each field of each failing rows.
 
+        The data are consumed by chunks of `BATCH_SIZE` rows that are validated and
+        inserted before reading the next chunk, so data can be an iterator that
+        reads the rows from a file without loading all of them into memory. Only the
+        ids of the created rows are kept. If too many rows fail, the rows of the
+        chunks that have already been created are rolled back.
+
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List or iterator of rows values for rows that need to be
+            created.
         :param validate: If True the data are validated before the import.
         :param progress: Give a progress instance to track the progress of the
             import.
         :param send_realtime_update: The parameter passed to the rows_created
             signal indicating if a realtime update should be send.
+        :param row_count: The number of rows in data. Must be provided together with
+            the progress if data is an iterator.
 
-        :return: The created row instances and the error report.
+        :return: The ids of the created rows and the error report.
         """
 
         workspace = table.database.workspace
@@ -1354,8 +1313,6 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             context=table,
         )
 
-        error_report = RowErrorReport(data)
-
         model = table.get_model()
 
         fields = [
@@ -1367,74 +1324,113 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         # Sort by order then by id
         fields.sort(key=lambda f: (f.order, f.id))
 
-        for index, row in enumerate(data):
-            # Check row length
-            if len(row) > len(fields):
-                error_report.add_error(
-                    index,
-                    {"non_field_errors": ["Too many values in this line."]},
-                )
-            else:
-                new_row = list(row)
-                # Fill incomplete rows with empty values
-                new_row.extend([None] * (len(fields) - len(row)))
-
-                # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
-                    {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
-                )
+        validation_sub_progress = None
+        creation_sub_progress = None
+        if progress:
+            if row_count is None:
+                row_count = len(data)
+            if validate:
+                validation_sub_progress = progress.create_child(50, row_count)
+            creation_sub_progress = progress.create_child(
+                50 if validate else 100, row_count
+            )
+
+        error_report = RowErrorReport([])
+        created_row_ids = []
+        # The chunks are inserted before all the rows have been validated, so they
+        # must be rolled back if the import fails because of too many errors.
+        with transaction.atomic():
+            for count, chunk in enumerate(grouper(BATCH_SIZE, data)):
+                row_start_index = count * BATCH_SIZE
+                error_report.set_rows(chunk, start_index=row_start_index)
+
+                for index, row in enumerate(chunk, start=row_start_index):
+                    # Check row length
+                    if len(row) > len(fields):
+                        error_report.add_error(
+                            index,
+                            {"non_field_errors": ["Too many values in this line."]},
+                        )
+                    else:
+                        new_row = list(row)
+                        # Fill incomplete rows with empty values
+                        new_row.extend([None] * (len(fields) - len(row)))
+
+                        # Reshape data by field as expected by the import
+                        error_report.update_row(
+                            index,
+                            {
+                                f"field_{fields[field_index].id}": value
+                                for field_index, value in enumerate(new_row)
+                            },
+                        )
 
-        # STEP 1: pre-validate data with serializer
-        if validate:
-            (
-                valid_rows,
-                original_row_index_mapping,
-            ) = error_report.get_valid_rows_and_mapping()
+                # STEP 1: pre-validate data with serializer
+                if validate:
+                    (
+                        valid_rows,
+                        original_row_index_mapping,
+                    ) = error_report.get_valid_rows_and_mapping()
 
-            validation_sub_progress = (
-                progress.create_child(50, len(valid_rows)) if progress else None
-            )
+                    validation_report = self.validate_rows(
+                        table, valid_rows, model=model
+                    )
 
-            validation_report = self.validate_rows(
-                table, valid_rows, progress=validation_sub_progress
-            )
+                    for index, error in validation_report.items():
+                        error_report.add_error(
+                            original_row_index_mapping[int(index)], error
+                        )
 
-            for index, error in validation_report.items():
-                error_report.add_error(original_row_index_mapping[int(index)], error)
+                    if validation_sub_progress:
+                        validation_sub_progress.increment(
+                            len(chunk), state=ROW_IMPORT_VALIDATION
+                        )
 
-        (
-            valid_rows,
-            original_row_index_mapping,
-        ) = error_report.get_valid_rows_and_mapping()
+                (
+                    valid_rows,
+                    original_row_index_mapping,
+                ) = error_report.get_valid_rows_and_mapping()
+
+                # STEP 2: create rows in DB
+                if valid_rows:
+                    chunk_created_rows, creation_report = self.create_rows(
+                        user=user,
+                        table=table,
+                        model=model,
+                        rows_values=valid_rows,
+                        generate_error_report=True,
+                        send_realtime_update=False,
+                        send_webhook_events=False,
+                        # Don't trigger loads of search updates for every batch of rows
+                        # we create but instead a single one for this entire table at
+                        # the end.
+                        skip_search_update=True,
+                        use_copy=True,
+                    )
 
-        # STEP 2: create rows in DB
-        creation_sub_progress = (
-            progress.create_child(50 if validate else 100, len(valid_rows))
-            if progress
-            else None
-        )
+                    # Add errors to global report
+                    for index, field_errors in creation_report.items():
+                        error_report.add_error(
+                            original_row_index_mapping[int(index)],
+                            prepare_field_errors(field_errors),
+                        )
 
-        created_rows, creation_report = self.create_rows_by_batch(
-            user, table, valid_rows, progress=creation_sub_progress, model=model
-        )
+                    created_row_ids += [row.id for row in chunk_created_rows]
 
-        # Add errors to global report
-        for index, error in creation_report.items():
-            error_report.add_error(
-                original_row_index_mapping[int(index)],
-                error,
-            )
+                if creation_sub_progress:
+                    creation_sub_progress.increment(
+                        len(chunk), state=ROW_IMPORT_CREATION
+                    )
+
+        if created_row_ids:
+            SearchHandler.field_value_updated_or_created(table)
 
         if send_realtime_update:
             # Just send a single table_updated here as realtime update instead
             # of rows_created because we might import a lot of rows.
             table_updated.send(self, table=table, user=user, force_table_refresh=True)
 
-        return created_rows, error_report.to_dict()
+        return created_row_ids, error_report.to_dict()
 
     def get_fields_metadata_for_row_history(
         self,
@@ -27,6 +27,11 @@ class RowsEventType(WebhookEventType):
 class RowsCreatedEventType(RowsEventType):
     type = "rows.created"
     signal = rows_created
+    can_merge_payloads = True
+
+    def merge_payloads(self, payload, other_payload):
+        payload["items"] += other_payload["items"]
+        return payload
 
     def get_test_call_payload(self, table, model, event_id, webhook):
         rows = [model(id=0, order=0)]
@@ -48,6 +53,7 @@ class RowCreatedEventType(RowsCreatedEventType):
     type = "row.created"
     signal = rows_created
     should_trigger_when_all_event_types_selected = False
+    can_merge_payloads = False
 
     def get_payload(self, *args, **kwargs):
         payload = super().get_payload(*args, **kwargs)
@@ -60,6 +66,12 @@ class RowCreatedEventType(RowsCreatedEventType):
 class RowsUpdatedEventType(RowsEventType):
     type = "rows.updated"
     signal = rows_updated
+    can_merge_payloads = True
+
+    def merge_payloads(self, payload, other_payload):
+        payload["items"] += other_payload["items"]
+        payload["old_items"] += other_payload["old_items"]
+        return payload
 
     def get_payload(
         self,
@@ -107,6 +119,7 @@ class RowUpdatedEventType(RowsUpdatedEventType):
     type = "row.updated"
     signal = rows_updated
     should_trigger_when_all_event_types_selected = False
+    can_merge_payloads = False
 
     def get_payload(
         self, event_id, webhook, model, table, rows, before_return, **kwargs
@@ -125,6 +138,11 @@ class RowUpdatedEventType(RowsUpdatedEventType):
 class RowsDeletedEventType(WebhookEventType):
     type = "rows.deleted"
     signal = rows_deleted
+    can_merge_payloads = True
+
+    def merge_payloads(self, payload, other_payload):
+        payload["row_ids"] += other_payload["row_ids"]
+        return payload
 
     def get_payload(self, event_id, webhook, rows, **kwargs):
         payload = super().get_payload(event_id, webhook, **kwargs)
@@ -152,6 +170,7 @@ class RowDeletedEventType(RowsDeletedEventType):
     type = "row.deleted"
     signal = rows_deleted
     should_trigger_when_all_event_types_selected = False
+    can_merge_payloads = False
 
     def get_payload(self, event_id, webhook, rows, **kwargs):
         payload = super().get_payload(event_id, webhook, rows, **kwargs)
@@ -12,22 +12,52 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that, every process keeps a bounded LRU of the fully built model classes
+in memory (the L1 cache), which avoids the Redis round trip, the unpickling of the
+field attrs and the rebuilding of the Django model class. An entry is only used if
+the version of the table, and the versions of all the tables it's connected to via
+link row fields, still match the database. These versions are all fetched in the
+same single query that was otherwise needed to refresh the table version, so an
+invalidation through `invalidate_table_in_model_cache` also invalidates the L1
+cache of every process. Because the `baserow_table` of a cached model is shared, it
+is a copy of the table that was used to build it (see `L1CachedModelTable`), and
+any change to the table itself, like a rename, must invalidate the cache as well.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from copy import copy
+from typing import Any, Dict, Hashable, Optional, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+from opentelemetry import metrics
+
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+meter = metrics.get_meter(__name__)
+model_l1_cache_hits_counter = meter.create_counter(
+    "baserow.generated_model_l1_cache.hits",
+    unit="1",
+    description="The number of generated table models served from the process-local "
+    "cache.",
+)
+model_l1_cache_misses_counter = meter.create_counter(
+    "baserow.generated_model_l1_cache.misses",
+    unit="1",
+    description="The number of generated table models that had to be built because "
+    "they were not in the process-local cache.",
+)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -52,8 +82,161 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+class L1CachedModelTable:
+    """
+    The `baserow_table` attribute of the models stored in the L1 cache. The cached
+    models are shared by every thread and request of the process, so they keep a
+    private copy of the table they have been built with, and every access returns a
+    new copy of it. This way a change made to the table by one user of the model
+    never leaks into the others.
+    """
+
+    def __init__(self, table: "Table"):
+        self._table = copy(table)
+
+    def __get__(self, instance, owner) -> "Table":
+        return copy(self._table)
+
+
+class GeneratedModelL1Cache:
+    """
+    A thread safe, process-local LRU cache of generated table model classes. The
+    cache is bounded by the number of entries and by the total number of fields of
+    the cached models, because the memory footprint of a model mostly depends on its
+    number of fields.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._num_fields = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            settings.BASEROW_GENERATED_MODEL_L1_CACHE_SIZE > 0
+            and not settings.BASEROW_DISABLE_MODEL_CACHE
+        )
+
+    def get(
+        self, table: "Table", key: Hashable
+    ) -> Optional[Type["GeneratedTableModel"]]:
+        """
+        Returns the cached model of the table for the provided key if the versions of
+        the table and its related tables still match the database. As a side effect
+        the `version` of the provided table is always refreshed from the database.
+
+        :param table: The table to get the model for.
+        :param key: The key uniquely identifying the requested model variant.
+        :return: The cached model or None if it's not cached or outdated.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        table_ids = {table.id}
+        if entry is not None:
+            table_ids.update(entry["versions"].keys())
+
+        versions = dict(
+            Table.objects_and_trash.filter(id__in=table_ids).values_list(
+                "id", "version"
+            )
+        )
+        if table.id in versions:
+            table.version = versions[table.id]
+
+        if entry is not None and entry["versions"] == versions:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            model_l1_cache_hits_counter.add(1)
+            return entry["model"]
+
+        if entry is not None:
+            self.delete(key)
+        with self._lock:
+            self.misses += 1
+        model_l1_cache_misses_counter.add(1)
+        return None
+
+    def set(self, key: Hashable, model: Type["GeneratedTableModel"]):
+        """
+        Stores the model in the cache together with the versions of its table and
+        all the related tables it has been built with. The least recently used
+        entries are evicted if the cache exceeds its bounds.
+
+        :param key: The key uniquely identifying the model variant.
+        :param model: The generated model to cache.
+        """
+
+        versions = {
+            related_model.baserow_table_id: related_model.baserow_table.version
+            for related_model in model.baserow_m2m_models.values()
+        }
+        versions[model.baserow_table_id] = model.baserow_table.version
+        num_fields = len(model._field_objects) + len(model._trashed_field_objects)
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = {
+                "model": model,
+                "versions": versions,
+                "num_fields": num_fields,
+            }
+            self._num_fields += num_fields
+            while self._entries and (
+                len(self._entries) > settings.BASEROW_GENERATED_MODEL_L1_CACHE_SIZE
+                or self._num_fields
+                > settings.BASEROW_GENERATED_MODEL_L1_CACHE_MAX_FIELDS
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._num_fields -= entry["num_fields"]
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._pop(key)
+
+    def delete_table(self, table_id: int):
+        """
+        Removes all the cached models of the provided table from this process. Other
+        processes will notice the table version change on their next lookup.
+        """
+
+        with self._lock:
+            for key in [k for k in self._entries.keys() if k[0] == table_id]:
+                self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._num_fields = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "num_fields": self._num_fields,
+            }
+
+
+generated_models_l1_cache = GeneratedModelL1Cache()
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_models_l1_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -70,6 +253,8 @@ def invalidate_table_in_model_cache(table_id: int):
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
+    generated_models_l1_cache.delete_table(table_id)
+
     new_version = str(uuid.uuid4())
     # Make sure to invalidate ourselves and any directly connected tables.
     from baserow.contrib.database.table.models import Table
@@ -1,10 +1,12 @@
 import traceback
+from datetime import timedelta
 from typing import Any, Dict, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import DatabaseError, ProgrammingError
-from django.db.models import Q, QuerySet, Sum
+from django.db import DatabaseError, ProgrammingError, transaction
+from django.db.models import F, Q, QuerySet, Sum
+from django.db.models.functions import Greatest
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
@@ -37,6 +39,7 @@ from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import ChildProgressBuilder, Progress, find_unused_name
 
+from .cache import invalidate_table_in_model_cache
 from .constants import ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, TABLE_CREATION
 from .exceptions import (
     FailedToLockTableDueToConflict,
@@ -217,6 +220,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             order=last_order,
             name=name,
             needs_background_update_column_added=True,
+            # The table is empty, so the row count can be kept up to date right away.
+            row_count=0,
+            row_count_updated_at=timezone.now(),
         )
 
         # Let's create the fields before creating the model so that the whole
@@ -394,6 +400,8 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
 
         table.name = name
         table.save()
+        # The cached models have a copy of the table, which must be refreshed.
+        invalidate_table_in_model_cache(table.id)
 
         table_updated.send(self, table=table, user=user)
 
@@ -627,10 +635,15 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         table_deleted.send(self, table_id=table.id, table=table, user=user)
 
     @classmethod
-    def count_rows(cls) -> int:
+    def count_rows(cls, only_stale: bool = True) -> int:
         """
         Counts how many rows each user table has and stores the count
-        for later reference.
+        for later reference. Because the counts are updated incrementally when rows
+        are created or deleted, by default only the tables that have never been
+        counted, or that have not been counted for
+        `BASEROW_ROW_COUNT_STALE_AFTER_DAYS`, are counted.
+
+        :param only_stale: Set to False to count all the tables.
         :returns: The number of tables counted.
         """
 
@@ -638,9 +651,17 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         tables_to_store = []
         time = timezone.now()
         i = 0
-        for table in Table.objects.filter(
-            database__workspace__template__isnull=True
-        ).iterator(chunk_size=chunk_size):
+        queryset = Table.objects.filter(database__workspace__template__isnull=True)
+        if only_stale:
+            stale_before = time - timedelta(
+                days=settings.BASEROW_ROW_COUNT_STALE_AFTER_DAYS
+            )
+            queryset = queryset.filter(
+                Q(row_count__isnull=True)
+                | Q(row_count_updated_at__isnull=True)
+                | Q(row_count_updated_at__lt=stale_before)
+            )
+        for table in queryset.iterator(chunk_size=chunk_size):
             try:
                 count = table.get_model(field_ids=[]).objects.count()
                 table.row_count = count
@@ -667,6 +688,29 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
 
         return i
 
+    @classmethod
+    def update_row_count(cls, table_id: int, difference: int):
+        """
+        Adds the difference to the stored row count of the table when the current
+        transaction commits, so that the row count stays up to date without having
+        to count the rows. The table row is only locked during this short update.
+        Tables that have never been counted are left for the row count job.
+
+        :param table_id: The id of the table where rows have been created or deleted.
+        :param difference: The number of created rows, negative if rows have been
+            deleted.
+        """
+
+        if difference == 0:
+            return
+
+        def update():
+            Table.objects_and_trash.filter(id=table_id, row_count__isnull=False).update(
+                row_count=Greatest(F("row_count") + difference, 0)
+            )
+
+        transaction.on_commit(update)
+
     @classmethod
     def get_total_row_count_of_workspace(cls, workspace_id: int) -> int:
         """
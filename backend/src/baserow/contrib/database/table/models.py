@@ -27,6 +27,9 @@ from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_OR,
     FilterBuilder,
 )
+from baserow.contrib.database.fields.link_row_prefetch import (
+    LinkRowMultipleFieldPrefetch,
+)
 from baserow.contrib.database.fields.models import (
     CreatedOnField,
     Field,
@@ -35,6 +38,8 @@ from baserow.contrib.database.fields.models import (
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
 from baserow.contrib.database.table.cache import (
+    L1CachedModelTable,
+    generated_models_l1_cache,
     get_cached_model_field_attrs,
     set_cached_model_field_attrs,
 )
@@ -171,6 +176,26 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
             self = field_type.enhance_queryset_in_bulk(self, field_objects)
         return self
 
+    def limit_link_row_items_per_cell(self, limit: Optional[int]):
+        """
+        Limits the number of related rows that are prefetched for every `link_row`
+        cell by `enhance_by_fields`. This can be used when listing many rows where
+        only the first related rows are shown.
+
+        :param limit: The maximum number of related rows per cell. If falsy, all the
+            related rows are prefetched.
+        :return: The queryset with the limited link row prefetch.
+        """
+
+        clone = self._chain()
+        clone._multi_field_prefetch_related_funcs = [
+            prefetch.with_limit_per_cell(limit or None)
+            if isinstance(prefetch, LinkRowMultipleFieldPrefetch)
+            else prefetch
+            for prefetch in clone._multi_field_prefetch_related_funcs
+        ]
+        return clone
+
     def search_all_fields(
         self,
         search: str,
@@ -789,6 +814,30 @@ class Table(
             use_cache,
         )
 
+        # Fully built models are cached in memory per process, as long as they don't
+        # depend on extra fields or names that are not part of the table itself.
+        l1_cache_key = None
+        if (
+            use_cache
+            and not fields
+            and field_names is None
+            and attribute_names is False
+            and manytomany_models is None
+            and generated_models_l1_cache.enabled
+        ):
+            l1_cache_key = (
+                self.id,
+                tuple(sorted(set(field_ids))) if field_ids is not None else None,
+                add_dependencies,
+                managed,
+                force_add_tsvectors,
+                self.needs_background_update_column_added,
+            )
+            # This also refreshes the version of the table.
+            model = generated_models_l1_cache.get(self, l1_cache_key)
+            if model is not None:
+                return model
+
         filtered = field_names is not None or field_ids is not None
         model_name = f"Table{self.pk}Model"
 
@@ -841,7 +890,11 @@ class Table(
             "__module__": "database.models",
             # An indication that the model is a generated table model.
             "_generated_table_model": True,
-            "baserow_table": self,
+            # The cached models don't reference the table instance of the caller,
+            # because they're shared with the other callers.
+            "baserow_table": (
+                L1CachedModelTable(self) if l1_cache_key is not None else self
+            ),
             "baserow_table_id": self.id,
             "baserow_m2m_models": baserow_m2m_models,
             # We are using our own table model manager to implement some queryset
@@ -862,7 +915,8 @@ class Table(
 
         if use_cache:
             logger.debug("Using cached model for table {}", self.pk)
-            self.refresh_from_db(fields=["version"])
+            if l1_cache_key is None:
+                self.refresh_from_db(fields=["version"])
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -937,6 +991,9 @@ class Table(
         if not model.baserow_m2m_models:
             self._after_model_generation(attrs, model)
 
+        if l1_cache_key is not None:
+            generated_models_l1_cache.set(l1_cache_key, model)
+
         return model
 
     def _add_search_tsvector_fields_to_model(self, field_attrs, indexes, force_add):
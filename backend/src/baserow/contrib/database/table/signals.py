@@ -1,6 +1,7 @@
 from django.db.models.signals import post_delete
 from django.dispatch import Signal, receiver
 
+from baserow.contrib.database.rows.signals import rows_created, rows_deleted
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.table.models import Table
 
@@ -13,3 +14,17 @@ tables_reordered = Signal()
 @receiver(post_delete, sender=Table)
 def invalidate_model_cache_when_table_deleted(sender, instance, **kwargs):
     invalidate_table_in_model_cache(instance.id)
+
+
+@receiver(rows_created)
+def increase_row_count_when_rows_created(sender, rows, table, **kwargs):
+    from baserow.contrib.database.table.handler import TableHandler
+
+    TableHandler.update_row_count(table.id, len(rows))
+
+
+@receiver(rows_deleted)
+def decrease_row_count_when_rows_deleted(sender, rows, table, **kwargs):
+    from baserow.contrib.database.table.handler import TableHandler
+
+    TableHandler.update_row_count(table.id, -len(rows))
@@ -412,7 +412,7 @@ class RowsTrashableItemType(TrashableItemType):
         rows_to_restore_queryset = table_model.objects_and_trash.filter(
             id__in=trashed_item.row_ids
         )
-        rows_to_restore_queryset.update(trashed=False)
+        restored_rows_count = rows_to_restore_queryset.update(trashed=False)
         rows_to_restore = rows_to_restore_queryset.enhance_by_fields()
         trashed_item.delete()
 
@@ -453,6 +453,9 @@ class RowsTrashableItemType(TrashableItemType):
         else:
             # Use table signal here instead of row signal because we don't want
             # to send too many ids in the signal
+            from baserow.contrib.database.table.handler import TableHandler
+
+            TableHandler.update_row_count(table.id, restored_rows_count)
             table_updated.send(self, table=table, user=None, force_table_refresh=True)
 
     def trash(self, item_to_trash, requesting_user, trash_entry: TrashEntry):
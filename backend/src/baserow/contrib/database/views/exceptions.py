@@ -113,6 +113,13 @@ class FieldAggregationNotSupported(Exception):
     """Raised when the view type does not support field aggregation."""
 
 
+class IncrementalAggregationUpdateNotPossible(Exception):
+    """
+    Raised when the new value of an aggregation can't be derived from the previous
+    value and the changed rows, and must be computed again for the whole view.
+    """
+
+
 class AggregationTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get an aggregation type that does not exist."""
 
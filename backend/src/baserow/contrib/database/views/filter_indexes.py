@@ -0,0 +1,239 @@
+"""
+Analyses the filters of a view to find the database indexes that can speed them up.
+Every filter of a view with the `AND` filter type restricts all the rows of the view,
+so an index on the filtered column can be used by the database instead of scanning
+the whole table:
+
+- The `icontains` and `iregex` lookups, used by the contains and contains word
+  filters, get a `pg_trgm` GIN index on the text of the column.
+- The equality and range lookups, used by the equal, higher than, lower than and
+  date filters, get a btree index on the column. Text columns only get a hash
+  index for equality lookups, because a btree index can't contain large values.
+- An equality lookup on a boolean or a foreign key column, like the boolean and
+  single select equal filters, has only a few distinct values. It gets a partial
+  index on the default order of the rows, restricted to the filtered value.
+
+The indexes are named after the table and a hash of their definition, so that
+views filtering on the same column share the same index.
+"""
+
+from dataclasses import dataclass
+from hashlib import shake_128
+from typing import Any, List, Optional
+
+from django.db import models as django_models
+from django.db.models import Q
+
+from psycopg2 import sql
+
+from baserow.contrib.database.fields.field_filters import FILTER_TYPE_AND, AnnotatedQ
+from baserow.contrib.database.table.models import GeneratedTableModel
+
+from .models import View
+from .view_filter_groups import get_q_from_view_filter
+
+FILTER_INDEX_TRIGRAM = "trigram"
+FILTER_INDEX_UPPER_TRIGRAM = "upper_trigram"
+FILTER_INDEX_BTREE = "btree"
+FILTER_INDEX_HASH = "hash"
+FILTER_INDEX_PARTIAL = "partial"
+
+TRIGRAM_LOOKUPS = {
+    "icontains": FILTER_INDEX_UPPER_TRIGRAM,
+    "iregex": FILTER_INDEX_TRIGRAM,
+}
+EQUALITY_LOOKUPS = {"", "exact"}
+RANGE_LOOKUPS = {"gt", "gte", "lt", "lte", "range"}
+# Matches the names of the filter indexes of all the tables.
+FILTER_INDEX_NAME_REGEX = r"^i[0-9]+f:"
+
+
+@dataclass(frozen=True)
+class ViewFilterIndex:
+    """
+    An index that speeds up a filter of a view.
+    """
+
+    table_id: int
+    kind: str
+    column: str
+    value: Any = None
+
+    @classmethod
+    def get_name_prefix(cls, table_id: int) -> str:
+        """
+        Returns the prefix of the names of the filter indexes of the table. It's
+        different from the prefix of the sort indexes, so that the filter indexes
+        of a table can be found by name.
+
+        :param table_id: The id of the table.
+        :return: The index name prefix.
+        """
+
+        return f"i{table_id}f:"
+
+    @property
+    def name(self) -> str:
+        index_key = f"{self.kind}:{self.column}:{self.value!r}"
+        # limit to 20 characters, like the sort indexes.
+        index_hash = shake_128(index_key.encode("utf-8")).hexdigest(10)
+        return f"{self.get_name_prefix(self.table_id)}{index_hash}"
+
+    @property
+    def requires_trigram_extension(self) -> bool:
+        return self.kind in (FILTER_INDEX_TRIGRAM, FILTER_INDEX_UPPER_TRIGRAM)
+
+    def get_create_sql(self, db_table: str) -> sql.Composed:
+        """
+        Returns the SQL creating the index. Like the queries of the rows, the index
+        only contains the rows that are not trashed.
+
+        :param db_table: The name of the database table of the table.
+        :return: The SQL creating the index.
+        """
+
+        if self.kind == FILTER_INDEX_UPPER_TRIGRAM:
+            # Matches `UPPER("column"::text) LIKE UPPER(%s)` of `icontains`.
+            definition = "USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        elif self.kind == FILTER_INDEX_TRIGRAM:
+            # Matches `"column"::text ~* %s` of `iregex`.
+            definition = "USING gin (({column}::text) gin_trgm_ops)"
+        elif self.kind == FILTER_INDEX_BTREE:
+            definition = "({column})"
+        elif self.kind == FILTER_INDEX_HASH:
+            definition = "USING hash ({column})"
+        else:
+            definition = '("order", "id")'
+
+        condition = '"trashed" = false'
+        if self.kind == FILTER_INDEX_PARTIAL:
+            condition += " AND {column} = {value}"
+
+        return sql.SQL(
+            f"CREATE INDEX {{name}} ON {{table}} {definition} WHERE {condition}"
+        ).format(
+            name=sql.Identifier(self.name),
+            table=sql.Identifier(db_table),
+            column=sql.Identifier(self.column),
+            value=sql.Literal(self.value),
+        )
+
+
+def get_filter_index_from_q(
+    table_id: int, q: Any, field_name: str, model_field: django_models.Field
+) -> Optional[ViewFilterIndex]:
+    """
+    Returns the index that speeds up the provided filter of a field, if the filter
+    only compares the column of the field with a fixed value.
+
+    :param table_id: The id of the table of the field.
+    :param q: The Q or AnnotatedQ returned by the view filter type.
+    :param field_name: The name of the field in the table model.
+    :param model_field: The Django model field of the field.
+    :return: The index or None if the filter can't use an index.
+    """
+
+    # Annotations are computed for every row, so they can't be indexed.
+    if isinstance(q, AnnotatedQ):
+        if q.annotation:
+            return None
+        q = q.q
+
+    if (
+        not isinstance(q, Q)
+        or q.negated
+        or q.connector != Q.AND
+        or not q.children
+        or not all(isinstance(child, tuple) for child in q.children)
+    ):
+        return None
+
+    lookups = {}
+    for key, value in q.children:
+        name, _, lookup = key.partition("__")
+        if name not in (field_name, model_field.attname):
+            return None
+        lookups[lookup] = value
+
+    # The date filters add this lookup, which doesn't prevent using an index.
+    if lookups.get("isnull") is False:
+        del lookups["isnull"]
+
+    if len(lookups) == 1 and next(iter(lookups)) in TRIGRAM_LOOKUPS:
+        kind = TRIGRAM_LOOKUPS[next(iter(lookups))]
+        return ViewFilterIndex(table_id, kind, model_field.column)
+
+    if not lookups or not set(lookups).issubset(EQUALITY_LOOKUPS | RANGE_LOOKUPS):
+        return None
+
+    if (
+        len(lookups) == 1
+        and next(iter(lookups)) in EQUALITY_LOOKUPS
+        and isinstance(
+            model_field, (django_models.BooleanField, django_models.ForeignKey)
+        )
+    ):
+        try:
+            value = model_field.get_prep_value(next(iter(lookups.values())))
+        except (TypeError, ValueError):
+            return None
+        return ViewFilterIndex(
+            table_id, FILTER_INDEX_PARTIAL, model_field.column, value
+        )
+
+    if isinstance(model_field, (django_models.CharField, django_models.TextField)):
+        if not set(lookups).issubset(EQUALITY_LOOKUPS):
+            return None
+        return ViewFilterIndex(table_id, FILTER_INDEX_HASH, model_field.column)
+
+    return ViewFilterIndex(table_id, FILTER_INDEX_BTREE, model_field.column)
+
+
+def get_view_filter_indexes(
+    view: View, model: GeneratedTableModel
+) -> List[ViewFilterIndex]:
+    """
+    Returns the indexes that speed up the filters of the view. Only the filters
+    that are not in a group of a view with the `AND` filter type are analysed,
+    because the others don't restrict all the rows of the view on their own.
+
+    :param view: The view to get the filter indexes for.
+    :param model: The table model of the view.
+    :return: The distinct indexes of the filters of the view.
+    """
+
+    if view.filters_disabled or view.filter_type != FILTER_TYPE_AND:
+        return []
+
+    indexes = []
+    for view_filter in view.viewfilter_set.all():
+        if view_filter.group_id is not None:
+            continue
+
+        try:
+            q = get_q_from_view_filter(view_filter, model)
+        except Exception:  # nosec
+            # Filters that are invalid for their field don't filter anything.
+            continue
+
+        field_name = model._field_objects[view_filter.field_id]["name"]
+        index = get_filter_index_from_q(
+            view.table_id, q, field_name, model._meta.get_field(field_name)
+        )
+        if index is not None and index not in indexes:
+            indexes.append(index)
+
+    return indexes
+
+
+def get_drop_filter_index_sql(index_name: str) -> sql.Composed:
+    """
+    Returns the SQL dropping the filter index with the provided name.
+
+    :param index_name: The name of the index.
+    :return: The SQL dropping the index.
+    """
+
+    return sql.SQL("DROP INDEX IF EXISTS {name}").format(
+        name=sql.Identifier(index_name)
+    )
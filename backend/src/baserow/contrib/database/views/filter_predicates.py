@@ -0,0 +1,364 @@
+"""
+Compiles the filters of a view to Python predicates, that check whether an already
+loaded row matches the filters without querying the database. This is used to find
+the public views where a row is visible when a real time event is sent, which
+otherwise requires one query per public view for every created, updated or deleted
+row.
+
+A predicate is derived from the Q object of a filter if it only compares the columns
+of the row with fixed values, using one of the lookups in `LOOKUPS`. Filters that
+need annotations, other tables or many to many relations can't be compiled, and the
+view must then be checked with SQL. A predicate can also return None for a specific
+row if it can't reliably compare its value, in which case the row must be checked
+with SQL as well.
+"""
+
+import operator
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Any, Callable, List, Optional
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models as django_models
+from django.db.models import Q
+
+from baserow.contrib.database.fields.field_filters import FILTER_TYPE_OR, AnnotatedQ
+from baserow.contrib.database.table.models import GeneratedTableModel
+
+from .models import View
+from .view_filter_groups import get_python_predicate_from_view_filter
+
+RowPredicate = Callable[[GeneratedTableModel], Optional[bool]]
+
+# The model fields of which the values can be compared in Python like the database
+# compares them.
+SUPPORTED_MODEL_FIELDS = (
+    django_models.BooleanField,
+    django_models.IntegerField,
+    django_models.DecimalField,
+    django_models.CharField,
+    django_models.TextField,
+    django_models.DateField,
+    django_models.ForeignKey,
+)
+TEXT_MODEL_FIELDS = (django_models.CharField, django_models.TextField)
+
+
+def match_all(row: GeneratedTableModel) -> bool:
+    """
+    The predicate of an empty filter, which doesn't filter out any row. Like the
+    empty Q objects in a `FilterBuilder`, it's ignored when combined with other
+    predicates.
+    """
+
+    return True
+
+
+def _is_ascii(value: str) -> bool:
+    # `UPPER` in PostgreSQL and `str.upper` only convert the same way for ASCII.
+    return value.isascii()
+
+
+def _comparable(row_value: Any, value: Any) -> bool:
+    if isinstance(row_value, datetime) != isinstance(value, datetime):
+        return False
+    if isinstance(row_value, datetime):
+        return (row_value.tzinfo is None) == (value.tzinfo is None)
+    return True
+
+
+def _exact(row_value: Any, value: Any) -> Optional[bool]:
+    if not _comparable(row_value, value):
+        return None
+    return row_value == value
+
+
+def _iexact(row_value: str, value: str) -> Optional[bool]:
+    if not _is_ascii(row_value) or not _is_ascii(value):
+        return None
+    return row_value.upper() == value.upper()
+
+
+def _contains(row_value: str, value: str) -> Optional[bool]:
+    return value in row_value
+
+
+def _icontains(row_value: str, value: str) -> Optional[bool]:
+    if not _is_ascii(row_value) or not _is_ascii(value):
+        return None
+    return value.upper() in row_value.upper()
+
+
+def _compare(compare_values: Callable[[Any, Any], bool]):
+    def compare(row_value: Any, value: Any) -> Optional[bool]:
+        if not _comparable(row_value, value):
+            return None
+        try:
+            return compare_values(row_value, value)
+        except TypeError:
+            return None
+
+    return compare
+
+
+_gt = _compare(operator.gt)
+_gte = _compare(operator.ge)
+_lt = _compare(operator.lt)
+_lte = _compare(operator.le)
+
+
+def _in(row_value: Any, values: List[Any]) -> Optional[bool]:
+    if not all(_comparable(row_value, value) for value in values):
+        return None
+    return row_value in values
+
+
+def _range(row_value: Any, values: List[Any]) -> Optional[bool]:
+    lower, upper = values
+    return _and([_gte(row_value, lower), _lte(row_value, upper)])
+
+
+LOOKUPS = {
+    "exact": _exact,
+    "iexact": _iexact,
+    "contains": _contains,
+    "icontains": _icontains,
+    "gt": _gt,
+    "gte": _gte,
+    "lt": _lt,
+    "lte": _lte,
+    "in": _in,
+    "range": _range,
+}
+TEXT_LOOKUPS = {"iexact", "contains", "icontains"}
+
+
+def _and(results: List[Optional[bool]]) -> Optional[bool]:
+    if False in results:
+        return False
+    if None in results:
+        return None
+    return True
+
+
+def _or(results: List[Optional[bool]]) -> Optional[bool]:
+    if True in results:
+        return True
+    if None in results:
+        return None
+    return False
+
+
+def combine_predicates(
+    predicates: List[RowPredicate], filter_type: str
+) -> RowPredicate:
+    """
+    Combines the predicates like a `FilterBuilder` combines the Q objects. The
+    predicates of empty filters are ignored and if none is left, all the rows
+    match.
+
+    :param predicates: The predicates to combine.
+    :param filter_type: Either `AND` or `OR`.
+    :return: The combined predicate.
+    """
+
+    predicates = [predicate for predicate in predicates if predicate is not match_all]
+    if not predicates:
+        return match_all
+    if len(predicates) == 1:
+        return predicates[0]
+
+    combine = _or if filter_type == FILTER_TYPE_OR else _and
+    return lambda row: combine([predicate(row) for predicate in predicates])
+
+
+def _get_model_field(
+    model: GeneratedTableModel, name: str
+) -> Optional[django_models.Field]:
+    if name == "pk":
+        return model._meta.pk
+
+    try:
+        # Also finds the foreign key columns by their `_id` name.
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _get_row_value(model_field: django_models.Field, row: GeneratedTableModel) -> Any:
+    value = model_field.to_python(getattr(row, model_field.attname))
+    if isinstance(model_field, django_models.DecimalField) and value is not None:
+        # The value is rounded when it's stored, but the value of an updated row
+        # might not have been refreshed from the database.
+        value = value.quantize(
+            Decimal(1).scaleb(-model_field.decimal_places), rounding=ROUND_HALF_UP
+        )
+    return value
+
+
+def _prepare_lookup_value(
+    model_field: django_models.Field, lookup: str, value: Any
+) -> Any:
+    if lookup in ("in", "range"):
+        return [_prepare_lookup_value(model_field, "exact", v) for v in value]
+
+    # A date compared with a datetime column, or the other way around, depends on
+    # the timezone of the database connection.
+    is_datetime_field = isinstance(model_field, django_models.DateTimeField)
+    if isinstance(value, date) and isinstance(value, datetime) != is_datetime_field:
+        raise ValueError("Dates and datetimes can't be compared with each other.")
+    if is_datetime_field and not isinstance(value, datetime):
+        raise ValueError("Only datetimes can be compared with a datetime column.")
+
+    value = model_field.to_python(value)
+    if value is None:
+        raise ValueError("Only the isnull lookup can compare with None.")
+    return value
+
+
+def _compile_lookup(
+    model: GeneratedTableModel, key: str, value: Any
+) -> Optional[RowPredicate]:
+    name, *lookups = key.split("__")
+    if len(lookups) > 1:
+        # A lookup on a related table or a transform of the column.
+        return None
+    lookup = lookups[0] if lookups else "exact"
+
+    model_field = _get_model_field(model, name)
+    if (
+        model_field is None
+        or not model_field.concrete
+        or not isinstance(model_field, SUPPORTED_MODEL_FIELDS)
+        or hasattr(value, "resolve_expression")
+    ):
+        return None
+
+    if lookup == "exact" and value is None:
+        lookup, value = "isnull", True
+
+    if lookup == "isnull":
+        compare = None
+    elif lookup in LOOKUPS and (
+        lookup not in TEXT_LOOKUPS or isinstance(model_field, TEXT_MODEL_FIELDS)
+    ):
+        compare = LOOKUPS[lookup]
+        try:
+            value = _prepare_lookup_value(model_field, lookup, value)
+        except (ValidationError, TypeError, ValueError):
+            return None
+    else:
+        return None
+
+    def predicate(row: GeneratedTableModel) -> Optional[bool]:
+        try:
+            row_value = _get_row_value(model_field, row)
+        except (ValidationError, TypeError, ValueError, InvalidOperation):
+            return None
+
+        if compare is None:
+            return (row_value is None) == bool(value)
+        # Like the database, a lookup doesn't match an empty value.
+        if row_value is None:
+            return False
+        if lookup in TEXT_LOOKUPS and not isinstance(row_value, str):
+            return None
+        return compare(row_value, value)
+
+    return predicate
+
+
+def compile_q_to_predicate(
+    model: GeneratedTableModel, q: Any
+) -> Optional[RowPredicate]:
+    """
+    Compiles the provided Q object to a predicate that checks whether a row of the
+    model matches it.
+
+    :param model: The table model of the rows that must be checked.
+    :param q: The Q or AnnotatedQ object to compile.
+    :return: The predicate or None if the Q object can't be evaluated in Python.
+    """
+
+    if isinstance(q, AnnotatedQ):
+        if q.annotation:
+            return None
+        q = q.q
+
+    if not isinstance(q, Q):
+        return None
+
+    # Like in the database, an empty Q object matches all the rows.
+    if not q.children:
+        return match_all
+
+    predicates = []
+    for child in q.children:
+        if isinstance(child, Q):
+            predicate = compile_q_to_predicate(model, child)
+        else:
+            predicate = _compile_lookup(model, *child)
+
+        if predicate is None:
+            return None
+        if predicate is match_all and q.connector == Q.OR:
+            return match_all
+        predicates.append(predicate)
+
+    predicate = combine_predicates(predicates, q.connector)
+    if not q.negated or predicate is match_all:
+        return predicate
+
+    def negated_predicate(row: GeneratedTableModel) -> Optional[bool]:
+        result = predicate(row)
+        return None if result is None else not result
+
+    return negated_predicate
+
+
+def get_view_python_predicate(
+    view: View, model: GeneratedTableModel
+) -> Optional[RowPredicate]:
+    """
+    Returns a predicate checking whether a row is visible in the view, by combining
+    the Python predicates of the view filter types like the `AdvancedFilterBuilder`
+    combines their Q objects. The filters and groups of the view should be
+    prefetched.
+
+    :param view: The view to get the predicate for.
+    :param model: The table model of the view.
+    :return: The predicate or None if a filter of the view can't be evaluated in
+        Python.
+    """
+
+    if view.filters_disabled:
+        return match_all
+
+    predicates_by_group_id = {None: []}
+    filter_type_by_group_id = {None: view.filter_type}
+    parent_group_ids = {}
+    for group in view.filter_groups.all():
+        predicates_by_group_id[group.id] = []
+        filter_type_by_group_id[group.id] = group.filter_type
+        parent_group_ids[group.id] = group.parent_group_id
+
+    for view_filter in view.viewfilter_set.all():
+        try:
+            predicate = get_python_predicate_from_view_filter(view_filter, model)
+        except Exception:  # nosec
+            # The SQL filters will handle the invalid filter.
+            return None
+        if predicate is None:
+            return None
+        predicates_by_group_id[view_filter.group_id].append(predicate)
+
+    # The groups are returned with the parent groups before their children, so
+    # they're combined the other way around.
+    for group_id in reversed(list(parent_group_ids)):
+        predicates_by_group_id[parent_group_ids[group_id]].append(
+            combine_predicates(
+                predicates_by_group_id[group_id], filter_type_by_group_id[group_id]
+            )
+        )
+
+    return combine_predicates(predicates_by_group_id[None], view.filter_type)
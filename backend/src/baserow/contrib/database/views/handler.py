@@ -6,14 +6,16 @@ from copy import deepcopy
 from dataclasses import dataclass
 from hashlib import shake_128
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+from uuid import uuid4
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
-from django.db import connection
+from django.db import DatabaseError, connection
 from django.db import models as django_models
+from django.db import transaction
 from django.db.models import Count, Q
 from django.db.models.expressions import F, OrderBy
 from django.db.models.query import QuerySet
@@ -25,6 +27,7 @@ from redis.exceptions import LockNotOwnedError
 
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_AND,
@@ -86,7 +89,7 @@ from baserow.contrib.database.views.view_filter_groups import (
     ViewGroupedFiltersAdapter,
     construct_filter_builder_from_grouped_api_filters,
 )
-from baserow.core.db import specific_iterator
+from baserow.core.db import get_estimated_row_count, sample_queryset, specific_iterator
 from baserow.core.handler import CoreHandler
 from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.trash.handler import TrashHandler
@@ -100,9 +103,11 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationTypeDoesNotExist,
     CannotShareViewTypeError,
     DecoratorValueProviderTypeNotCompatible,
     FieldAggregationNotSupported,
+    IncrementalAggregationUpdateNotPossible,
     NoAuthorizationToPubliclySharedView,
     UnrelatedFieldError,
     ViewDecorationDoesNotExist,
@@ -123,8 +128,16 @@ from .exceptions import (
     ViewSortFieldNotSupported,
     ViewSortNotSupported,
 )
+from .filter_indexes import (
+    FILTER_INDEX_NAME_REGEX,
+    ViewFilterIndex,
+    get_drop_filter_index_sql,
+    get_view_filter_indexes,
+)
+from .filter_predicates import get_view_python_predicate
 from .models import (
     OWNERSHIP_TYPE_COLLABORATIVE,
+    GridViewFieldOptions,
     View,
     ViewDecoration,
     ViewFilter,
@@ -133,6 +146,7 @@ from .models import (
     ViewSort,
 )
 from .registries import (
+    ViewAggregationType,
     decorator_type_registry,
     decorator_value_provider_type_registry,
     view_aggregation_type_registry,
@@ -172,6 +186,10 @@ ending_number_regex = re.compile(r"(.+) (\d+)$")
 tracer = trace.get_tracer(__name__)
 
 
+AUTO_INDEX_FILTER_SKIPPED_CACHE_KEY = "auto_index_view_filter_skipped"
+AUTO_INDEX_FILTER_SCANS_CACHE_KEY = "auto_index_view_filter_scans"
+
+
 PerViewTableIndexUpdate = namedtuple(
     "PerViewTableIndexUpdate", "all_indexes added removed"
 )
@@ -271,12 +289,22 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
         """
 
         view_type = view_type_registry.get_by_model(view)
-        if not view_type.can_sort:
-            return
 
         try:
-            db_index = cls.get_index(view, model)
-            if db_index is not None and db_index.name != view.db_index_name:
+            if view_type.can_sort:
+                db_index = cls.get_index(view, model)
+                if db_index is not None and db_index.name != view.db_index_name:
+                    cls.schedule_index_update(view)
+                    return
+
+            # The filter indexes are only compared with the names stored on the
+            # view, because checking the database on every load is too expensive.
+            if (
+                view_type.can_filter
+                and cls.filter_indexes_enabled()
+                and cls.get_filter_index_names(view, model)
+                != sorted(view.db_filter_index_names)
+            ):
                 cls.schedule_index_update(view)
         except Exception as exc:  # nosec
             logger.error(
@@ -340,6 +368,9 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
         :param view: The view that was deleted.
         """
 
+        if cls.filter_indexes_enabled():
+            cls.remove_unused_filter_indexes(view.table, exclude_view_ids=[view.id])
+
         return cls.remove_index_if_unused(view)
 
     @classmethod
@@ -351,9 +382,11 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
         :param field: The field that was deleted.
         """
 
-        views_need_to_be_updated = View.objects.filter(
-            viewsort__field_id=field.pk, db_index_name__isnull=False
-        )
+        views_filter = Q(viewsort__field_id=field.pk, db_index_name__isnull=False)
+        if cls.filter_indexes_enabled():
+            views_filter |= Q(viewfilter__field_id=field.pk)
+
+        views_need_to_be_updated = View.objects.filter(views_filter).distinct()
         for view in views_need_to_be_updated:
             cls.schedule_index_update(view)
 
@@ -468,7 +501,297 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
 
             db_index_name = cls.add_index_if_not_exists(view, model)
             view.db_index_name = db_index_name
-            view.save(update_fields=["db_index_name"])
+            update_fields = ["db_index_name"]
+
+            if cls.filter_indexes_enabled():
+                if not view.trashed:
+                    cls.add_missing_filter_indexes(view, model)
+                cls.remove_unused_filter_indexes(view.table, model)
+                # The skipped indexes are left out, so that the view is updated
+                # again when it's loaded after they can be created again.
+                view.db_filter_index_names = (
+                    [] if view.trashed else cls.get_filter_index_names(view, model)
+                )
+                update_fields.append("db_filter_index_names")
+
+            view.save(update_fields=update_fields)
+
+    @classmethod
+    def filter_indexes_enabled(cls) -> bool:
+        """
+        Returns whether the indexes for the filters of the views must be created.
+        """
+
+        return settings.AUTO_INDEX_VIEW_ENABLED and (
+            settings.AUTO_INDEX_VIEW_FILTERS_ENABLED
+        )
+
+    @classmethod
+    def get_filter_index_names(
+        cls, view: View, model: GeneratedTableModel
+    ) -> List[str]:
+        """
+        Returns the sorted names of the indexes needed by the filters of the view,
+        without checking whether they exist. The indexes that are skipped for now
+        are left out, so that the view is updated again when they can be created.
+
+        :param view: The view to get the filter index names of.
+        :param model: The table model of the view.
+        :return: The names of the filter indexes.
+        """
+
+        names = {index.name for index in get_view_filter_indexes(view, model)}
+        if not names:
+            return []
+
+        skipped = cache.get_many(
+            [cls._get_filter_index_skipped_cache_key(name) for name in names]
+        )
+        return sorted(
+            name
+            for name in names
+            if cls._get_filter_index_skipped_cache_key(name) not in skipped
+        )
+
+    @classmethod
+    def get_existing_filter_index_names(cls, table_id: int) -> Set[str]:
+        """
+        Returns the names of the filter indexes of the table that exist in the
+        database.
+
+        :param table_id: The id of the table.
+        :return: The names of the existing filter indexes.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE indexname LIKE %s",
+                [f"{ViewFilterIndex.get_name_prefix(table_id)}%"],
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    @classmethod
+    def _get_filter_index_skipped_cache_key(cls, index_name: str) -> str:
+        return f"{AUTO_INDEX_FILTER_SKIPPED_CACHE_KEY}:{index_name}"
+
+    @classmethod
+    def skip_filter_index(cls, index_name: str):
+        """
+        Prevents the filter index from being created again for a while, because it
+        couldn't be created or it was not used.
+
+        :param index_name: The name of the index to skip.
+        """
+
+        cache.set(
+            cls._get_filter_index_skipped_cache_key(index_name),
+            True,
+            timeout=settings.AUTO_INDEX_VIEW_FILTERS_RETRY_DAYS * 24 * 60 * 60,
+        )
+
+    @classmethod
+    def get_missing_filter_indexes(
+        cls, view: View, model: GeneratedTableModel
+    ) -> List[ViewFilterIndex]:
+        """
+        Returns the indexes needed by the filters of the view that don't exist
+        yet, and that have not been skipped.
+
+        :param view: The view to check the filter indexes of.
+        :param model: The table model of the view.
+        :return: The filter indexes that must be created.
+        """
+
+        indexes = get_view_filter_indexes(view, model)
+        if not indexes:
+            return []
+
+        existing = cls.get_existing_filter_index_names(view.table_id)
+        indexes = [index for index in indexes if index.name not in existing]
+        skipped = cache.get_many(
+            [cls._get_filter_index_skipped_cache_key(index.name) for index in indexes]
+        )
+        return [
+            index
+            for index in indexes
+            if cls._get_filter_index_skipped_cache_key(index.name) not in skipped
+        ]
+
+    @classmethod
+    def is_trigram_extension_available(cls) -> bool:
+        """
+        Returns whether the `pg_trgm` extension is available, and tries to create
+        it if not. Creating the extension can fail if the database user doesn't
+        have the required privileges.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is not None:
+                return True
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            return True
+        except DatabaseError as exc:
+            logger.warning(
+                "The pg_trgm extension could not be created because of {e}",
+                e=str(exc),
+            )
+            return False
+
+    @classmethod
+    def add_missing_filter_indexes(
+        cls, view: View, model: GeneratedTableModel
+    ) -> List[str]:
+        """
+        Creates the missing indexes for the filters of the view. An index that
+        can't be created is skipped, so that it's not tried again every time the
+        view is loaded.
+
+        :param view: The view to create the filter indexes for.
+        :param model: The table model of the view.
+        :return: The names of the created indexes.
+        """
+
+        indexes = cls.get_missing_filter_indexes(view, model)
+        if any(index.requires_trigram_extension for index in indexes):
+            if not cls.is_trigram_extension_available():
+                for index in indexes:
+                    if index.requires_trigram_extension:
+                        cls.skip_filter_index(index.name)
+                indexes = [
+                    index for index in indexes if not index.requires_trigram_extension
+                ]
+
+        created = []
+        for index in indexes:
+            try:
+                with safe_django_schema_editor() as schema_editor:
+                    schema_editor.execute(index.get_create_sql(model._meta.db_table))
+            except DatabaseError as exc:
+                cls.skip_filter_index(index.name)
+                logger.warning(
+                    "Failed to create filter index {db_index_name} because of {e}",
+                    db_index_name=index.name,
+                    e=str(exc),
+                )
+                continue
+
+            created.append(index.name)
+            logger.info(
+                "Created filter index {db_index_name} for view {view_pk} of table "
+                "{view_table_id}",
+                db_index_name=index.name,
+                view_pk=view.pk,
+                view_table_id=view.table_id,
+            )
+
+        return created
+
+    @classmethod
+    def remove_unused_filter_indexes(
+        cls,
+        table: Table,
+        model: Optional[GeneratedTableModel] = None,
+        exclude_view_ids: Iterable[int] = (),
+    ) -> List[str]:
+        """
+        Removes the filter indexes of the table that are not needed anymore by the
+        filters of any view of the table. The indexes are shared between the views,
+        so an index is only removed when no view needs it.
+
+        :param table: The table to remove the unused filter indexes of.
+        :param model: The model to use for the table. If not provided it will be
+            generated.
+        :param exclude_view_ids: The ids of the views that must not be considered,
+            for example because they're about to be deleted.
+        :return: The names of the removed indexes.
+        """
+
+        existing = cls.get_existing_filter_index_names(table.id)
+        if not existing:
+            return []
+
+        if model is None:
+            model = table.get_model()
+
+        views = (
+            View.objects.filter(table_id=table.id)
+            .exclude(id__in=exclude_view_ids)
+            .prefetch_related("viewfilter_set")
+        )
+        needed = {
+            index.name
+            for view in views
+            for index in get_view_filter_indexes(view, model)
+        }
+
+        unused = sorted(existing - needed)
+        for index_name in unused:
+            with safe_django_schema_editor() as schema_editor:
+                schema_editor.execute(get_drop_filter_index_sql(index_name))
+            logger.info(
+                "Removed filter index {db_index_name} of table {table_id}",
+                db_index_name=index_name,
+                table_id=table.id,
+            )
+
+        return unused
+
+    @classmethod
+    def drop_unused_filter_indexes(cls) -> List[str]:
+        """
+        Drops the filter indexes that have not been scanned by any query since the
+        previous call, based on the `pg_stat_user_indexes` statistics. The dropped
+        indexes are skipped, so that they're not created again right away, and
+        removed from the index names stored on the views.
+
+        :return: The names of the dropped indexes.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexrelname, idx_scan FROM pg_stat_user_indexes "
+                "WHERE indexrelname ~ %s",
+                [FILTER_INDEX_NAME_REGEX],
+            )
+            scans = dict(cursor.fetchall())
+
+        previous_scans = cache.get(AUTO_INDEX_FILTER_SCANS_CACHE_KEY, {})
+        dropped = []
+        for index_name, index_scans in scans.items():
+            # Indexes created after the previous call are kept until the next one.
+            if previous_scans.get(index_name) != index_scans:
+                continue
+
+            with safe_django_schema_editor() as schema_editor:
+                schema_editor.execute(get_drop_filter_index_sql(index_name))
+            cls.skip_filter_index(index_name)
+            dropped.append(index_name)
+            logger.info(
+                "Dropped filter index {db_index_name} because it was not used",
+                db_index_name=index_name,
+            )
+
+        if dropped:
+            for view in View.objects.filter(db_filter_index_names__overlap=dropped):
+                view.db_filter_index_names = [
+                    name for name in view.db_filter_index_names if name not in dropped
+                ]
+                view.save(update_fields=["db_filter_index_names"])
+
+        cache.set(
+            AUTO_INDEX_FILTER_SCANS_CACHE_KEY,
+            {
+                index_name: index_scans
+                for index_name, index_scans in scans.items()
+                if index_name not in dropped
+            },
+            timeout=None,
+        )
+        return dropped
 
 
 class ViewHandler(metaclass=baserow_trace_methods(tracer)):
@@ -860,7 +1183,13 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if "filters_disabled" in view_values:
             view_type.after_filter_update(view)
 
-        view_updated.send(self, view=view, user=user)
+        view_updated.send(
+            self,
+            view=view,
+            user=user,
+            original_view_attributes=original_view_values,
+            new_view_attributes=new_view_values,
+        )
 
         return UpdatedViewWithChangedAttributes(
             updated_view_instance=view,
@@ -2471,6 +2800,181 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
         return queryset
 
+    def _get_table_row_count_version_cache_key(self, table_id: int) -> str:
+        return f"table_{table_id}_row_count_version"
+
+    def _get_table_row_count_version(self, table_id: int) -> str:
+        """
+        Returns the version of the rows of the table, which changes every time rows
+        are created, updated or deleted. It's part of the cache key of the exact row
+        counts, so that the counts computed before the change aren't used anymore.
+        """
+
+        cache_key = self._get_table_row_count_version_cache_key(table_id)
+        cache.add(cache_key, uuid4().hex, timeout=None)
+        return cache.get(cache_key)
+
+    def invalidate_exact_row_counts(self, table_id: int):
+        """
+        Invalidates the cached exact row counts of all the views of the table by
+        changing the version of its rows.
+
+        :param table_id: The id of the table of which the rows have changed.
+        """
+
+        cache.set(
+            self._get_table_row_count_version_cache_key(table_id),
+            uuid4().hex,
+            timeout=None,
+        )
+
+    def invalidate_exact_row_counts_on_commit(self, table_ids: Iterable[int]):
+        """
+        Invalidates the cached exact row counts of the provided tables once the
+        current transaction is committed. A count that's computed by the background
+        task before the changes are visible is therefore never used.
+
+        :param table_ids: The ids of the tables of which the rows have changed.
+        """
+
+        table_ids = set(table_ids)
+        if not table_ids:
+            return
+
+        def invalidate():
+            for table_id in table_ids:
+                self.invalidate_exact_row_counts(table_id)
+
+        transaction.on_commit(invalidate)
+
+    def _get_exact_row_count_cache_key(self, view: View, count_sql: str) -> str:
+        """
+        Returns the cache key of the exact row count of the provided view. Because
+        the filters, search and ad hoc filters are all part of the compiled count
+        query, its hash is used to distinguish between them.
+        """
+
+        version = self._get_table_row_count_version(view.table_id)
+        count_sql_hash = shake_128(count_sql.encode("utf-8")).hexdigest(10)
+        return f"view_{view.id}_exact_row_count_{version}_{count_sql_hash}"
+
+    def _get_count_sql(self, queryset: QuerySet) -> Tuple[str, Iterable[Any], str]:
+        """
+        Compiles the query selecting the ids of the rows of the queryset.
+
+        :return: The compiled query, its params and the query with the params
+            interpolated.
+        """
+
+        sql, params = queryset.order_by().values("id").query.sql_with_params()
+        with connection.cursor() as cursor:
+            count_sql = cursor.mogrify(sql, params).decode("utf-8")
+        return sql, params, count_sql
+
+    def get_queryset_row_count(
+        self,
+        view: View,
+        queryset: QuerySet,
+        estimate: bool = False,
+        search: Optional[str] = None,
+        search_mode: Optional[SearchModes] = None,
+    ) -> Tuple[int, bool]:
+        """
+        Counts the rows of a queryset of the provided view. If `estimate` is true and
+        the table is large, an estimate is returned instead of running an exact
+        `COUNT(*)` over the filtered rows. If the queryset isn't filtered, the
+        estimate is based on the planner statistics of the table, otherwise the
+        filters are applied to a `TABLESAMPLE` of the table.
+
+        If the queryset is the one returned by `get_queryset` for the view, search
+        and search mode, the exact count is computed in the background at the same
+        time and cached until rows of the table change, so that it can be returned
+        instead of an estimate by the next requests.
+
+        :param view: The view that the queryset belongs to.
+        :param queryset: The queryset of the view that must be counted, typically
+            with the filters and search already applied.
+        :param estimate: Whether an estimate is allowed for large tables.
+        :param search: The search term applied to the queryset.
+        :param search_mode: The search mode applied to the queryset.
+        :return: The (estimated) count and whether it's an estimate.
+        """
+
+        if not estimate:
+            return queryset.count(), False
+
+        model = queryset.model
+        table_row_estimate = get_estimated_row_count(model)
+        if table_row_estimate < settings.BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD:
+            return queryset.count(), False
+
+        sql, _, count_sql = self._get_count_sql(queryset)
+        cache_key = self._get_exact_row_count_cache_key(view, count_sql)
+        exact_count = cache.get(cache_key)
+        if exact_count is not None:
+            return exact_count, False
+
+        # The pending key is also kept if the queryset can't be rebuilt by the
+        # task, so that it isn't compared again until it expires.
+        if cache.add(
+            f"{cache_key}_pending",
+            True,
+            timeout=settings.BASEROW_EXACT_ROW_COUNT_CACHE_TIMEOUT,
+        ):
+            view_queryset = self.get_queryset(
+                view, search, model, search_mode=search_mode
+            )
+            if self._get_count_sql(view_queryset)[2] == count_sql:
+                from baserow.contrib.database.views.tasks import (
+                    compute_exact_view_row_count,
+                )
+
+                transaction.on_commit(
+                    lambda: compute_exact_view_row_count.delay(
+                        cache_key, view.id, search, search_mode
+                    )
+                )
+
+        unfiltered_queryset = model.objects.order_by().values("id")
+        unfiltered_sql, _ = unfiltered_queryset.query.sql_with_params()
+        if sql == unfiltered_sql:
+            return table_row_estimate, True
+
+        sampled_count = self._count_table_sample(queryset, table_row_estimate)
+        if sampled_count is None:
+            return queryset.count(), False
+        return sampled_count, True
+
+    def _count_table_sample(
+        self, queryset: QuerySet, table_row_estimate: int
+    ) -> Optional[int]:
+        """
+        Estimates the number of rows of the provided queryset by counting its rows
+        in a `TABLESAMPLE` of the table, and scaling the matches by the total number
+        of estimated rows in the table.
+
+        :param queryset: The queryset of which the rows must be counted.
+        :param table_row_estimate: The estimated number of rows in the table.
+        :return: The estimated count or None if no rows were sampled.
+        """
+
+        sample_percentage = min(
+            100.0,
+            settings.BASEROW_ESTIMATED_ROW_COUNT_SAMPLE_SIZE * 100 / table_row_estimate,
+        )
+        # The same seed is used for both queries so that the same pages are
+        # sampled, and the estimate doesn't change between requests.
+        sampled_rows = sample_queryset(
+            queryset.model.objects_and_trash.all(), sample_percentage, seed=0
+        ).count()
+        if not sampled_rows:
+            return None
+        sampled_matches = sample_queryset(
+            queryset.order_by(), sample_percentage, seed=0
+        ).count()
+
+        return round(sampled_matches * table_row_estimate / sampled_rows)
+
     def _get_aggregation_lock_cache_key(self, view: View):
         """
         Returns the aggregation lock cache key for the specified view.
@@ -2492,6 +2996,14 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_version__{view.pk}_{name}"
 
+    def _get_table_has_cached_aggregations_cache_key(self, table_id: int):
+        """
+        Returns the cache key that marks that aggregation values of the views of the
+        specified table have been cached.
+        """
+
+        return f"aggregation_table__{table_id}_has_cached_values"
+
     def clear_full_aggregation_cache(self, view: View):
         """
         Clears the cache key for the specified view.
@@ -2574,6 +3086,314 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return (valid_cached_values, need_computation)
 
+    def _get_incrementally_updatable_aggregations(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        already_invalidated: bool = False,
+    ) -> List["IncrementalAggregationUpdate"]:
+        """
+        Returns the aggregations of the views of the table that support incremental
+        updates and have a valid value in the cache.
+
+        :param table: The table whose views must be checked.
+        :param model: The model of the table.
+        :param already_invalidated: Whether the aggregations have already been
+            invalidated once for the current change. In that case the cached value
+            is expected to be exactly one version behind.
+        :return: The aggregations that can be updated incrementally.
+        """
+
+        # Finding the candidates requires a few queries, which are not needed if none
+        # of the views of the table has any cached aggregation value.
+        if not cache.get(self._get_table_has_cached_aggregations_cache_key(table.id)):
+            return []
+
+        for field_object in model._field_objects.values():
+            if getattr(field_object["field"], "is_self_referencing", False):
+                # A change of a row can change the values of other rows of the same
+                # table, so the changed rows alone can't be used to compute the
+                # difference.
+                return []
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table_id=table.id)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view")
+        )
+
+        candidates = []
+        for options in field_options:
+            try:
+                aggregation_type = view_aggregation_type_registry.get(
+                    options.aggregation_raw_type
+                )
+            except AggregationTypeDoesNotExist:
+                continue
+            field_object = model._field_objects.get(options.field_id)
+            if (
+                aggregation_type.incremental_update_supported
+                and field_object is not None
+            ):
+                candidates.append(
+                    (options.grid_view, field_object["field"], aggregation_type)
+                )
+
+        if not candidates:
+            return []
+
+        # Fields that depend on other rows through a link, and the filters on those
+        # fields, can change for rows that are not changed themselves. Those must
+        # always be computed from scratch.
+        non_local_field_ids = self._get_field_ids_depending_on_other_rows(table, model)
+        if non_local_field_ids:
+            views_with_non_local_filters = set(
+                ViewFilter.objects.filter(
+                    view_id__in={view.id for view, _, _ in candidates},
+                    field_id__in=non_local_field_ids,
+                ).values_list("view_id", flat=True)
+            )
+            candidates = [
+                (view, field, aggregation_type)
+                for view, field, aggregation_type in candidates
+                if field.id not in non_local_field_ids
+                and view.id not in views_with_non_local_filters
+            ]
+
+        cache_keys = []
+        for view, field, _ in candidates:
+            cache_keys.append(
+                self._get_aggregation_value_cache_key(view, field.db_column)
+            )
+            cache_keys.append(
+                self._get_aggregation_version_cache_key(view, field.db_column)
+            )
+        cached = cache.get_many(cache_keys)
+
+        updatable = []
+        for view, field, aggregation_type in candidates:
+            cached_value = cached.get(
+                self._get_aggregation_value_cache_key(view, field.db_column)
+            )
+            version = cached.get(
+                self._get_aggregation_version_cache_key(view, field.db_column), 1
+            )
+            if already_invalidated:
+                version -= 1
+            if cached_value is not None and cached_value["version"] == version:
+                updatable.append(
+                    IncrementalAggregationUpdate(
+                        view=view,
+                        field=field,
+                        aggregation_type=aggregation_type,
+                        value=cached_value["value"],
+                        version=version,
+                    )
+                )
+
+        return updatable
+
+    def _get_field_ids_depending_on_other_rows(
+        self, table: Table, model: GeneratedTableModel
+    ) -> Set[int]:
+        """
+        Returns the ids of the fields of the table whose cell values can change
+        without the row itself being changed, because they depend on other rows
+        through a link, or on the current time.
+        """
+
+        field_ids = {
+            field_object["field"].id
+            for field_object in model._field_objects.values()
+            if getattr(field_object["field"], "needs_periodic_update", False)
+        }
+        dependencies = list(
+            FieldDependency.objects.filter(dependant__table_id=table.id).values_list(
+                "dependant_id", "dependency_id", "via_id"
+            )
+        )
+        field_ids.update(
+            dependant_id
+            for dependant_id, _, via_id in dependencies
+            if via_id is not None
+        )
+
+        changed = True
+        while changed:
+            changed = False
+            for dependant_id, dependency_id, _ in dependencies:
+                if dependency_id in field_ids and dependant_id not in field_ids:
+                    field_ids.add(dependant_id)
+                    changed = True
+
+        return field_ids
+
+    def _aggregate_changed_rows(
+        self,
+        aggregation_updates: List["IncrementalAggregationUpdate"],
+        model: GeneratedTableModel,
+        row_ids: List[int],
+    ) -> Dict[Tuple[int, str], Any]:
+        """
+        Computes the aggregations of the provided rows, taking the filters of the
+        views into account. Only one query per view is needed.
+
+        :return: A dict where the key is a (view_id, field_name) tuple and the value
+            is the aggregation of the rows.
+        """
+
+        updates_per_view = defaultdict(list)
+        for update in aggregation_updates:
+            updates_per_view[update.view.id].append(update)
+
+        result = {}
+        for updates in updates_per_view.values():
+            view = updates[0].view
+            queryset = self.apply_filters(
+                view, model.objects.filter(id__in=row_ids).enhance_by_fields()
+            )
+            values = self._aggregate_queryset(
+                view,
+                model,
+                queryset,
+                [(update.field, update.aggregation_type.type) for update in updates],
+            )
+            for name, value in values.items():
+                result[(view.id, name)] = value
+        return result
+
+    def prepare_incremental_aggregation_update(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        rows: Optional[List[GeneratedTableModel]] = None,
+    ) -> List["IncrementalAggregationUpdate"]:
+        """
+        Must be called right before the provided rows are updated or deleted, or
+        right after they have been created (`rows` is None in that case). Collects
+        the cached aggregations that can be updated incrementally and the
+        aggregations of the rows before they change. The returned list must be passed
+        into `apply_incremental_aggregation_update` after the change.
+
+        :param table: The table of the rows.
+        :param model: The model of the table.
+        :param rows: The rows that are going to change, or None if the rows are
+            created.
+        :return: A list of pending incremental aggregation updates.
+        """
+
+        aggregation_updates = self._get_incrementally_updatable_aggregations(
+            table, model, already_invalidated=rows is None
+        )
+
+        if rows is not None and aggregation_updates:
+            removed_values = self._aggregate_changed_rows(
+                aggregation_updates, model, [row.id for row in rows]
+            )
+            for update in aggregation_updates:
+                update.removed_value = removed_values[
+                    (update.view.id, update.field.db_column)
+                ]
+
+        return aggregation_updates
+
+    def apply_incremental_aggregation_update(
+        self,
+        aggregation_updates: List["IncrementalAggregationUpdate"],
+        model: GeneratedTableModel,
+        rows: List[GeneratedTableModel],
+    ):
+        """
+        Computes the new values of the aggregations prepared by
+        `prepare_incremental_aggregation_update` using the aggregation of the changed
+        rows, and stores them in the cache when the transaction commits. This
+        prevents computing the aggregation for all the rows of the view again when the
+        footer is requested.
+
+        A value is only stored if the aggregation has been invalidated exactly once
+        since it was prepared, which is the invalidation of this change. In any other
+        case, for example if another change happened concurrently, the aggregation
+        stays invalidated and is computed from scratch. Aggregations that are affected
+        by the change, but were not invalidated by it, are invalidated here.
+
+        :param aggregation_updates: The pending updates returned by
+            `prepare_incremental_aggregation_update`.
+        :param model: The model of the table.
+        :param rows: The rows after they have been created, updated or deleted.
+        """
+
+        if not aggregation_updates:
+            return
+
+        added_values = self._aggregate_changed_rows(
+            aggregation_updates, model, [row.id for row in rows]
+        )
+        versions = cache.get_many(
+            [
+                self._get_aggregation_version_cache_key(
+                    update.view, update.field.db_column
+                )
+                for update in aggregation_updates
+            ]
+        )
+
+        to_cache = {}
+        to_invalidate = defaultdict(list)
+        for update in aggregation_updates:
+            name = update.field.db_column
+            current_version = versions.get(
+                self._get_aggregation_version_cache_key(update.view, name), 1
+            )
+            try:
+                new_value = update.aggregation_type.get_incrementally_updated_value(
+                    update.value,
+                    update.removed_value,
+                    added_values[(update.view.id, name)],
+                )
+            except IncrementalAggregationUpdateNotPossible:
+                if current_version == update.version:
+                    to_invalidate[update.view].append(name)
+                continue
+
+            if current_version == update.version:
+                # The change didn't invalidate this aggregation, but it can still
+                # affect it, for example if a row doesn't match the filters of the
+                # view anymore.
+                if new_value == update.value:
+                    continue
+                to_invalidate[update.view].append(name)
+
+            if current_version <= update.version + 1:
+                to_cache[(update.view, name)] = (new_value, update.version + 1)
+
+        for view, names in to_invalidate.items():
+            self.clear_aggregation_cache(view, names)
+
+        def store_values():
+            version_keys = {
+                (view, name): self._get_aggregation_version_cache_key(view, name)
+                for view, name in to_cache.keys()
+            }
+            versions = cache.get_many(list(version_keys.values()))
+            values_to_cache = {
+                self._get_aggregation_value_cache_key(view, name): {
+                    "value": value,
+                    "version": version,
+                }
+                for (view, name), (value, version) in to_cache.items()
+                if versions.get(version_keys[(view, name)], 1) == version
+            }
+            if values_to_cache:
+                values_to_cache[
+                    self._get_table_has_cached_aggregations_cache_key(
+                        model.baserow_table_id
+                    )
+                ] = True
+                cache.set_many(values_to_cache)
+
+        if to_cache:
+            transaction.on_commit(store_values)
+
     def get_view_field_aggregations(
         self,
         user: AbstractUser,
@@ -2673,7 +3493,11 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                         }
 
                 # Let's cache the newly computed values
-                cache.set_many(to_cache)
+                if to_cache:
+                    to_cache[
+                        self._get_table_has_cached_aggregations_cache_key(view.table_id)
+                    ] = True
+                    cache.set_many(to_cache)
 
             # Merged cached values and computed one
             values.update(db_result)
@@ -2747,6 +3571,33 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if search is not None:
             queryset = queryset.search_all_fields(search, search_mode=search_mode)
 
+        return self._aggregate_queryset(
+            view, model, queryset, aggregations, with_total=with_total
+        )
+
+    def _aggregate_queryset(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        queryset: QuerySet,
+        aggregations: Iterable[Tuple[django_models.Field, str]],
+        with_total: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Computes the provided (field_instance, aggregation_type) couples of the
+        rows in the queryset.
+
+        :param view: The view the aggregations belong to.
+        :param model: The model of the view table.
+        :param queryset: The already filtered queryset that must be aggregated.
+        :param aggregations: A list of (field_instance, aggregation_type).
+        :param with_total: Whether the total row count should be returned in the
+            result.
+        :raises FieldNotInTable: When one of the field doesn't belong to the specified
+            view.
+        :return: A dict of aggregation values.
+        """
+
         aggregation_dict = {}
 
         for field_instance, aggregation_type_name in aggregations:
@@ -3196,6 +4047,21 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         }
 
 
+@dataclass
+class IncrementalAggregationUpdate:
+    """
+    A cached aggregation of a view that is going to be updated incrementally after
+    rows of the table have changed.
+    """
+
+    view: View
+    field: Field
+    aggregation_type: ViewAggregationType
+    value: Any
+    version: int
+    removed_value: Any = None
+
+
 @dataclass
 class PublicViewRows:
     """
@@ -3222,7 +4088,9 @@ class CachingPublicViewRowChecker:
     A helper class to check which public views a row is visible in. Will pre-calculate
     upfront for a specific table which public views are always visible, which public
     views can have row check results cached for and finally will pre-construct and
-    reuse querysets for performance reasons.
+    reuse querysets for performance reasons. If all the filters of a view can be
+    evaluated in Python, the already loaded rows are checked without querying the
+    database.
     """
 
     def __init__(
@@ -3265,6 +4133,7 @@ class CachingPublicViewRowChecker:
                     (
                         view,
                         filter_qs,
+                        get_view_python_predicate(view, model),
                         self._view_row_checks_can_be_cached(view),
                     )
                 )
@@ -3285,15 +4154,15 @@ class CachingPublicViewRowChecker:
         """
 
         views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
+        for view, filter_qs, predicate, can_use_cache in self._views_with_filters:
             if can_use_cache:
                 if row.id not in self._view_row_check_cache[view.id]:
                     self._view_row_check_cache[view.id][
                         row.id
-                    ] = self._check_row_visible(filter_qs, row)
+                    ] = self._check_row_visible(filter_qs, predicate, row)
                 if self._view_row_check_cache[view.id][row.id]:
                     views.append(view)
-            elif self._check_row_visible(filter_qs, row):
+            elif self._check_row_visible(filter_qs, predicate, row):
                 views.append(view)
 
         return views + self._always_visible_views
@@ -3316,11 +4185,13 @@ class CachingPublicViewRowChecker:
 
         visible_views_rows = []
         row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
+        for view, filter_qs, predicate, can_use_cache in self._views_with_filters:
             if can_use_cache:
                 for id in row_ids:
                     if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
+                        visible_ids = set(
+                            self._check_rows_visible(filter_qs, predicate, rows)
+                        )
                         for visible_id in visible_ids:
                             self._view_row_check_cache[view.id][visible_id] = True
                         break
@@ -3331,7 +4202,7 @@ class CachingPublicViewRowChecker:
                     visible_views_rows.append(PublicViewRows(view, visible_ids))
 
             else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
+                visible_ids = set(self._check_rows_visible(filter_qs, predicate, rows))
                 if len(visible_ids) > 0:
                     visible_views_rows.append(PublicViewRows(view, visible_ids))
 
@@ -3343,14 +4214,35 @@ class CachingPublicViewRowChecker:
         return visible_views_rows
 
     # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
+    def _check_row_visible_in_python(self, predicate, row) -> Optional[bool]:
+        # The trashed rows are excluded by the manager of the filter queryset.
+        if predicate is None or getattr(row, "trashed", False):
+            return None
+        return predicate(row)
+
+    def _check_row_visible(self, filter_qs, predicate, row):
+        visible = self._check_row_visible_in_python(predicate, row)
+        if visible is not None:
+            return visible
         return filter_qs.filter(id=row.id).exists()
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
-        )
+    def _check_rows_visible(self, filter_qs, predicate, rows):
+        visible_ids = []
+        rows_to_check_in_db = []
+        for row in rows:
+            visible = self._check_row_visible_in_python(predicate, row)
+            if visible is None:
+                rows_to_check_in_db.append(row)
+            elif visible:
+                visible_ids.append(row.id)
+
+        if rows_to_check_in_db:
+            visible_ids.extend(
+                filter_qs.filter(
+                    id__in=[row.id for row in rows_to_check_in_db]
+                ).values_list("id", flat=True)
+            )
+        return visible_ids
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
@@ -5,6 +5,7 @@ from typing import Iterable, Optional, Union
 from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.db.models import Q
 from django.utils.functional import lazy
@@ -125,6 +126,13 @@ class View(
         help_text="The name of the database index that is used to speed up the "
         "filtering of the view.",
     )
+    db_filter_index_names = ArrayField(
+        models.CharField(max_length=63),
+        default=list,
+        blank=True,
+        help_text="The names of the database indexes needed by the filters of the "
+        "view, when they were last updated.",
+    )
 
     @property
     def public_view_has_password(self) -> bool:
@@ -53,7 +53,7 @@ from .exceptions import (
 
 if TYPE_CHECKING:
     from baserow.contrib.database.fields.models import Field
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
     from baserow.contrib.database.views.models import FormView, View
 
 
@@ -830,6 +830,42 @@ class ViewFilterType(Instance):
 
         raise NotImplementedError("Each must have his own get_filter method.")
 
+    def get_python_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[Callable[["GeneratedTableModel"], Optional[bool]]]:
+        """
+        Optionally returns a function that checks whether an already loaded row
+        matches the filter, without querying the database. It's used to find the
+        public views where a row is visible when sending real time events. By default
+        it's derived from the Q object returned by `get_filter`, if that only
+        compares the column of the field with a fixed value. The predicate can return
+        None if it can't check a specific row.
+
+        :param field_name: The name of the field that needs to be filtered.
+        :type field_name: str
+        :param value: The value that the field must be compared to.
+        :type value: str
+        :param model_field: The field extracted from the model.
+        :type model_field: models.Field
+        :param field: The instance of the underlying baserow field.
+        :type field: Field
+        :return: The predicate or None if the filter must be applied with SQL.
+        """
+
+        from baserow.contrib.database.fields.registries import field_type_registry
+        from baserow.contrib.database.views.filter_predicates import (
+            compile_q_to_predicate,
+        )
+
+        # The values of the read only fields are computed by the database, so the
+        # loaded row might not contain their latest value.
+        if field_type_registry.get_by_model(field.specific_class).read_only:
+            return None
+
+        return compile_q_to_predicate(
+            model_field.model, self.get_filter(field_name, value, model_field, field)
+        )
+
     def get_preload_values(self, view_filter) -> dict:
         """
         Optionally a view filter type can preload certain values for displaying
@@ -917,6 +953,14 @@ class ViewAggregationType(Instance):
     aggregation. For example you can compute a sum of all values of a field in a table.
     """
 
+    incremental_update_supported = False
+    """
+    Indicates whether the cached value of the aggregation can be updated using the
+    aggregation of the changed rows only, instead of computing it again for all the
+    rows of the view. If True, the `get_incrementally_updated_value` method must be
+    implemented.
+    """
+
     def get_aggregation(
         self,
         field_name: str,
@@ -940,6 +984,29 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_incrementally_updated_value(
+        self, value: Any, removed_value: Any, added_value: Any
+    ) -> Any:
+        """
+        Computes the new aggregation value of all the rows of a view, based on the
+        previous value and the aggregation of the changed rows before and after the
+        change.
+
+        :param value: The previous aggregation value of all the rows.
+        :param removed_value: The aggregation of the changed rows before they were
+            changed, or None if the rows didn't exist yet.
+        :param added_value: The aggregation of the changed rows after they were
+            changed.
+        :raises IncrementalAggregationUpdateNotPossible: When the new value can't be
+            derived and must be computed for all the rows.
+        :return: The new aggregation value.
+        """
+
+        raise NotImplementedError(
+            "Aggregation types that support incremental updates must implement "
+            "the get_incrementally_updated_value method."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.rows import signals as row_signals
+from baserow.contrib.database.table import signals as table_signals
 
 from .models import GalleryView
 
@@ -63,8 +66,97 @@ def update_view_index_if_view_sort_changes(sender, view_sort, **kwargs):
     ViewIndexingHandler.schedule_index_update(view_sort.view)
 
 
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def update_view_index_if_view_filter_changes(sender, view_filter, **kwargs):
+    from baserow.contrib.database.views.handler import ViewIndexingHandler
+
+    if ViewIndexingHandler.filter_indexes_enabled():
+        ViewIndexingHandler.schedule_index_update(view_filter.view)
+
+
+@receiver(view_updated)
+def update_view_index_if_view_filter_type_changes(
+    sender, view, original_view_attributes=None, new_view_attributes=None, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewIndexingHandler
+
+    if original_view_attributes is None or new_view_attributes is None:
+        return
+
+    filters_changed = any(
+        original_view_attributes.get(key) != new_view_attributes.get(key)
+        for key in ["filter_type", "filters_disabled"]
+    )
+    if filters_changed and ViewIndexingHandler.filter_indexes_enabled():
+        ViewIndexingHandler.schedule_index_update(view)
+
+
 @receiver(view_loaded)
 def schedule_view_index_creation_if_needed(sender, view, table_model, **kwargs):
     from baserow.contrib.database.views.handler import ViewIndexingHandler
 
     ViewIndexingHandler.schedule_index_creation_if_needed(view, table_model)
+
+
+@receiver(row_signals.before_rows_update)
+@receiver(row_signals.before_rows_delete)
+def prepare_incremental_aggregation_update(sender, rows, table, model, **kwargs):
+    if not settings.BASEROW_INCREMENTAL_VIEW_AGGREGATIONS:
+        return None
+
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().prepare_incremental_aggregation_update(table, model, rows)
+
+
+@receiver(row_signals.rows_updated)
+@receiver(row_signals.rows_deleted)
+def apply_incremental_aggregation_update(
+    sender, rows, table, model, before_return, **kwargs
+):
+    aggregation_updates = dict(before_return).get(
+        prepare_incremental_aggregation_update
+    )
+    if not aggregation_updates:
+        return
+
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().apply_incremental_aggregation_update(aggregation_updates, model, rows)
+
+
+@receiver(row_signals.rows_created)
+def apply_incremental_aggregation_update_after_rows_created(
+    sender, rows, table, model, **kwargs
+):
+    if not settings.BASEROW_INCREMENTAL_VIEW_AGGREGATIONS:
+        return
+
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    handler = ViewHandler()
+    aggregation_updates = handler.prepare_incremental_aggregation_update(table, model)
+    handler.apply_incremental_aggregation_update(aggregation_updates, model, rows)
+
+
+@receiver(row_signals.rows_created)
+@receiver(row_signals.rows_updated)
+@receiver(row_signals.rows_deleted)
+@receiver(table_signals.table_updated)
+def invalidate_exact_row_counts(sender, table, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().invalidate_exact_row_counts_on_commit([table.id])
+
+
+@receiver(field_signals.field_updated)
+@receiver(field_signals.field_restored)
+@receiver(field_signals.field_deleted)
+def invalidate_exact_row_counts_after_field_change(
+    sender, field, related_fields, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().invalidate_exact_row_counts_on_commit(
+        f.table_id for f in [field, *related_fields]
+    )
@@ -1,4 +1,5 @@
 import traceback
+from typing import Optional
 
 from django.conf import settings
 from django.core.cache import cache
@@ -8,6 +9,7 @@ from celery_singleton import DuplicateTaskError, Singleton
 from loguru import logger
 
 from baserow.config.celery import app
+from baserow.contrib.database.views.exceptions import ViewDoesNotExist
 from baserow.contrib.database.views.handler import ViewHandler, ViewIndexingHandler
 from baserow.contrib.database.views.models import View
 
@@ -36,7 +38,7 @@ def update_view_index(view_id: int):
         view = ViewHandler().get_view(
             view_id,
             base_queryset=View.objects.prefetch_related(
-                "viewsort_set", "viewgroupby_set"
+                "viewsort_set", "viewgroupby_set", "viewfilter_set"
             ),
         )
         ViewIndexingHandler.update_index(view)
@@ -93,3 +95,66 @@ def schedule_view_index_update(view_id: int):
         return
 
     transaction.on_commit(lambda: _schedule_view_index_update(view_id))
+
+
+@app.task(
+    base=Singleton,
+    queue="export",
+    lock_expiry=settings.AUTO_INDEX_LOCK_EXPIRY,
+)
+def drop_unused_view_filter_indexes():
+    """
+    Drops the automatically created filter indexes of the views that have not been
+    used since the previous run of this task.
+    """
+
+    if not ViewIndexingHandler.filter_indexes_enabled():
+        return
+
+    ViewIndexingHandler.drop_unused_filter_indexes()
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        settings.AUTO_INDEX_VIEW_FILTERS_UNUSED_CRONTAB,
+        drop_unused_view_filter_indexes.s(),
+    )
+
+
+@app.task(queue="export")
+def compute_exact_view_row_count(
+    cache_key: str,
+    view_id: int,
+    search: Optional[str] = None,
+    search_mode: Optional[str] = None,
+):
+    """
+    Computes the exact number of rows of the view and caches it, so that it can be
+    returned instead of an estimate by `ViewHandler.get_queryset_row_count`.
+
+    :param cache_key: The key where the exact count must be cached. The count
+        isn't cached if the key doesn't match anymore, because the rows or the
+        filters of the view have changed in the meantime.
+    :param view_id: The id of the view of which the rows must be counted.
+    :param search: The search term that must be applied to the rows.
+    :param search_mode: The search mode that must be used for the search.
+    """
+
+    handler = ViewHandler()
+    try:
+        view = handler.get_view(view_id).specific
+        queryset = handler.get_queryset(view, search, search_mode=search_mode)
+        # The version of the rows is part of the key, and it's computed before
+        # counting, so that rows changed during the count invalidate it.
+        count_sql = handler._get_count_sql(queryset)[2]
+        if handler._get_exact_row_count_cache_key(view, count_sql) == cache_key:
+            cache.set(
+                cache_key,
+                queryset.count(),
+                timeout=settings.BASEROW_EXACT_ROW_COUNT_CACHE_TIMEOUT,
+            )
+    except ViewDoesNotExist:
+        pass
+    finally:
+        cache.delete(f"{cache_key}_pending")
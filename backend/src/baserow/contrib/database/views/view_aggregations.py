@@ -47,6 +47,7 @@ from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaSingleFileType,
 )
 
+from .exceptions import IncrementalAggregationUpdateNotPossible
 from .registries import ViewAggregationType
 from .utils import AnnotatedAggregation
 
@@ -66,6 +67,38 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
+def get_incrementally_updated_min(value, removed_value, added_value):
+    """
+    Returns the new minimum of all the values if the values of `removed_value` are
+    replaced by `added_value`. If the current minimum could have been removed, the new
+    minimum can't be known without checking all the values again.
+    """
+
+    if removed_value is not None and (value is None or removed_value <= value):
+        raise IncrementalAggregationUpdateNotPossible()
+    if added_value is None:
+        return value
+    if value is None:
+        return added_value
+    return min(value, added_value)
+
+
+def get_incrementally_updated_max(value, removed_value, added_value):
+    """
+    Returns the new maximum of all the values if the values of `removed_value` are
+    replaced by `added_value`. If the current maximum could have been removed, the new
+    maximum can't be known without checking all the values again.
+    """
+
+    if removed_value is not None and (value is None or removed_value >= value):
+        raise IncrementalAggregationUpdateNotPossible()
+    if added_value is None:
+        return value
+    if value is None:
+        return added_value
+    return max(value, added_value)
+
+
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
@@ -73,6 +106,7 @@ class EmptyCountViewAggregationType(ViewAggregationType):
     """
 
     type = "empty_count"
+    incremental_update_supported = True
 
     compatible_field_types = [
         TextFieldType.type,
@@ -120,6 +154,9 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        return value - (removed_value or 0) + added_value
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -190,6 +227,7 @@ class MinViewAggregationType(ViewAggregationType):
     """
 
     type = "min"
+    incremental_update_supported = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -207,6 +245,9 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        return get_incrementally_updated_min(value, removed_value, added_value)
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -214,6 +255,7 @@ class MaxViewAggregationType(ViewAggregationType):
     """
 
     type = "max"
+    incremental_update_supported = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -231,6 +273,9 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        return get_incrementally_updated_max(value, removed_value, added_value)
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -238,6 +283,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    incremental_update_supported = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -250,6 +296,14 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        new_value = (value or 0) - (removed_value or 0) + (added_value or 0)
+        if new_value == 0:
+            # A sum of zero can't be distinguished from a sum without any value,
+            # which is empty instead of zero.
+            raise IncrementalAggregationUpdateNotPossible()
+        return new_value
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from uuid import uuid4
 
 from django.db.models import Q
@@ -55,6 +55,38 @@ def get_q_from_view_filter(
     )
 
 
+def get_python_predicate_from_view_filter(
+    view_filter: ViewFilter, table_model: GeneratedTableModel
+) -> Optional[Callable[[GeneratedTableModel], Optional[bool]]]:
+    """
+    Returns a predicate checking whether an already loaded row matches the provided
+    view filter, without querying the database.
+
+    :param view_filter: The view filter to convert to a predicate.
+    :param table_model: The table model of the rows that must be checked.
+    :return: The predicate or None if the filter must be applied with SQL.
+    """
+
+    if view_filter.field_id not in table_model._field_objects:
+        raise FilterFieldNotFound(
+            view_filter.field_id, f"Field {view_filter.field_id} does not exist."
+        )
+
+    field_object = table_model._field_objects[view_filter.field_id]
+    field_name = field_object["name"]
+    model_field = table_model._meta.get_field(field_name)
+    view_filter_type = view_filter_type_registry.get(view_filter.type)
+
+    if not view_filter_type.field_is_compatible(field_object["field"]):
+        raise ViewFilterTypeNotAllowedForField(
+            view_filter.type, field_object["type"].type
+        )
+
+    return view_filter_type.get_python_predicate(
+        field_name, view_filter.value, model_field, field_object["field"]
+    )
+
+
 class ViewGroupedFiltersAdapter(GroupedFiltersAdapter):
     def __init__(self, instance: View, model: GeneratedTableModel, **kwargs):
         super().__init__(instance, model)
@@ -29,7 +29,7 @@ from .operations import (
     UpdateWebhookOperationType,
 )
 from .registries import webhook_event_type_registry
-from .validators import get_webhook_request_function
+from .validators import get_host_concurrency_limiter, get_webhook_request_function
 
 
 class WebhookHandler:
@@ -332,13 +332,14 @@ class WebhookHandler:
 
         request = get_webhook_request_function()
 
-        response = request(
-            method,
-            url,
-            headers=headers,
-            json=payload,
-            timeout=settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS,
-        )
+        with get_host_concurrency_limiter(url):
+            response = request(
+                method,
+                url,
+                headers=headers,
+                json=payload,
+                timeout=settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS,
+            )
 
         if response.history:
             # If there is a redirect, response.request will point to the final request
@@ -1,7 +1,11 @@
+import threading
 import uuid
+from typing import List
+from weakref import WeakValueDictionary
 
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.db import transaction
+from django.db import connection, transaction
 from django.dispatch.dispatcher import Signal
 
 from baserow.contrib.database.table.models import Table
@@ -10,6 +14,77 @@ from baserow.core.registry import Instance, ModelRegistryMixin, Registry
 from .tasks import call_webhook
 
 
+class WebhookEventBatch:
+    """
+    Collects the signal arguments of consecutive events of the same type and table
+    that happened within the same transaction, so that they're sent to the webhook in
+    one single call.
+    """
+
+    def __init__(self, event_type: "WebhookEventType", table_id: int, kwargs: dict):
+        self.event_type = event_type
+        self.table_id = table_id
+        self.kwargs_list = [kwargs]
+
+    def can_be_extended_with(self, event_type: "WebhookEventType", table_id: int):
+        return (
+            self.event_type.can_merge_payloads
+            and self.event_type.type == event_type.type
+            and self.table_id == table_id
+            and len(self.kwargs_list) < settings.BASEROW_WEBHOOKS_MAX_EVENTS_PER_CALL
+        )
+
+    def send(self):
+        self.event_type.listener_after_commit_batch(self.kwargs_list)
+
+
+class PendingWebhookEvents:
+    """
+    A callable that's registered as one single `on_commit` hook per transaction, or
+    savepoint, and that sends all the webhook events that happened within it when
+    it's committed. Consecutive events that can be merged are added to the same
+    batch.
+    """
+
+    def __init__(self):
+        self.batches: List[WebhookEventBatch] = []
+
+    def add(self, event_type: "WebhookEventType", table_id: int, kwargs: dict):
+        if self.batches and self.batches[-1].can_be_extended_with(event_type, table_id):
+            self.batches[-1].kwargs_list.append(kwargs)
+        else:
+            self.batches.append(WebhookEventBatch(event_type, table_id, kwargs))
+
+    def __call__(self):
+        for batch in self.batches:
+            batch.send()
+
+
+# The pending events of the current thread by database connection and savepoint.
+# Only Django holds a strong reference to them, as the `on_commit` hook, so they
+# disappear as soon as the hook runs or is discarded by a rollback.
+_pending_webhook_events = threading.local()
+
+
+def get_pending_webhook_events() -> PendingWebhookEvents:
+    """
+    Returns the pending webhook events of the current transaction, or savepoint, of
+    the default database connection. A new one is created and registered as
+    `on_commit` hook if there isn't one yet.
+    """
+
+    if not hasattr(_pending_webhook_events, "by_key"):
+        _pending_webhook_events.by_key = WeakValueDictionary()
+
+    key = (connection.alias, tuple(connection.savepoint_ids))
+    pending_events = _pending_webhook_events.by_key.get(key)
+    if pending_events is None:
+        pending_events = PendingWebhookEvents()
+        _pending_webhook_events.by_key[key] = pending_events
+        transaction.on_commit(pending_events)
+    return pending_events
+
+
 class WebhookEventType(Instance):
     """
     This class represents a custom webhook event type that can be added to the webhook
@@ -25,6 +100,12 @@ class WebhookEventType(Instance):
 
     signal = None
     should_trigger_when_all_event_types_selected = True
+    can_merge_payloads = False
+    """
+    Indicates whether the payloads of multiple events of this type that happened in
+    the same transaction can be merged into one single webhook call using the
+    `merge_payloads` method.
+    """
 
     def __init__(self):
         if not isinstance(self.signal, Signal):
@@ -74,6 +155,21 @@ class WebhookEventType(Instance):
             "event_type": self.type,
         }
 
+    def merge_payloads(self, payload: dict, other_payload: dict) -> dict:
+        """
+        Merges the payload of a later event into the payload of an earlier event of the
+        same type. Must be implemented if `can_merge_payloads` is True.
+
+        :param payload: The payload of the earlier event.
+        :param other_payload: The payload of the later event.
+        :return: The merged payload.
+        """
+
+        raise NotImplementedError(
+            "The merge_payloads method must be implemented if can_merge_payloads "
+            "is True."
+        )
+
     def get_table_object(self, **kwargs: dict) -> Table:
         """
         By default we expect the `table` instance to be in the payload of the signal.
@@ -102,7 +198,16 @@ class WebhookEventType(Instance):
         :param kwargs: The arguments of the signal.
         """
 
-        transaction.on_commit(lambda: self.listener_after_commit(**kwargs))
+        if not connection.in_atomic_block:
+            transaction.on_commit(lambda: self.listener_after_commit(**kwargs))
+            return
+
+        # All the events of the transaction are sent by one single `on_commit` hook,
+        # so that consecutive changes of the same type and table result in one
+        # webhook call.
+        get_pending_webhook_events().add(
+            self, self.get_table_object(**kwargs).id, kwargs
+        )
 
     def listener_after_commit(self, **kwargs):
         """
@@ -113,17 +218,41 @@ class WebhookEventType(Instance):
         :param kwargs: The arguments of the signal.
         """
 
+        self.listener_after_commit_batch([kwargs])
+
+    def listener_after_commit_batch(self, kwargs_list):
+        """
+        Called after the transaction commits with the arguments of one or more
+        signals of this event type. It figures out which webhooks need to be called
+        and triggers one async task per webhook. If multiple signals are provided,
+        their payloads are merged into one.
+
+        :param kwargs_list: The arguments of every signal that must be sent.
+        """
+
         from baserow.contrib.database.webhooks.handler import WebhookHandler
 
-        if not kwargs.get("send_webhooks_events", True):
+        kwargs_list = [
+            kwargs for kwargs in kwargs_list if kwargs.get("send_webhooks_events", True)
+        ]
+        if not kwargs_list:
+            return
+
+        if len(kwargs_list) > 1 and not self.can_merge_payloads:
+            for kwargs in kwargs_list:
+                self.listener_after_commit_batch([kwargs])
             return
 
-        table = self.get_table_object(**kwargs)
+        table = self.get_table_object(**kwargs_list[0])
         webhook_handler = WebhookHandler()
         webhooks = webhook_handler.find_webhooks_to_call(table.id, self.type)
         event_id = uuid.uuid4()
         for webhook in webhooks:
-            payload = self.get_payload(event_id, webhook, **kwargs)
+            payload = self.get_payload(event_id, webhook, **kwargs_list[0])
+            for kwargs in kwargs_list[1:]:
+                payload = self.merge_payloads(
+                    payload, self.get_payload(event_id, webhook, **kwargs)
+                )
             headers = webhook.header_dict
             headers.update(**webhook_handler.get_headers(self.type, event_id))
             call_webhook.delay(
@@ -44,33 +44,40 @@ def call_webhook(
     from .handler import WebhookHandler
     from .models import TableWebhook, TableWebhookCall
 
-    with transaction.atomic():
-        handler = WebhookHandler()
+    handler = WebhookHandler()
+
+    if not TableWebhook.objects.filter(id=webhook_id).exists():
+        # If the webhook has been deleted while executing, we don't want to continue
+        # trying to call the URL because we can't update the state of the webhook.
+        return
+
+    request = None
+    response = None
+    success = False
+    error = ""
+
+    # The request is made outside of any transaction so that a slow receiver doesn't
+    # keep a database connection busy and the webhook row locked for the duration
+    # of the call.
+    try:
+        request, response = handler.make_request(method, url, headers, payload)
+        success = response.ok
+    except RequestException as exception:
+        request = exception.request
+        response = exception.response
+        error = str(exception)
+    except UnacceptableAddressException as exception:
+        error = f"UnacceptableAddressException: {exception}"
 
+    with transaction.atomic():
         try:
             webhook = TableWebhook.objects.select_for_update(of=("self",)).get(
                 id=webhook_id
             )
         except TableWebhook.DoesNotExist:
-            # If the webhook has been deleted while executing, we don't want to continue
-            # trying to call the URL because we can't update the state of the webhook.
+            # The webhook has been deleted while the request was being made.
             return
 
-        request = None
-        response = None
-        success = False
-        error = ""
-
-        try:
-            request, response = handler.make_request(method, url, headers, payload)
-            success = response.ok
-        except RequestException as exception:
-            request = exception.request
-            response = exception.response
-            error = str(exception)
-        except UnacceptableAddressException as exception:
-            error = f"UnacceptableAddressException: {exception}"
-
         TableWebhookCall.objects.update_or_create(
             event_id=event_id,
             event_type=event_type,
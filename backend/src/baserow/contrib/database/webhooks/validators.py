@@ -1,4 +1,6 @@
+import threading
 from http.client import _is_illegal_header_value, _is_legal_header_name
+from http.cookiejar import DefaultCookiePolicy
 from socket import gaierror, timeout
 from typing import Callable
 from urllib.parse import urlparse
@@ -16,6 +18,9 @@ from advocate.connection import (
 INVALID_URL_CODE = "invalid_url"
 
 
+_webhook_sessions = threading.local()
+
+
 def get_webhook_request_function() -> Callable:
     """
     Return the appropriate request function based on production environment
@@ -23,19 +28,63 @@ def get_webhook_request_function() -> Callable:
     In production mode, the advocate library is used so that the internal
     network can't be reached. This can be disabled by changing the Django
     setting BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
+
+    The returned function belongs to a session that is reused by the current
+    thread, so that the connections to the same host are pooled and kept alive
+    between webhook calls instead of doing a new TCP and TLS handshake for every
+    call.
     """
 
-    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
-        from requests import request
+    config = (
+        settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True,
+        tuple(settings.BASEROW_WEBHOOKS_IP_BLACKLIST),
+        tuple(settings.BASEROW_WEBHOOKS_IP_WHITELIST),
+        tuple(settings.BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST),
+    )
+
+    if getattr(_webhook_sessions, "config", None) != config:
+        if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
+            from requests import Session
+
+            session = Session()
+        else:
+            addr_validator = get_advocate_address_validator()
+            session = RequestsAPIWrapper(addr_validator).Session()
+
+        # Cookies must not be shared between calls because every call is
+        # independent.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _webhook_sessions.session = session
+        _webhook_sessions.config = config
+
+    return _webhook_sessions.session.request
+
 
-        return request
-    else:
-        from advocate import request
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
 
-        addr_validator = get_advocate_address_validator()
-        baserow_advocate = RequestsAPIWrapper(addr_validator)
 
-        return baserow_advocate.request
+def get_host_concurrency_limiter(url: str) -> threading.BoundedSemaphore:
+    """
+    Returns a semaphore shared by all the threads of the process that limits the
+    number of concurrent calls to the host of the provided URL, so that a burst of
+    events doesn't overload a single receiver. Note that the limit is per process,
+    every worker process has its own semaphores, so the total number of concurrent
+    calls to a host is this limit times the number of worker processes.
+
+    :param url: The URL that's going to be called.
+    :return: A semaphore that must be acquired during the call.
+    """
+
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(
+                settings.BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_HOST
+            )
+            _host_semaphores[host] = semaphore
+    return semaphore
 
 
 def get_advocate_address_validator() -> AddrValidator:
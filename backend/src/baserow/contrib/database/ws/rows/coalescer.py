@@ -0,0 +1,246 @@
+"""
+Coalesces the `rows_updated` real time events of a table. Automations and
+integrations can update the same table hundreds of times per second, and every
+update results in a message containing the full rows before and after the change.
+This swamps the browsers and the channel layer.
+
+The first update of a table is broadcast immediately, and opens a window of
+`BASEROW_WS_ROWS_UPDATED_COALESCE_WINDOW_MS` for that table. Updates happening
+during the window are buffered in the cache, and broadcast at the end of the window
+in one message where successive updates of the same row are merged. If updates
+were buffered, a new window is opened, so a continuous burst results in one message
+per window. The updates made by different web sockets are broadcast in separate
+messages, without ever changing the order of the updates of a row. If the merged
+message is bigger than `BASEROW_WS_ROWS_UPDATED_MAX_PAYLOAD_SIZE`, a compact
+`rows_changed` message containing only the ids of the rows is broadcast instead, so
+that the clients can refetch them.
+"""
+
+import json
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from baserow.config.celery import app
+from baserow.ws.registries import page_registry
+
+
+def _window_cache_key(table_id: int) -> str:
+    return f"ws_rows_updated_window_{table_id}"
+
+
+def _buffer_cache_key(table_id: int) -> str:
+    return f"ws_rows_updated_buffer_{table_id}"
+
+
+def _lock(table_id: int):
+    # The lock prevents concurrent processes from losing each other's buffered
+    # updates. It's not available with the in memory cache used in tests.
+    if hasattr(cache, "lock"):
+        return cache.lock(f"ws_rows_updated_lock_{table_id}", timeout=10)
+    return nullcontext()
+
+
+def _window_seconds() -> float:
+    return settings.BASEROW_WS_ROWS_UPDATED_COALESCE_WINDOW_MS / 1000
+
+
+def _buffer_timeout() -> float:
+    # The buffer outlives its window, so that the updates aren't lost if the flush
+    # task is delayed. They're then broadcast before the first update of the next
+    # window.
+    return _window_seconds() * 2 + 60
+
+
+def merge_rows_updated_messages(
+    messages: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Merges the provided `rows_updated` messages of the same table into one. If a row
+    has been updated multiple times, the state before the first update and the state
+    after the last update are kept.
+
+    :param messages: The `rows_updated` messages in the order they happened.
+    :return: The merged message or None if there are no messages.
+    """
+
+    if not messages:
+        return None
+
+    rows_before_update = {}
+    rows = {}
+    metadata = {}
+    for message in messages:
+        for row_before_update, row in zip(
+            message["rows_before_update"], message["rows"]
+        ):
+            rows_before_update.setdefault(row["id"], row_before_update)
+            rows[row["id"]] = row
+        metadata.update(message["metadata"])
+
+    return {
+        **messages[0],
+        "rows_before_update": [rows_before_update[row_id] for row_id in rows],
+        "rows": list(rows.values()),
+        "metadata": {row_id: metadata[row_id] for row_id in rows if row_id in metadata},
+    }
+
+
+def group_rows_updated_messages(
+    buffer: List[Tuple[Optional[str], Dict[str, Any]]]
+) -> List[Tuple[Optional[str], List[Dict[str, Any]]]]:
+    """
+    Groups the buffered `rows_updated` messages by the web socket that made the
+    change, because the web socket that made a change must not receive it. A
+    message is only added to an earlier group of the same web socket if none of
+    its rows have been updated by another web socket in the meantime, otherwise a
+    new group is started. Broadcasting the groups in the returned order therefore
+    never changes the order of the updates of a row.
+
+    :param buffer: The web socket ids and messages in the order they happened.
+    :return: The web socket ids and their messages in the order in which they must
+        be broadcast.
+    """
+
+    groups = []
+    for ignore_web_socket_id, message in buffer:
+        row_ids = {row["id"] for row in message["rows"]}
+        group = None
+        for previous_group in reversed(groups):
+            if previous_group[0] == ignore_web_socket_id:
+                group = previous_group
+                break
+            if not previous_group[2].isdisjoint(row_ids):
+                break
+
+        if group is None:
+            group = (ignore_web_socket_id, [], set())
+            groups.append(group)
+        group[1].append(message)
+        group[2].update(row_ids)
+
+    return [(web_socket_id, messages) for web_socket_id, messages, _ in groups]
+
+
+def compact_rows_updated_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a `rows_changed` message containing only the ids of the updated rows if
+    the provided `rows_updated` message is too big to be broadcast.
+
+    :param message: The `rows_updated` message.
+    :return: The provided message or the compact `rows_changed` message.
+    """
+
+    max_size = settings.BASEROW_WS_ROWS_UPDATED_MAX_PAYLOAD_SIZE
+    if max_size <= 0 or len(json.dumps(message, default=str)) <= max_size:
+        return message
+
+    return {
+        "type": "rows_changed",
+        "table_id": message["table_id"],
+        "row_ids": [row["id"] for row in message["rows"]],
+    }
+
+
+def _broadcast(
+    table_id: int, message: Dict[str, Any], ignore_web_socket_id: Optional[str]
+):
+    page_registry.get("table").broadcast(
+        compact_rows_updated_message(message),
+        ignore_web_socket_id,
+        table_id=table_id,
+    )
+
+
+def broadcast_rows_updated(
+    table_id: int, message: Dict[str, Any], ignore_web_socket_id: Optional[str]
+):
+    """
+    Broadcasts the `rows_updated` message to the table page, or buffers it if a
+    window of the table is open. Must be called after the transaction commits.
+
+    :param table_id: The id of the table where the rows have been updated.
+    :param message: The `rows_updated` message.
+    :param ignore_web_socket_id: The web socket id that made the change, and
+        therefore must not receive the message.
+    """
+
+    window = _window_seconds()
+    if window <= 0:
+        _broadcast(table_id, message, ignore_web_socket_id)
+        return
+
+    # The messages are broadcast while holding the lock, so that concurrent
+    # processes can't broadcast the updates of a row in another order.
+    with _lock(table_id):
+        buffer = cache.get(_buffer_cache_key(table_id), [])
+        buffer.append((ignore_web_socket_id, message))
+        window_opened = cache.add(
+            _window_cache_key(table_id), True, timeout=window * 2 + 1
+        )
+        if window_opened:
+            # The flush of the previous window could be delayed until after its
+            # window expired, so its buffered updates are broadcast before this one.
+            cache.delete(_buffer_cache_key(table_id))
+            _broadcast_buffer(table_id, buffer)
+        else:
+            cache.set(_buffer_cache_key(table_id), buffer, timeout=_buffer_timeout())
+
+    if window_opened:
+        flush_rows_updated.apply_async((table_id,), countdown=window)
+
+
+def _pop_buffer(table_id: int) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+    buffer = cache.get(_buffer_cache_key(table_id), [])
+    cache.delete(_buffer_cache_key(table_id))
+    return buffer
+
+
+def _broadcast_buffer(
+    table_id: int, buffer: List[Tuple[Optional[str], Dict[str, Any]]]
+):
+    for ignore_web_socket_id, messages in group_rows_updated_messages(buffer):
+        _broadcast(
+            table_id, merge_rows_updated_messages(messages), ignore_web_socket_id
+        )
+
+
+def flush_pending_rows_updated(table_id: int):
+    """
+    Immediately broadcasts the buffered `rows_updated` messages of the table. This
+    must be called before broadcasting other row events of the table, so that the
+    clients receive the events in the right order.
+
+    :param table_id: The id of the table to flush.
+    """
+
+    if _window_seconds() <= 0:
+        return
+
+    with _lock(table_id):
+        _broadcast_buffer(table_id, _pop_buffer(table_id))
+
+
+@app.task(bind=True)
+def flush_rows_updated(self, table_id: int):
+    """
+    Broadcasts the buffered `rows_updated` messages at the end of the window of the
+    table. If there were any, a new window is opened to keep coalescing a burst of
+    updates.
+
+    :param table_id: The id of the table to flush.
+    """
+
+    window = _window_seconds()
+    with _lock(table_id):
+        buffer = _pop_buffer(table_id)
+        if buffer and window > 0:
+            cache.set(_window_cache_key(table_id), True, timeout=window * 2 + 1)
+        else:
+            cache.delete(_window_cache_key(table_id))
+        _broadcast_buffer(table_id, buffer)
+
+    if buffer and window > 0:
+        flush_rows_updated.apply_async((table_id,), countdown=window)
@@ -11,6 +11,10 @@ from baserow.contrib.database.api.rows.serializers import (
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.contrib.database.ws.rows.coalescer import (
+    broadcast_rows_updated,
+    flush_pending_rows_updated,
+)
 from baserow.ws.registries import page_registry
 
 
@@ -30,8 +34,10 @@ def rows_created(
         return
 
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
-        lambda: table_page_type.broadcast(
+
+    def send_rows_created():
+        flush_pending_rows_updated(table.id)
+        table_page_type.broadcast(
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
                 serialized_rows=get_row_serializer_class(
@@ -45,7 +51,8 @@ def rows_created(
             getattr(user, "web_socket_id", None),
             table_id=table.id,
         )
-    )
+
+    transaction.on_commit(send_rows_created)
 
 
 @receiver(row_signals.rows_updated)
@@ -60,9 +67,9 @@ def rows_updated(
     before_rows_values,
     **kwargs,
 ):
-    table_page_type = page_registry.get("table")
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: broadcast_rows_updated(
+            table.id,
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=before_rows_values,
@@ -74,7 +81,6 @@ def rows_updated(
                 ),
             ),
             getattr(user, "web_socket_id", None),
-            table_id=table.id,
         )
     )
 
@@ -89,8 +95,10 @@ def before_rows_delete(sender, rows, user, table, model, **kwargs):
 @receiver(row_signals.rows_deleted)
 def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
-        lambda: table_page_type.broadcast(
+
+    def send_rows_deleted():
+        flush_pending_rows_updated(table.id)
+        table_page_type.broadcast(
             RealtimeRowMessages.rows_deleted(
                 table_id=table.id,
                 serialized_rows=dict(before_return)[before_rows_delete],
@@ -98,7 +106,8 @@ def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
             getattr(user, "web_socket_id", None),
             table_id=table.id,
         )
-    )
+
+    transaction.on_commit(send_rows_deleted)
 
 
 @receiver(row_signals.row_orders_recalculated)
@@ -275,6 +275,7 @@ class CoreConfig(AppConfig):
 
         import baserow.core.notifications.receivers  # noqa: F401
         import baserow.core.notifications.tasks  # noqa: F401
+        import baserow.core.user_files.tasks  # noqa: F401
         from baserow.core.notification_types import (
             BaserowVersionUpgradeNotificationType,
             WorkspaceInvitationAcceptedNotificationType,
@@ -1,5 +1,7 @@
 import contextlib
+import io
 from collections import defaultdict
+from datetime import date, time
 from decimal import Decimal
 from functools import cache
 from math import ceil
@@ -9,23 +11,28 @@ from typing import (
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
     Tuple,
     TypeVar,
 )
+from uuid import UUID
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import DEFAULT_DB_ALIAS, connection, transaction
-from django.db.models import ForeignKey, ManyToManyField, Max, Model, QuerySet
+from django.db.models import F, ForeignKey, ManyToManyField, Max, Model, Q, QuerySet
+from django.db.models.expressions import OrderBy
 from django.db.models.functions import Collate
+from django.db.models.sql.datastructures import BaseTable
 from django.db.models.sql.query import LOOKUP_SEP
 from django.db.transaction import Atomic, get_connection
 
 from loguru import logger
 from psycopg2 import sql
+from psycopg2.extras import Json
 
 from .utils import find_intermediate_order
 
@@ -376,6 +383,354 @@ def collate_expression(expression):
     return Collate(expression, coll_name) if coll_name else expression
 
 
+KEYSET_ANNOTATION_PREFIX = "keyset_value_"
+
+
+def get_queryset_order_bys(queryset: QuerySet) -> List[OrderBy]:
+    """
+    Returns the ordering of the queryset as a list of `OrderBy` expressions, falling
+    back on the default ordering of the model. The `id` is added as last ordering if
+    it's not already present so that the ordering is guaranteed to be unique per
+    row, which is required to use the ordering as keyset.
+
+    :param queryset: The queryset to get the ordering from.
+    :return: A list of `OrderBy` expressions where the last one is unique per row.
+    """
+
+    order_bys = []
+    for order in queryset.query.order_by or queryset.model._meta.ordering:
+        if isinstance(order, str):
+            order = OrderBy(F(order.lstrip("-")), descending=order.startswith("-"))
+        elif not isinstance(order, OrderBy):
+            order = order.asc()
+        order_bys.append(order)
+
+    if not any(
+        isinstance(order.expression, F) and order.expression.name in ("id", "pk")
+        for order in order_bys
+    ):
+        order_bys.append(OrderBy(F("id")))
+
+    return order_bys
+
+
+def annotate_keyset(
+    queryset: QuerySet, order_bys: List[OrderBy]
+) -> Tuple[QuerySet, List[str]]:
+    """
+    Annotates the value of every ordering expression on the queryset and orders the
+    queryset by those annotations, so that the keyset of every returned instance can
+    be read from it.
+
+    :param queryset: The queryset that must be annotated.
+    :param order_bys: The ordering expressions, as returned by
+        `get_queryset_order_bys`.
+    :return: The annotated and ordered queryset and the names of the annotations.
+    """
+
+    names = [f"{KEYSET_ANNOTATION_PREFIX}{i}" for i in range(len(order_bys))]
+    queryset = queryset.annotate(
+        **{name: order.expression for name, order in zip(names, order_bys)}
+    ).order_by(
+        *[
+            OrderBy(
+                F(name),
+                descending=order.descending,
+                nulls_first=order.nulls_first,
+                nulls_last=order.nulls_last,
+            )
+            for name, order in zip(names, order_bys)
+        ]
+    )
+    return queryset, names
+
+
+def get_keyset_values(instance: Model, names: List[str]) -> List[Any]:
+    """
+    Returns the keyset values of an instance fetched from a queryset annotated with
+    `annotate_keyset`.
+    """
+
+    return [getattr(instance, name) for name in names]
+
+
+def _nulls_are_returned_first(order: OrderBy) -> bool:
+    """
+    Indicates whether null values are returned before the other values. If not
+    specified, PostgreSQL considers null values larger than any other value.
+    """
+
+    if order.nulls_first:
+        return True
+    if order.nulls_last:
+        return False
+    return order.descending
+
+
+def _get_after_value_q(name: str, order: OrderBy, value: Any) -> Q:
+    """
+    Returns a Q object matching all the rows that come strictly after the provided
+    value for the given ordering expression.
+    """
+
+    nulls_first = _nulls_are_returned_first(order)
+    if value is None:
+        return Q(**{f"{name}__isnull": False}) if nulls_first else Q(pk__in=[])
+
+    lookup = "lt" if order.descending else "gt"
+    after = Q(**{f"{name}__{lookup}": value})
+    if not nulls_first:
+        after |= Q(**{f"{name}__isnull": True})
+    return after
+
+
+def filter_after_keyset(
+    queryset: QuerySet,
+    names: List[str],
+    order_bys: List[OrderBy],
+    values: List[Any],
+) -> QuerySet:
+    """
+    Filters the queryset annotated with `annotate_keyset` on the rows that come
+    after the provided keyset values. This is the lexicographical
+    `(a, b, c) > (x, y, z)` comparison, taking the direction and the null handling
+    of every ordering expression into account.
+
+    :param queryset: The queryset annotated with `annotate_keyset`.
+    :param names: The names of the keyset annotations.
+    :param order_bys: The ordering expressions used to annotate the queryset.
+    :param values: The keyset values of the last row that must be excluded.
+    :return: The filtered queryset.
+    """
+
+    keyset_q = Q(pk__in=[])
+    for index, (name, order, value) in enumerate(zip(names, order_bys, values)):
+        q = _get_after_value_q(name, order, value)
+        for prev_name, prev_value in zip(names[:index], values[:index]):
+            if prev_value is None:
+                q &= Q(**{f"{prev_name}__isnull": True})
+            else:
+                q &= Q(**{prev_name: prev_value})
+        keyset_q |= q
+    return queryset.filter(keyset_q)
+
+
+def reverse_order_bys(order_bys: List[OrderBy]) -> List[OrderBy]:
+    """
+    Returns copies of the provided ordering expressions in the opposite direction,
+    including the position of the null values.
+    """
+
+    reversed_order_bys = []
+    for order in order_bys:
+        order = order.copy()
+        order.reverse_ordering()
+        reversed_order_bys.append(order)
+    return reversed_order_bys
+
+
+def keyset_iterator(
+    queryset: QuerySet, chunk_size: int = 2000
+) -> Iterator[ModelInstance]:
+    """
+    Iterates over all the instances of the queryset in the order of the queryset
+    by fetching chunks of `chunk_size` rows, where every next chunk is selected by
+    filtering on the keyset of the last row of the previous chunk. Contrary to
+    `OFFSET` pagination, fetching a chunk doesn't get slower the further we are in
+    the queryset and because every chunk is a separate query, no long-running
+    transaction or server side cursor is needed. Prefetches and annotations of the
+    queryset are respected.
+
+    :param queryset: The queryset to iterate over.
+    :param chunk_size: The number of rows fetched per query.
+    :return: An iterator yielding every instance of the queryset.
+    """
+
+    order_bys = get_queryset_order_bys(queryset)
+    queryset, names = annotate_keyset(queryset, order_bys)
+
+    chunk_queryset = queryset
+    while True:
+        chunk = list(chunk_queryset[:chunk_size])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            break
+        chunk_queryset = filter_after_keyset(
+            queryset, names, order_bys, get_keyset_values(chunk[-1], names)
+        )
+
+
+def get_estimated_row_count(model: Model) -> int:
+    """
+    Returns the number of rows of the model's table as estimated by the PostgreSQL
+    planner statistics in `pg_class.reltuples`. The estimate is as up to date as
+    the last `VACUUM` or `ANALYZE` of the table, which makes it unsuitable for
+    anything else than progress indications or approximate counts, but it's
+    returned without scanning the table. Returns -1 if the table has never been
+    analyzed.
+
+    :param model: The model of the table to get the row count estimate for.
+    :return: The estimated number of rows, or -1 if unknown.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] is None:
+        return -1
+    return int(row[0])
+
+
+class TableSample(BaseTable):
+    """
+    The base table of a query of which only a sample of the pages is read, using the
+    `TABLESAMPLE SYSTEM` method of PostgreSQL.
+    """
+
+    def __init__(self, table_name: str, alias: str, percentage: float, seed: int):
+        super().__init__(table_name, alias)
+        self.percentage = percentage
+        self.seed = seed
+
+    def as_sql(self, compiler, connection):
+        sql, params = super().as_sql(compiler, connection)
+        return (
+            f"{sql} TABLESAMPLE SYSTEM (%s) REPEATABLE (%s)",
+            [*params, self.percentage, self.seed],
+        )
+
+    def relabeled_clone(self, change_map):
+        return self.__class__(
+            self.table_name,
+            change_map.get(self.table_alias, self.table_alias),
+            self.percentage,
+            self.seed,
+        )
+
+
+def sample_queryset(queryset: QuerySet, percentage: float, seed: int) -> QuerySet:
+    """
+    Returns a copy of the queryset that only reads a random sample of the pages of
+    its base table, so that it's cheap to count or aggregate. Joined tables are
+    not sampled.
+
+    :param queryset: The queryset that must be sampled.
+    :param percentage: The percentage of the pages of the table that are sampled.
+    :param seed: The seed of the sample. The same pages are sampled every time
+        the same seed is used, as long as the table doesn't change.
+    :return: The sampled queryset.
+    """
+
+    queryset = queryset.all()
+    query = queryset.query
+    alias = query.get_initial_alias()
+    query.alias_map[alias] = TableSample(
+        query.alias_map[alias].table_name, alias, percentage, seed
+    )
+    return queryset
+
+
+def _to_copy_text(value: Any) -> str:
+    """
+    Converts a value prepared for the database to its representation in the text
+    format of the `COPY` command.
+
+    :raises TypeError: If the value can't be represented.
+    """
+
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal, UUID)):
+        return str(value)
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, Json):
+        value = value.dumps(value.adapted)
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+            .replace("\t", "\\t")
+        )
+    raise TypeError(f"{type(value)} can't be copied.")
+
+
+def bulk_insert_with_copy(
+    model: Model, instances: List[ModelInstance]
+) -> List[ModelInstance]:
+    """
+    Inserts the provided unsaved instances with the `COPY FROM STDIN` command, which
+    is considerably faster than the multi row `INSERT` of `bulk_create` for large
+    amounts of rows. The ids are reserved upfront from the sequence of the primary
+    key, and set on the instances like `bulk_create` does. Falls back to
+    `bulk_create` if a value can't be represented in the `COPY` format, or if the
+    primary key doesn't have a sequence.
+
+    :param model: The model of the instances.
+    :param instances: The instances that must be inserted.
+    :return: The inserted instances.
+    """
+
+    pk = model._meta.pk
+    if not instances or any(instance.pk is not None for instance in instances):
+        return model.objects.bulk_create(instances)
+
+    fields = [field for field in model._meta.concrete_fields if field is not pk]
+    try:
+        lines = [
+            "\t".join(
+                _to_copy_text(
+                    field.get_db_prep_save(field.pre_save(instance, True), connection)
+                )
+                for field in fields
+            )
+            for instance in instances
+        ]
+    except TypeError:
+        return model.objects.bulk_create(instances)
+
+    table_name = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+            "FROM generate_series(1, %s)",
+            [table_name, pk.column, len(instances)],
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+        if any(id_ is None for id_ in ids):
+            return model.objects.bulk_create(instances)
+
+        copy_sql = sql.SQL("COPY {table} ({columns}) FROM STDIN").format(
+            table=sql.Identifier(table_name),
+            columns=sql.SQL(", ").join(
+                sql.Identifier(column)
+                for column in [pk.column] + [field.column for field in fields]
+            ),
+        )
+        cursor.copy_expert(
+            copy_sql.as_string(connection.connection),
+            io.StringIO("".join(f"{id_}\t{line}\n" for id_, line in zip(ids, lines))),
+        )
+
+    if settings.CACHALOT_ENABLED:
+        from cachalot.api import invalidate
+
+        invalidate(model)
+
+    for id_, instance in zip(ids, instances):
+        instance.pk = id_
+        instance._state.adding = False
+        instance._state.db = DEFAULT_DB_ALIAS
+
+    return instances
+
+
 class MultiFieldPrefetchQuerysetMixin(Generic[ModelInstance]):
     """
     This mixin introduces a `multi_field_prefetch` method that can be used to
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional, Set
 
 from baserow.core.formula.parser.exceptions import (
     BaserowFormulaException,
@@ -19,15 +19,19 @@ __all__ = [
     BaserowFormulaSyntaxError,
 ]
 
+from baserow.core.formula.parser.compiler import compile_formula
+from baserow.core.formula.parser.data_path_collector import (
+    BaserowFormulaDataPathCollector,
+)
 from baserow.core.formula.parser.parser import get_parse_tree_for_formula
-from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
 
 
 def resolve_formula(
     formula: str, functions: FunctionCollection, formula_context: FormulaContext
 ) -> Any:
     """
-    Helper to resolve a formula given the formula_context.
+    Helper to resolve a formula given the formula_context. The formula is compiled
+    once per process, so resolving it again doesn't parse it again.
 
     :param formula: the formula itself.
     :param formula_context: A dict like object that contains the data that can
@@ -35,5 +39,22 @@ def resolve_formula(
     :return: the formula result.
     """
 
+    return compile_formula(formula)(functions, formula_context)
+
+
+def get_formula_data_paths(formula: str) -> Optional[Set[str]]:
+    """
+    Returns the data paths read by the formula, without resolving it. For instance
+    `concat(get("page_parameter.id"), get("data_source.1.field_2"))` reads the
+    `page_parameter.id` and `data_source.1.field_2` paths.
+
+    :param formula: the formula itself.
+    :raises BaserowFormulaSyntaxError: if the formula is invalid.
+    :return: the paths or None if some of them can only be known by resolving the
+        formula.
+    """
+
     tree = get_parse_tree_for_formula(formula)
-    return BaserowPythonExecutor(functions, formula_context).visit(tree)
+    collector = BaserowFormulaDataPathCollector()
+    collector.visit(tree)
+    return None if collector.has_dynamic_path else collector.paths
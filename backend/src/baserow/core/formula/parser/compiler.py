@@ -0,0 +1,152 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, List
+
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
+    FormulaFunctionTypeDoesNotExist,
+    UnknownOperator,
+)
+from baserow.core.formula.parser.parser import (
+    convert_string_literal_token_to_string,
+    get_parse_tree_for_formula,
+)
+from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.types import FormulaContext, FunctionCollection
+
+CompiledFormula = Callable[[FunctionCollection, FormulaContext], Any]
+
+# The maximum number of compiled formulas kept in memory by every process.
+COMPILED_FORMULA_CACHE_SIZE = 4096
+
+BINARY_OPERATORS = {
+    BaserowFormula.PLUS: "add",
+    BaserowFormula.MINUS: "minus",
+    BaserowFormula.SLASH: "divide",
+    BaserowFormula.EQUAL: "equal",
+    BaserowFormula.BANG_EQUAL: "not_equal",
+    BaserowFormula.STAR: "multiply",
+    BaserowFormula.GT: "greater_than",
+    BaserowFormula.LT: "less_than",
+    BaserowFormula.GTE: "greater_than_or_equal",
+    BaserowFormula.LTE: "less_than_or_equal",
+}
+
+
+def _constant(value: Any) -> CompiledFormula:
+    return lambda functions, context: value
+
+
+def _raise(create_error: Callable[[], Exception]) -> CompiledFormula:
+    def raise_error(functions: FunctionCollection, context: FormulaContext):
+        # A new error is created on every call because the compiled formula is
+        # cached and shared, and a raised error is mutated by its caller.
+        raise create_error()
+
+    return raise_error
+
+
+@lru_cache(maxsize=COMPILED_FORMULA_CACHE_SIZE)
+def compile_formula(formula: str) -> CompiledFormula:
+    """
+    Parses the formula and compiles it into a function that resolves it, given the
+    functions and the formula context. The compiled formulas are cached, so that a
+    formula that's resolved many times is only parsed once. If the formula is
+    invalid, the returned function raises the syntax error.
+
+    :param formula: the formula itself.
+    :return: a function resolving the formula with the provided functions and
+        formula context.
+    """
+
+    try:
+        tree = get_parse_tree_for_formula(formula)
+    except BaserowFormulaSyntaxError as error:
+        error_args = error.args
+        return _raise(lambda: BaserowFormulaSyntaxError(*error_args))
+    return BaserowFormulaCompiler().visit(tree)
+
+
+class BaserowFormulaCompiler(BaserowFormulaVisitor):
+    """
+    Compiles a parse tree into nested functions that produce the same result as the
+    `BaserowPythonExecutor`, without walking the parse tree every time the formula
+    is resolved.
+    """
+
+    def visitRoot(self, ctx: BaserowFormula.RootContext):
+        return ctx.expr().accept(self)
+
+    def visitStringLiteral(self, ctx: BaserowFormula.StringLiteralContext):
+        return _constant(
+            convert_string_literal_token_to_string(
+                ctx.getText(), ctx.SINGLEQ_STRING_LITERAL() is not None
+            )
+        )
+
+    def visitDecimalLiteral(self, ctx: BaserowFormula.DecimalLiteralContext):
+        return _constant(Decimal(ctx.getText()))
+
+    def visitBooleanLiteral(self, ctx: BaserowFormula.BooleanLiteralContext):
+        return _constant(ctx.TRUE() is not None)
+
+    def visitIntegerLiteral(self, ctx: BaserowFormula.IntegerLiteralContext):
+        return _constant(int(ctx.getText()))
+
+    def visitBrackets(self, ctx: BaserowFormula.BracketsContext):
+        return ctx.expr().accept(self)
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().getText().lower()
+        return self._compile_func(ctx.expr(), function_name)
+
+    def visitBinaryOp(self, ctx: BaserowFormula.BinaryOpContext):
+        op = BINARY_OPERATORS.get(ctx.op.type) if ctx.op is not None else None
+        if op is None:
+            text = ctx.getText()
+            return _raise(lambda: UnknownOperator(text))
+
+        return self._compile_func(ctx.expr(), op)
+
+    def _compile_func(
+        self, function_argument_expressions: List, function_name: str
+    ) -> CompiledFormula:
+        compiled_args = [expr.accept(self) for expr in function_argument_expressions]
+
+        def execute(functions: FunctionCollection, context: FormulaContext):
+            args = [compiled_arg(functions, context) for compiled_arg in compiled_args]
+            try:
+                formula_function_type = functions.get(function_name)
+            except FormulaFunctionTypeDoesNotExist:
+                raise BaserowFormulaSyntaxError(
+                    f"{function_name} is not a valid function"
+                )
+
+            formula_function_type.validate_args(args)
+
+            args_parsed = formula_function_type.parse_args(args)
+
+            return formula_function_type.execute(context, args_parsed)
+
+        return execute
+
+    def visitFieldByIdReference(self, ctx: BaserowFormula.FieldByIdReferenceContext):
+        return _raise(FieldByIdReferencesAreDeprecated)
+
+    def visitLeftWhitespaceOrComments(
+        self, ctx: BaserowFormula.LeftWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitRightWhitespaceOrComments(
+        self, ctx: BaserowFormula.RightWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitChildren(self, node):
+        # The nodes that are not compiled are resolved by walking them like before.
+        return lambda functions, context: BaserowPythonExecutor(
+            functions, context
+        ).visit(node)
@@ -0,0 +1,39 @@
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.parser import convert_string_literal_token_to_string
+
+
+class BaserowFormulaDataPathCollector(BaserowFormulaVisitor):
+    """
+    Collects the paths of the data read by the `get` functions of a formula without
+    resolving it. If the argument of a `get` function is not a string literal, the
+    path can only be known by resolving the formula, and `has_dynamic_path` is set.
+    """
+
+    def __init__(self):
+        self.paths = set()
+        self.has_dynamic_path = False
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        if ctx.func_name().getText().lower() == "get":
+            args = ctx.expr()
+            arg = args[0] if len(args) == 1 else None
+            while isinstance(
+                arg,
+                (
+                    BaserowFormula.BracketsContext,
+                    BaserowFormula.LeftWhitespaceOrCommentsContext,
+                    BaserowFormula.RightWhitespaceOrCommentsContext,
+                ),
+            ):
+                arg = arg.expr()
+
+            if isinstance(arg, BaserowFormula.StringLiteralContext):
+                self.paths.add(
+                    convert_string_literal_token_to_string(
+                        arg.getText(), arg.SINGLEQ_STRING_LITERAL() is not None
+                    )
+                )
+            else:
+                self.has_dynamic_path = True
+
+        return self.visitChildren(ctx)
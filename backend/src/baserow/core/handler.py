@@ -1378,7 +1378,9 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         progress.increment(by=start_progress)
 
         duplicate_import_export_config = ImportExportConfig(
-            include_permission_data=True, reduce_disk_space_usage=False
+            include_permission_data=True,
+            reduce_disk_space_usage=False,
+            copy_rows_in_database=True,
         )
         # export the application
         specific_application = application.specific
@@ -1514,8 +1516,9 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         via the `import_applications_to_workspace` method. The result can be
         serialized to JSON.
 
-        @TODO look into speed optimizations by streaming to a JSON file instead of
-            generating the entire file in memory.
+        If the `export_rows_in_chunks` import export config is enabled, the rows of
+        the tables are written by chunks into the zip file instead of being part of
+        the returned list, so that they never have to be all in memory.
 
         :param workspace: The workspace of which the applications must be exported.
         :type workspace: Workspace
@@ -1560,8 +1563,8 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         Imports multiple exported applications into the given workspace. It is
         compatible with an export of the `export_workspace_applications` method.
 
-        @TODO look into speed optimizations by streaming from a JSON file instead of
-            loading the entire file into memory.
+        Rows that have been exported by chunks into the zip file are read from
+        there one chunk at a time.
 
         :param workspace: The workspace that the applications must be imported to.
         :param exported_applications: A list containing the applications generated by
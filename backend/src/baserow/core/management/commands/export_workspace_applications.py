@@ -9,7 +9,9 @@ from baserow.core.models import Workspace
 from baserow.core.registries import ImportExportConfig
 
 cli_import_export_config = ImportExportConfig(
-    include_permission_data=False, reduce_disk_space_usage=False
+    include_permission_data=False,
+    reduce_disk_space_usage=False,
+    export_rows_in_chunks=True,
 )
 
 
@@ -18,7 +20,7 @@ class Command(BaseCommand):
         "Exports all the application of a workspace to a JSON file that can later be "
         "imported via the `import_workspace_applications` management command. "
         "A ZIP file containing all the files is also exported, this will for example "
-        "contain the files uploaded to a file field."
+        "contain the files uploaded to a file field and the rows of the tables."
     )
 
     def add_arguments(self, parser):
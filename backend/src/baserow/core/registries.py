@@ -83,6 +83,23 @@ class ImportExportConfig:
     """
     reduce_disk_space_usage: bool = False
 
+    """
+    When true the rows are not serialized, but copied with SQL from the source
+    tables when importing. This is much faster and doesn't load the rows into memory,
+    but it can only be used if the export is imported right away in the same
+    database and transaction, like when duplicating an application or creating a
+    snapshot.
+    """
+    copy_rows_in_database: bool = False
+
+    """
+    When true and a zip file is provided, the rows are exported into separate files
+    in the zip file by chunks of newline delimited JSON, instead of being part of the
+    serialized structure. This keeps the memory usage bounded when exporting and
+    importing large tables. The import supports both formats.
+    """
+    export_rows_in_chunks: bool = False
+
 
 class Plugin(APIUrlsInstanceMixin, Instance):
     """
@@ -874,16 +891,21 @@ class ObjectScopeType(Instance, ModelInstanceMixin):
             )
 
             # We have all the objects in the queryset, but now we want to sort them
-            # into buckets per original scope they are a child of.
+            # into buckets per original scope they are a child of. The parent of
+            # every object is looked up once per scope type instead of once per
+            # scope, and then matched with the scopes by hash.
+            scope_types = set()
             for scope in scopes:
                 objects_per_scope[scope] = set()
-                scope_type = object_scope_type_registry.get_by_model(scope)
-                for obj in query_result:
+                scope_types.add(object_scope_type_registry.get_by_model(scope))
+
+            for obj in query_result:
+                for scope_type in scope_types:
                     parent_scope = object_scope_type_registry.get_parent(
                         obj, at_scope_type=scope_type
                     )
-                    if parent_scope == scope:
-                        objects_per_scope[scope].add(obj)
+                    if parent_scope is not None and parent_scope in objects_per_scope:
+                        objects_per_scope[parent_scope].add(obj)
 
         return objects_per_scope
 
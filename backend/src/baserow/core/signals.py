@@ -31,3 +31,5 @@ permissions_updated = Signal()
 workspace_invitation_created = Signal()
 workspace_invitation_accepted = Signal()
 workspace_invitation_rejected = Signal()
+
+user_file_thumbnails_generated = Signal()
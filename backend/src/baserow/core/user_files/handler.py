@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 from django.conf import settings
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 from django.db.models import QuerySet
 
 import advocate
@@ -15,6 +16,7 @@ from advocate.exceptions import UnacceptableAddressException
 from PIL import Image, ImageOps
 from requests.exceptions import RequestException
 
+from baserow.core.signals import user_file_thumbnails_generated
 from baserow.core.storage import OverwritingStorageHandler
 from baserow.core.utils import random_string, sha256_hash, stream_size, truncate_middle
 
@@ -29,6 +31,9 @@ from .models import UserFile
 
 
 class UserFileHandler:
+    # The image modes that can be reduced by Pillow before generating the thumbnails.
+    REDUCIBLE_IMAGE_MODES = ("L", "LA", "RGB", "RGBA")
+
     def get_user_file_by_name(
         self, user_file_name: int, base_queryset: Optional[QuerySet] = None
     ) -> UserFile:
@@ -117,13 +122,76 @@ class UserFileHandler:
             ).exists():
                 return unique
 
+    def get_thumbnail_sizes(self, user_file, only_with_name=None):
+        """
+        Returns the sizes of the thumbnails of the provided image user file based on
+        the current settings. If the width or height of a thumbnail is not set, it's
+        calculated to keep the aspect ratio of the image.
+
+        :param user_file: The image user file for which the sizes must be returned.
+        :type user_file: UserFile
+        :param only_with_name: If provided, then only the size of the thumbnail type
+            with that name is returned.
+        :type only_with_name: None or String
+        :return: The width and height by thumbnail name.
+        :rtype: dict
+        """
+
+        image_width = user_file.image_width
+        image_height = user_file.image_height
+        sizes = {}
+
+        for name, size in settings.USER_THUMBNAILS.items():
+            if only_with_name and only_with_name != name:
+                continue
+
+            size_copy = size.copy()
+
+            # If the width or height is None we want to keep the aspect ratio.
+            if size_copy[0] is None and size_copy[1] is not None:
+                size_copy[0] = round(image_width / image_height * size_copy[1])
+            elif size_copy[1] is None and size_copy[0] is not None:
+                size_copy[1] = round(image_height / image_width * size_copy[0])
+
+            sizes[name] = size_copy
+
+        return sizes
+
+    def reduce_image_for_thumbnails(self, image, min_width, min_height):
+        """
+        Decodes the image at the smallest resolution that's still at least as big as
+        the provided size, so that the thumbnails don't have to be resized from the
+        full resolution image. JPEG images are decoded at a reduced scale directly,
+        the others are reduced by an integer factor after being decoded.
+
+        :param image: The original Pillow image that has not been loaded yet.
+        :type image: Image
+        :param min_width: The minimum width of the reduced image.
+        :type min_width: int
+        :param min_height: The minimum height of the reduced image.
+        :type min_height: int
+        :return: The reduced image.
+        :rtype: Image
+        """
+
+        min_width, min_height = max(min_width, 1), max(min_height, 1)
+        image.draft(None, (min_width, min_height))
+
+        factor = min(image.width // min_width, image.height // min_height)
+        if factor > 1 and image.mode in self.REDUCIBLE_IMAGE_MODES:
+            return image.reduce(factor)
+
+        image.load()
+        return image
+
     def generate_and_save_image_thumbnails(
         self, image, user_file, storage=None, only_with_name=None
     ):
         """
         Generates the thumbnails based on the current settings and saves them to the
         provided storage. Note that existing files with the same name will be
-        overwritten.
+        overwritten. The image is decoded once, at the resolution needed by the
+        biggest thumbnail, and all the thumbnails are generated from it.
 
         :param image: The original Pillow image that serves as base when generating the
             the image.
@@ -143,33 +211,52 @@ class UserFileHandler:
             raise ValueError("The provided user file is not an image.")
 
         storage = storage or default_storage
-        image_width = user_file.image_width
-        image_height = user_file.image_height
-
-        for name, size in settings.USER_THUMBNAILS.items():
-            if only_with_name and only_with_name != name:
-                continue
-
-            size_copy = size.copy()
-
-            # If the width or height is None we want to keep the aspect ratio.
-            if size_copy[0] is None and size_copy[1] is not None:
-                size_copy[0] = round(image_width / image_height * size_copy[1])
-            elif size_copy[1] is None and size_copy[0] is not None:
-                size_copy[1] = round(image_height / image_width * size_copy[0])
+        sizes = self.get_thumbnail_sizes(user_file, only_with_name)
+        if not sizes:
+            return
+
+        # The reduced image doesn't have a format anymore.
+        image_format = image.format
+        image = self.reduce_image_for_thumbnails(
+            image,
+            max(width for width, _ in sizes.values()),
+            max(height for _, height in sizes.values()),
+        )
+        handler = OverwritingStorageHandler(storage)
 
-            thumbnail = ImageOps.fit(image.copy(), size_copy, Image.ANTIALIAS)
+        for name, size in sizes.items():
+            thumbnail = ImageOps.fit(image, size, Image.ANTIALIAS)
             thumbnail_stream = BytesIO()
-            thumbnail.save(thumbnail_stream, image.format)
+            thumbnail.save(thumbnail_stream, image_format)
             thumbnail_stream.seek(0)
             thumbnail_path = self.user_file_thumbnail_path(user_file, name)
-
-            handler = OverwritingStorageHandler(storage)
             handler.save(thumbnail_path, thumbnail_stream)
 
             del thumbnail
             del thumbnail_stream
 
+    def generate_and_save_user_file_thumbnails(self, user_file):
+        """
+        Generates the thumbnails of an image user file that has already been saved
+        in the default storage. This is done in the background after the user file
+        has been uploaded. When the thumbnails are saved, the
+        `user_file_thumbnails_generated` signal is sent.
+
+        :param user_file: The user file for which the thumbnails must be generated.
+        :type user_file: UserFile
+        """
+
+        with default_storage.open(self.user_file_path(user_file)) as stream:
+            try:
+                image = Image.open(stream)
+            except IOError:
+                return
+
+            self.generate_and_save_image_thumbnails(image, user_file)
+            image.close()
+
+        user_file_thumbnails_generated.send(self, user_file=user_file)
+
     def upload_user_file(self, user, file_name, stream, storage=None):
         """
         Saves the provided uploaded file in the provided storage. If no storage is
@@ -201,7 +288,6 @@ class UserFileHandler:
                 "The provided file is too large.",
             )
 
-        storage = storage or default_storage
         hash = sha256_hash(stream)
         file_name = truncate_middle(file_name, 64)
 
@@ -246,23 +332,40 @@ class UserFileHandler:
         )
 
         # If the uploaded file is an image we need to generate the configurable
-        # thumbnails for it. We want to generate them before the file is saved to the
-        # storage because some storages close the stream after saving.
-        if image:
+        # thumbnails for it. They're generated in the background from the saved file
+        # if possible, because that's slow for big images. The thumbnail urls of the
+        # user file are known upfront, so the response doesn't have to wait for them.
+        # A custom storage can't be passed to the background task.
+        generate_thumbnails_in_background = (
+            image is not None
+            and settings.BASEROW_USER_FILE_THUMBNAILS_ASYNC
+            and storage is None
+        )
+
+        # Otherwise we want to generate them before the file is saved to the storage
+        # because some storages close the stream after saving.
+        if image and not generate_thumbnails_in_background:
             self.generate_and_save_image_thumbnails(image, user_file, storage=storage)
 
-            # When all the thumbnails have been generated, the image can be deleted
-            # from memory.
-            del image
+        # When all the thumbnails have been generated, the image can be deleted
+        # from memory.
+        del image
 
         # Save the file to the storage.
         full_path = self.user_file_path(user_file)
-        handler = OverwritingStorageHandler(storage)
+        handler = OverwritingStorageHandler(storage or default_storage)
         handler.save(full_path, stream)
 
         # Close the stream because we don't need it anymore.
         stream.close()
 
+        if generate_thumbnails_in_background:
+            from .tasks import generate_user_file_thumbnails
+
+            transaction.on_commit(
+                lambda: generate_user_file_thumbnails.delay(user_file.id)
+            )
+
         return user_file
 
     def upload_user_file_by_url(self, user, url, storage=None):
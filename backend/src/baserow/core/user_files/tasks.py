@@ -0,0 +1,22 @@
+from baserow.config.celery import app
+
+
+@app.task(autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def generate_user_file_thumbnails(user_file_id: int):
+    """
+    Generates the thumbnails of the uploaded image user file in the background. If
+    that fails, for example because the storage can't be reached, it's retried a
+    few times with an increasing delay.
+
+    :param user_file_id: The id of the image user file.
+    """
+
+    from .handler import UserFileHandler
+    from .models import UserFile
+
+    try:
+        user_file = UserFile.objects.get(id=user_file_id, is_image=True)
+    except UserFile.DoesNotExist:
+        return
+
+    UserFileHandler().generate_and_save_user_file_thumbnails(user_file)
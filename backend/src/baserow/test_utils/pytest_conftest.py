@@ -18,6 +18,7 @@ from pyinstrument import Profiler
 
 from baserow.compat.api.conf import GROUP_DEPRECATION
 from baserow.contrib.database.application_types import DatabaseApplicationType
+from baserow.contrib.database.table.cache import generated_models_l1_cache
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.permission_manager import CorePermissionManagerType
 from baserow.core.trash.trash_types import WorkspaceTrashableItemType
@@ -42,6 +43,14 @@ def async_event_loop():
     loop.close()
 
 
+# The tables created by a test are rolled back, so their cached models must not be
+# used by the next tests.
+@pytest.fixture(autouse=True)
+def clear_generated_models_l1_cache():
+    yield
+    generated_models_l1_cache.clear()
+
+
 @pytest.fixture
 def data_fixture(fake):
     from .fixtures import Fixtures
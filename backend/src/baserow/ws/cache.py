@@ -0,0 +1,119 @@
+"""
+Caches the ids of the users that are permitted to receive the real time events of a
+scope. Broadcasting an event to the permitted users of a workspace requires checking
+the permissions of every member, which is expensive for big workspaces that produce
+many events. Because the permissions rarely change, the result is cached per
+workspace, operation and scope.
+
+Every workspace has a version number in the cache that's part of the cache key of
+the entries. Changing the roles, teams or members of a workspace bumps the version
+which invalidates all the entries of that workspace at once.
+"""
+
+import time
+import uuid
+from typing import Callable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+permitted_users_cache_hits_counter = meter.create_counter(
+    "baserow.ws.permitted_users_cache.hits",
+    unit="1",
+    description="The number of real time broadcasts for which the permitted users "
+    "were served from the cache.",
+)
+permitted_users_cache_misses_counter = meter.create_counter(
+    "baserow.ws.permitted_users_cache.misses",
+    unit="1",
+    description="The number of real time broadcasts for which the permitted users "
+    "had to be computed because they were not cached.",
+)
+permitted_users_fan_out_duration = meter.create_histogram(
+    "baserow.ws.permitted_users_fan_out.duration",
+    unit="ms",
+    description="The time it takes to figure out which users are permitted to "
+    "receive a real time event.",
+)
+
+
+def _workspace_version_cache_key(workspace_id: int) -> str:
+    return f"ws_permitted_users_version_{workspace_id}"
+
+
+def _permitted_users_cache_key(
+    workspace_id: int, version: str, operation_type: str, scope_name: str, scope_id
+) -> str:
+    return (
+        f"ws_permitted_users_{workspace_id}_{version}_{operation_type}_"
+        f"{scope_name}_{scope_id}"
+    )
+
+
+def get_permitted_user_ids(
+    workspace_id: int,
+    operation_type: str,
+    scope_name: str,
+    scope_id: int,
+    compute: Callable[[], List[int]],
+) -> List[int]:
+    """
+    Returns the ids of the users of the workspace that are permitted to perform the
+    operation on the scope. If they're not cached yet, the `compute` function is
+    called and the result is stored in the cache.
+
+    :param workspace_id: The workspace the users are in.
+    :param operation_type: The operation that should be checked for.
+    :param scope_name: The name of the scope that the operation is executed on.
+    :param scope_id: The id of the scope instance.
+    :param compute: A function that computes the permitted user ids if they're not
+        in the cache.
+    :return: The list of permitted user ids.
+    """
+
+    start = time.perf_counter()
+    timeout = settings.BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS
+
+    if timeout <= 0:
+        user_ids = compute()
+    else:
+        # The version must be fetched before computing the user ids, so that a
+        # concurrent invalidation never results in a stale entry for the new version.
+        version = cache.get(_workspace_version_cache_key(workspace_id), "0")
+        cache_key = _permitted_users_cache_key(
+            workspace_id, version, operation_type, scope_name, scope_id
+        )
+        user_ids = cache.get(cache_key)
+
+        if user_ids is None:
+            permitted_users_cache_misses_counter.add(1)
+            user_ids = compute()
+            cache.set(cache_key, user_ids, timeout=timeout)
+        else:
+            permitted_users_cache_hits_counter.add(1)
+
+    permitted_users_fan_out_duration.record((time.perf_counter() - start) * 1000)
+    return user_ids
+
+
+def invalidate_permitted_users_cache(workspace_id: int):
+    """
+    Invalidates all the cached permitted users of the provided workspace. The version
+    is bumped right away, so that the changes are respected within the current
+    transaction, and again when it commits, so that users computed and cached based on
+    the old data in the meantime are not served anymore.
+
+    :param workspace_id: The id of the workspace that must be invalidated.
+    """
+
+    def bump_version():
+        cache.set(
+            _workspace_version_cache_key(workspace_id), str(uuid.uuid4()), timeout=None
+        )
+
+    bump_version()
+    transaction.on_commit(bump_version)
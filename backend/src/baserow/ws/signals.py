@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from baserow.api.applications.serializers import (
@@ -7,6 +8,7 @@ from baserow.api.applications.serializers import (
     get_application_serializer,
 )
 from baserow.api.user.serializers import PublicUserSerializer
+from baserow.api.user_files.serializers import UserFileSerializer
 from baserow.api.workspaces.invitations.serializers import (
     UserWorkspaceInvitationSerializer,
 )
@@ -27,6 +29,7 @@ from baserow.core.registries import object_scope_type_registry
 from baserow.core.user import signals as user_signals
 from baserow.core.utils import generate_hash
 
+from .cache import invalidate_permitted_users_cache
 from .tasks import (
     broadcast_application_created,
     broadcast_to_group,
@@ -383,3 +386,62 @@ def user_password_changed(sender, user, ignore_web_socket_id=None, **kwargs):
             [ignore_web_socket_id],
         )
     )
+
+
+@receiver(signals.user_file_thumbnails_generated)
+def user_file_thumbnails_generated(sender, user_file, **kwargs):
+    # The files uploaded anonymously, for example via a public form, don't have a
+    # user to notify.
+    if user_file.uploaded_by_id is None:
+        return
+
+    transaction.on_commit(
+        lambda: broadcast_to_users.delay(
+            [user_file.uploaded_by_id],
+            {
+                "type": "user_file_thumbnails_generated",
+                "user_file": UserFileSerializer(user_file).data,
+            },
+        )
+    )
+
+
+@receiver(signals.workspace_user_added)
+@receiver(signals.workspace_user_updated)
+@receiver(signals.workspace_user_deleted)
+@receiver(signals.workspace_restored)
+def invalidate_permitted_users_when_workspace_user_changed(
+    sender, workspace_user, **kwargs
+):
+    invalidate_permitted_users_cache(workspace_user.workspace_id)
+
+
+@receiver(post_save, sender=WorkspaceUser)
+@receiver(post_delete, sender=WorkspaceUser)
+def invalidate_permitted_users_when_workspace_user_saved(sender, instance, **kwargs):
+    # Also catches the workspace users that are changed without going through the
+    # handler, for example by the data fixtures in the tests.
+    invalidate_permitted_users_cache(instance.workspace_id)
+
+
+@receiver(signals.permissions_updated)
+def invalidate_permitted_users_when_permissions_updated(sender, workspace, **kwargs):
+    invalidate_permitted_users_cache(workspace.id)
+
+
+@receiver(signals.user_updated)
+@receiver(signals.user_deleted)
+@receiver(signals.user_restored)
+def invalidate_permitted_users_when_user_changed(sender, user, **kwargs):
+    for workspace_id in WorkspaceUser.objects.filter(user=user).values_list(
+        "workspace_id", flat=True
+    ):
+        invalidate_permitted_users_cache(workspace_id)
+
+
+@receiver(signals.user_permanently_deleted)
+def invalidate_permitted_users_when_user_permanently_deleted(
+    sender, workspace_ids, **kwargs
+):
+    for workspace_id in workspace_ids:
+        invalidate_permitted_users_cache(workspace_id)
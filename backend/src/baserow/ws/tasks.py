@@ -123,35 +123,46 @@ def broadcast_to_permitted_users(
     from baserow.core.models import Workspace, WorkspaceUser
     from baserow.core.registries import object_scope_type_registry
 
-    workspace = Workspace.objects.get(id=workspace_id)
+    from .cache import get_permitted_user_ids
 
-    users_in_workspace = [
-        workspace_user.user
-        for workspace_user in WorkspaceUser.objects.filter(
-            workspace=workspace
-        ).select_related("user")
-    ]
+    def compute_permitted_user_ids():
+        workspace = Workspace.objects.get(id=workspace_id)
 
-    scope_type = object_scope_type_registry.get(scope_name)
-    scope_model_class = scope_type.model_class
-
-    objects = (
-        scope_model_class.objects_and_trash
-        if issubclass(scope_model_class, TrashableModelMixin)
-        else scope_model_class.objects
-    )
+        users_in_workspace = [
+            workspace_user.user
+            for workspace_user in WorkspaceUser.objects.filter(
+                workspace=workspace
+            ).select_related("user")
+        ]
 
-    scope = objects.get(id=scope_id)
+        scope_type = object_scope_type_registry.get(scope_name)
+        scope_model_class = scope_type.model_class
 
-    user_ids = [
-        u.id
-        for u in CoreHandler().check_permission_for_multiple_actors(
-            users_in_workspace,
-            operation_type,
-            workspace,
-            context=scope,
+        objects = (
+            scope_model_class.objects_and_trash
+            if issubclass(scope_model_class, TrashableModelMixin)
+            else scope_model_class.objects
         )
-    ]
+
+        scope = objects.get(id=scope_id)
+
+        return [
+            u.id
+            for u in CoreHandler().check_permission_for_multiple_actors(
+                users_in_workspace,
+                operation_type,
+                workspace,
+                context=scope,
+            )
+        ]
+
+    user_ids = get_permitted_user_ids(
+        workspace_id,
+        operation_type,
+        scope_name,
+        scope_id,
+        compute_permitted_user_ids,
+    )
 
     broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
 
@@ -4,6 +4,7 @@ from django.conf import settings
 from django.core.files.storage import FileSystemStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.shortcuts import reverse
+from django.test import override_settings
 
 import httpretty as httpretty
 import pytest
@@ -20,6 +21,7 @@ from baserow.core.models import UserFile
 
 
 @pytest.mark.django_db
+@override_settings(BASEROW_USER_FILE_THUMBNAILS_ASYNC=False)
 def test_upload_file_with_jwt_auth(api_client, data_fixture, tmpdir):
     user, token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
@@ -146,6 +148,7 @@ def test_upload_file_with_jwt_auth(api_client, data_fixture, tmpdir):
 
 
 @pytest.mark.django_db
+@override_settings(BASEROW_USER_FILE_THUMBNAILS_ASYNC=False)
 def test_upload_file_with_token_auth(api_client, data_fixture, tmpdir):
     user, jwt_token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
@@ -1,11 +1,17 @@
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+from django.test.utils import override_settings
 
 import pytest
 
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowGetRow,
     LocalBaserowListRows,
@@ -243,6 +249,135 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+@pytest.mark.django_db
+def test_get_data_source_dependencies(data_fixture):
+    page = data_fixture.create_builder_page()
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="2"
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        row_id=f"concat(get('data_source.{data_source.id}.id'), "
+        f"get('page_parameter.id'))",
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id=f"get(concat('data_source.', '{data_source.id}'))"
+    )
+    data_source4 = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        page=page
+    )
+
+    handler = DataSourceHandler()
+    assert handler.get_data_source_dependencies(data_source) == set()
+    assert handler.get_data_source_dependencies(data_source2) == {data_source.id}
+    assert handler.get_data_source_dependencies(data_source3) is None
+    assert handler.get_data_source_dependencies(data_source4) == set()
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS=4)
+def test_dispatch_data_sources_concurrently(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["Volkswagen"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id=str(rows[1].id)
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.id')",
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id=str(rows[2].id)
+    )
+    data_source4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id="b"
+    )
+    data_sources = [data_source, data_source2, data_source3, data_source4]
+
+    dispatch_context = BuilderDispatchContext(MagicMock(), page)
+    handler = DataSourceHandler()
+    with patch.object(
+        handler,
+        "_dispatch_data_source_in_thread",
+        wraps=handler._dispatch_data_source_in_thread,
+    ) as mock_dispatch_in_thread:
+        result = handler.dispatch_data_sources(data_sources, dispatch_context)
+
+    assert mock_dispatch_in_thread.call_count == 4
+    assert result[data_source.id][fields[0].db_column] == "Audi"
+    assert result[data_source2.id][fields[0].db_column] == "Audi"
+    assert result[data_source3.id][fields[0].db_column] == "Volkswagen"
+    assert isinstance(result[data_source4.id], Exception)
+    assert dispatch_context.call_stack == set()
+    # Every thread writes to its own copy of the cache, which is merged into the
+    # cache of the request after each wave.
+    assert set(dispatch_context.cache["data_source_contents"]) == {
+        data_source.id,
+        data_source2.id,
+        data_source3.id,
+    }
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_BUILDER_PUBLIC_DATA_SOURCE_CACHE_TTL_SECONDS=60)
+def test_dispatch_data_source_of_public_builder_is_cached(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(user=user, workspace=None)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        page=page, integration=integration, table=table
+    )
+
+    handler = DataSourceHandler()
+
+    def dispatch(offset=0):
+        request = MagicMock(GET={"offset": offset})
+        return handler.dispatch_data_source(
+            data_source, BuilderDispatchContext(request, page)
+        )
+
+    with patch.object(
+        handler.service_handler,
+        "dispatch_service",
+        wraps=handler.service_handler.dispatch_service,
+    ) as mock_dispatch_service:
+        assert len(dispatch()["results"]) == 2
+        assert len(dispatch()["results"]) == 2
+        assert mock_dispatch_service.call_count == 1
+
+        # Another range is cached separately.
+        assert len(dispatch(offset=1)["results"]) == 1
+        assert mock_dispatch_service.call_count == 2
+
+        # Changing the rows of the table invalidates the cached results.
+        with django_capture_on_commit_callbacks(execute=True):
+            RowHandler().create_row(user, table, {})
+
+        assert len(dispatch()["results"]) == 3
+        assert mock_dispatch_service.call_count == 3
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
@@ -398,3 +398,59 @@ def test_remap_serialized_row_to_user_field_names(data_fixture):
         "Link": [{"id": 1, "value": "Lookup 1"}],
         "Test 1": "Test value",
     }
+
+
+@pytest.mark.django_db
+def test_get_row_serializer_class_is_cached(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user, name="Cars")
+    text_field = data_fixture.create_text_field(table=table, name="Color")
+    number_field = data_fixture.create_number_field(table=table, name="Horsepower")
+
+    model = table.get_model()
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=[text_field.id]
+    )
+    assert serializer_class is get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=[text_field.id]
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=False, field_ids=[text_field.id]
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=True
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model,
+        RowSerializer,
+        is_response=True,
+        field_kwargs={text_field.db_column: {"required": True}},
+    )
+
+    FieldHandler().update_field(user=user, field=number_field, name="Power")
+    table.refresh_from_db()
+    new_model = table.get_model()
+    new_serializer_class = get_row_serializer_class(
+        new_model, RowSerializer, is_response=True, user_field_names=True
+    )
+    assert "Power" in new_serializer_class().fields
+    assert new_serializer_class not in model._row_serializer_class_cache.values()
+
+
+@pytest.mark.django_db
+def test_get_row_serializer_class_cache_is_bounded(data_fixture, settings):
+    settings.BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE = 1
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model(use_cache=False)
+
+    serializer_class = get_row_serializer_class(model, RowSerializer)
+    get_row_serializer_class(model, RowSerializer, field_ids=[text_field.id])
+    assert len(model._row_serializer_class_cache) == 1
+    assert serializer_class is not get_row_serializer_class(model, RowSerializer)
+
+    settings.BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE = 0
+    model = table.get_model(use_cache=False)
+    serializer_class = get_row_serializer_class(model, RowSerializer)
+    assert serializer_class is not get_row_serializer_class(model, RowSerializer)
+    assert "_row_serializer_class_cache" not in model.__dict__
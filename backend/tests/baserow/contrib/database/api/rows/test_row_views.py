@@ -506,6 +506,43 @@ def test_list_rows_user_field_names(api_client, data_fixture):
     assert response_json["results"][0]["id"] == row_4.id
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor(data_fixture, api_client):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{text_field.id}": value})
+        for value in ["b", "a", None, "c", "a"]
+    ]
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?cursor=&size=3&order_by=-field_{text_field.id}",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == [
+        rows[3].id,
+        rows[0].id,
+        rows[1].id,
+    ]
+    assert response_json["previous"] is None
+
+    response = api_client.get(response_json["next"], HTTP_AUTHORIZATION=f"JWT {token}")
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == [rows[4].id, rows[2].id]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        f"{url}?cursor=&size=300", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
 @pytest.mark.django_db
 def test_list_rows_sort_query_overrides_existing_sort(data_fixture, api_client):
     user, jwt_token = data_fixture.create_user_and_token(
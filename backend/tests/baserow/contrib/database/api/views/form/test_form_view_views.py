@@ -5,6 +5,7 @@ from django.core.files.storage import FileSystemStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import connection
 from django.shortcuts import reverse
+from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
 
 import pytest
@@ -2254,6 +2255,7 @@ def test_submit_form_view_for_required_number_field_with_0(api_client, data_fixt
 
 
 @pytest.mark.django_db
+@override_settings(BASEROW_USER_FILE_THUMBNAILS_ASYNC=False)
 def test_upload_file_view(api_client, data_fixture, tmpdir):
     user, token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
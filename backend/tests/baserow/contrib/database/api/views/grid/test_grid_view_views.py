@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import Any, Dict, List
 
 from django.core.cache import cache
+from django.db import connection
 from django.shortcuts import reverse
 
 import pytest
@@ -26,6 +27,7 @@ from baserow.contrib.database.search.handler import ALL_SEARCH_MODES, SearchHand
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.tasks import compute_exact_view_row_count
 from baserow.test_utils.helpers import register_instance_temporarily
 
 
@@ -206,6 +208,152 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+    data_fixture.create_view_sort(view=grid, field=text_field, order="ASC")
+
+    model = grid.table.get_model()
+    text = f"field_{text_field.id}"
+    number = f"field_{number_field.id}"
+    row_1 = model.objects.create(**{text: "a", number: 10})
+    row_2 = model.objects.create(**{text: None, number: 10})
+    row_3 = model.objects.create(**{text: "b", number: None})
+    row_4 = model.objects.create(**{text: "c", number: 20})
+    row_5 = model.objects.create(**{text: "a", number: None})
+    expected_ids = [row_4.id, row_2.id, row_1.id, row_5.id, row_3.id]
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url, {"cursor": "", "size": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert "count" not in response_json
+    assert response_json["previous"] is None
+    assert [r["id"] for r in response_json["results"]] == expected_ids[:2]
+
+    response = api_client.get(response_json["next"], HTTP_AUTHORIZATION=f"JWT {token}")
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == expected_ids[2:4]
+    assert response_json["previous"]
+
+    response = api_client.get(response_json["next"], HTTP_AUTHORIZATION=f"JWT {token}")
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == expected_ids[4:]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        response_json["previous"], HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == expected_ids[2:4]
+
+    response = api_client.get(
+        response_json["previous"], HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == expected_ids[:2]
+    assert response_json["previous"] is None
+    assert response_json["next"]
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "include_count": "true"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    response_json = response.json()
+    assert response_json["count"] == 5
+    assert [r["id"] for r in response_json["results"]] == expected_ids
+
+    response = api_client.get(
+        url, {"cursor": "invalid"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        url, {"cursor": "", "size": 300}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
+@pytest.mark.django_db
+def test_list_rows_estimated_count(
+    api_client, data_fixture, settings, django_capture_on_commit_callbacks
+):
+    settings.BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD = 1
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    grid = data_fixture.create_grid_view(table=table)
+
+    model = grid.table.get_model()
+    text = f"field_{text_field.id}"
+    model.objects.create(**{text: "a"})
+    model.objects.create(**{text: "a"})
+    model.objects.create(**{text: "b"})
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    estimate = {"count": "", "count_mode": "estimate"}
+    response = api_client.get(url, estimate, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 3, "is_estimate": True}
+
+    data_fixture.create_view_filter(view=grid, field=text_field, value="a")
+    response = api_client.get(url, estimate, HTTP_AUTHORIZATION=f"JWT {token}")
+    # The whole table is sampled because it's smaller than the sample size.
+    assert response.json() == {"count": 2, "is_estimate": True}
+
+    response = api_client.get(url, {"count": ""}, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.json() == {"count": 2}
+
+    queryset = ViewHandler().get_queryset(grid, model=model)
+    count_sql = ViewHandler()._get_count_sql(queryset)[2]
+    cache_key = ViewHandler()._get_exact_row_count_cache_key(grid, count_sql)
+    compute_exact_view_row_count(cache_key, grid.id)
+
+    response = api_client.get(url, estimate, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.json() == {"count": 2, "is_estimate": False}
+
+    # Changing the rows invalidates the cached exact count.
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_row(user, table, {text: "a"}, model=model)
+    response = api_client.get(url, estimate, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.json()["is_estimate"] is True
+
+    cache_key = ViewHandler()._get_exact_row_count_cache_key(grid, count_sql)
+    compute_exact_view_row_count(cache_key, grid.id)
+    response = api_client.get(url, estimate, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.json() == {"count": 3, "is_estimate": False}
+
+    # Changing a field, like a conversion or a formula recalculation, invalidates
+    # the cached exact count as well.
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(user, text_field, name="Title")
+    response = api_client.get(url, estimate, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.json()["is_estimate"] is True
+
+    # The exact count isn't cached if the filters changed after it was scheduled.
+    count_sql = ViewHandler()._get_count_sql(queryset)[2]
+    cache_key = ViewHandler()._get_exact_row_count_cache_key(grid, count_sql)
+    data_fixture.create_view_filter(view=grid, field=text_field, value="b")
+    compute_exact_view_row_count(cache_key, grid.id)
+    assert cache.get(cache_key) is None
+
+    settings.BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD = 100
+    response = api_client.get(url, estimate, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.json() == {"count": 0, "is_estimate": False}
+
+
 @pytest.mark.django_db
 def test_list_rows_include_field_options(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
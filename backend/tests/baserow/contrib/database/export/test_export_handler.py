@@ -21,6 +21,7 @@ from baserow.contrib.database.export.exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
+from baserow.contrib.database.export.file_writer import PaginatedExportJobFileWriter
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import (
     EXPORT_JOB_CANCELLED_STATUS,
@@ -101,6 +102,30 @@ def test_csv_is_sorted_by_sorts(storage_mock, data_fixture):
     assert contents == expected
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_csv_is_sorted_by_sorts_across_batches(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["B", None, "A", "C", "B"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+
+    with patch.object(PaginatedExportJobFileWriter, "BATCH_SIZE", 2):
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    bom = "\ufeff"
+    expected = bom + "id,text_field\r\n4,C\r\n1,B\r\n5,B\r\n3,A\r\n2,\r\n"
+    assert contents == expected
+    job.refresh_from_db()
+    assert job.progress_percentage == 100.0
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.export.handler.default_storage")
 def test_csv_is_filtered_by_filters(storage_mock, data_fixture):
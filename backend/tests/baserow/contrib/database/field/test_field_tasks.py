@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from unittest.mock import call, patch
 
 from django.utils import timezone
 
@@ -7,7 +8,10 @@ import pytz
 from freezegun import freeze_time
 
 from baserow.contrib.database.fields.field_types import FormulaFieldType
-from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
+from baserow.contrib.database.fields.tasks import (
+    run_periodic_fields_updates,
+    run_periodic_fields_updates_for_workspace,
+)
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -370,3 +374,53 @@ def test_run_periodic_field_type_doesnt_update_trashed_workspace(data_fixture):
         assert getattr(row, f"field_{field.id}") == original_datetime
 
         assert FormulaFieldType().get_fields_needing_periodic_update().count() == 0
+
+
+@pytest.mark.django_db
+def test_run_periodic_fields_updates_dispatches_a_task_per_workspace(data_fixture):
+    workspace = data_fixture.create_workspace()
+    workspace_2 = data_fixture.create_workspace()
+    data_fixture.create_workspace()
+    for w in [workspace, workspace_2]:
+        database = data_fixture.create_database_application(workspace=w)
+        table = data_fixture.create_database_table(database=database)
+        data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+
+    with patch(
+        "baserow.contrib.database.fields.tasks.run_periodic_fields_updates.delay"
+    ) as mock_delay:
+        run_periodic_fields_updates(update_now=False)
+
+    assert sorted(mock_delay.call_args_list) == sorted(
+        [
+            call(workspace_id=workspace.id, update_now=False),
+            call(workspace_id=workspace_2.id, update_now=False),
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_run_periodic_fields_updates_only_updates_changed_rows(data_fixture):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    with freeze_time("2023-02-27 10:00"):
+        field = data_fixture.create_formula_field(table=table, formula="today()")
+        table_model = table.get_model()
+        row = table_model.objects.create()
+        table_model.objects.create()
+
+    assert getattr(row, f"field_{field.id}") == date(2023, 2, 27)
+
+    # The value of today() doesn't change during the day, so no row is rewritten.
+    with freeze_time("2023-02-27 18:00"):
+        assert run_periodic_fields_updates_for_workspace(workspace.id) == 0
+
+    with freeze_time("2023-02-28 09:00"):
+        assert run_periodic_fields_updates_for_workspace(workspace.id) == 2
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{field.id}") == date(2023, 2, 28)
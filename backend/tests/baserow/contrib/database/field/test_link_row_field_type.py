@@ -528,6 +528,109 @@ def test_link_row_enhance_queryset(data_fixture, django_assert_num_queries):
             list(getattr(row, f"field_{link_row_field.id}").all())
 
 
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_link_row_enhance_queryset_combines_fields(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    example_table = data_fixture.create_database_table(database=database)
+    customers_table = data_fixture.create_database_table(database=database)
+    cars_table = data_fixture.create_database_table(database=database)
+    customers_primary = data_fixture.create_text_field(
+        table=customers_table, primary=True
+    )
+    data_fixture.create_text_field(table=cars_table, primary=True)
+
+    field_handler = FieldHandler()
+    customers_field_1 = field_handler.create_field(
+        user=user,
+        table=example_table,
+        name="Customers 1",
+        type_name="link_row",
+        link_row_table=customers_table,
+    )
+    customers_field_2 = field_handler.create_field(
+        user=user,
+        table=example_table,
+        name="Customers 2",
+        type_name="link_row",
+        link_row_table=customers_table,
+    )
+    cars_field = field_handler.create_field(
+        user=user,
+        table=example_table,
+        name="Cars",
+        type_name="link_row",
+        link_row_table=cars_table,
+    )
+
+    customers_model = customers_table.get_model()
+    customer_1, customer_2, customer_3 = [
+        customers_model.objects.create(
+            order=order, **{f"field_{customers_primary.id}": name}
+        )
+        for order, name in [(3, "c"), (1, "a"), (2, "b")]
+    ]
+    car = cars_table.get_model().objects.create()
+
+    row_handler = RowHandler()
+    row_1 = row_handler.create_row(
+        user=user,
+        table=example_table,
+        values={
+            f"field_{customers_field_1.id}": [
+                customer_1.id,
+                customer_2.id,
+                customer_3.id,
+            ],
+            f"field_{customers_field_2.id}": [customer_1.id],
+            f"field_{cars_field.id}": [car.id],
+        },
+    )
+    row_2 = row_handler.create_row(user=user, table=example_table, values={})
+    customer_3.trashed = True
+    customer_3.save()
+
+    model = example_table.get_model()
+    # One query for the rows, one for the relations of all the link row fields and
+    # one for every related table.
+    with django_assert_num_queries(4):
+        rows = list(model.objects.all().enhance_by_fields())
+
+    with django_assert_num_queries(0):
+        related_rows = [
+            {
+                field.id: [r.id for r in getattr(row, f"field_{field.id}").all()]
+                for field in [customers_field_1, customers_field_2, cars_field]
+            }
+            for row in rows
+        ]
+
+    assert [row.id for row in rows] == [row_1.id, row_2.id]
+    # The related rows are ordered like the related table, and the trashed one is
+    # excluded.
+    assert related_rows[0] == {
+        customers_field_1.id: [customer_2.id, customer_1.id],
+        customers_field_2.id: [customer_1.id],
+        cars_field.id: [car.id],
+    }
+    assert related_rows[1] == {
+        customers_field_1.id: [],
+        customers_field_2.id: [],
+        cars_field.id: [],
+    }
+    with django_assert_num_queries(0):
+        customer = getattr(rows[0], f"field_{customers_field_1.id}").all()[0]
+        assert getattr(customer, f"field_{customers_primary.id}") == "a"
+
+    queryset = model.objects.all().enhance_by_fields()
+    rows = list(queryset.limit_link_row_items_per_cell(1))
+    related = getattr(rows[0], f"field_{customers_field_1.id}").all()
+    assert [r.id for r in related] == [customer_2.id]
+
+
 @pytest.mark.django_db
 @pytest.mark.field_link_row
 def test_link_row_field_type_api_views(api_client, data_fixture):
@@ -15,6 +15,7 @@ from baserow.contrib.database.fields.exceptions import (
 )
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import SelectOption, TextField
+from baserow.contrib.database.file_import.job_types import FileImportJobType
 from baserow.contrib.database.rows.exceptions import ReportMaxErrorCountExceeded
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataDuplicateName,
@@ -499,6 +500,42 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_streams_rows_of_data_file(
+    data_fixture, patch_filefield_storage
+):
+    user = data_fixture.create_user()
+    table, _, _ = data_fixture.build_table(
+        columns=[(f"col1", "text"), (f"col2", "number")],
+        rows=[],
+        user=user,
+    )
+
+    data = [[f"test\n{index}", index] for index in range(1024 + 5)]
+    data[1026] = ["test", "bad"]
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(table=table, data=[], user=user)
+        job_type = FileImportJobType()
+        job_type.after_job_creation(job, {"data": data})
+
+        with job_type.open_data_file(job) as (row_count, rows):
+            assert row_count == len(data)
+            assert not isinstance(rows, list)
+            assert next(rows) == data[0]
+
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+
+    model = table.get_model(attribute_names=True)
+    assert model.objects.count() == len(data) - 1
+    assert model.objects.order_by("id").first().col1 == "test\n0"
+    assert list(job.report["failing_rows"].keys()) == ["1026"]
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.formula import FormulaHandler
+from baserow.contrib.database.formula.parser import ast_mapper
+from baserow.contrib.database.formula.types.formula_types import BaserowFormulaTextType
+from baserow.core.formula.parser.exceptions import BaserowFormulaSyntaxError
+
+
+def test_raw_formula_to_untyped_expression_returns_copy_of_cached_expression():
+    formula = "concat(field('a'), upper('b'), 1, 1.5, true, lookup('c', 'd'))"
+
+    with patch.object(
+        ast_mapper,
+        "get_parse_tree_for_formula",
+        wraps=ast_mapper.get_parse_tree_for_formula,
+    ) as get_parse_tree:
+        ast_mapper._cached_raw_formula_to_untyped_expression.cache_clear()
+        first = FormulaHandler.raw_formula_to_untyped_expression(formula)
+        second = FormulaHandler.raw_formula_to_untyped_expression(formula)
+        assert get_parse_tree.call_count == 1
+
+    assert first is not second
+    assert str(first) == str(second)
+    assert first.args[0] is not second.args[0]
+    assert first.function_def is second.function_def
+    assert first.args[5].many and first.args[5].aggregate
+
+    first.with_type(BaserowFormulaTextType())
+    first.args[0].with_type(BaserowFormulaTextType())
+    assert second.expression_type is None
+    assert second.args[0].expression_type is None
+    assert (
+        FormulaHandler.raw_formula_to_untyped_expression(formula).expression_type
+        is None
+    )
+
+
+def test_raw_formula_to_untyped_expression_does_not_cache_errors():
+    ast_mapper._cached_raw_formula_to_untyped_expression.cache_clear()
+
+    for _ in range(2):
+        with pytest.raises(BaserowFormulaSyntaxError):
+            FormulaHandler.raw_formula_to_untyped_expression("upper(")
+
+    cache_info = ast_mapper._cached_raw_formula_to_untyped_expression.cache_info()
+    assert cache_info.currsize == 0
@@ -1,5 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
 from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
@@ -14,7 +15,11 @@ from baserow.contrib.database.api.utils import (
     extract_field_ids_from_string,
     get_include_exclude_fields,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.rows.error_report import RowErrorReport
+from baserow.contrib.database.rows.exceptions import (
+    ReportMaxErrorCountExceeded,
+    RowDoesNotExist,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
@@ -774,7 +779,7 @@ def test_import_rows(
 
     handler = RowHandler()
 
-    rows, report = handler.import_rows(
+    row_ids, report = handler.import_rows(
         user=user,
         table=table,
         data=[
@@ -796,11 +801,14 @@ def test_import_rows(
         ],
         send_realtime_update=False,
     )
-    assert len(rows) == 3
+    assert len(row_ids) == 3
     assert report == {}
 
     model = table.get_model()
     assert model.objects.count() == 3
+    assert sorted(row_ids) == list(
+        model.objects.order_by("id").values_list("id", flat=True)
+    )
 
     mocked_rows_created.assert_called_once()
     args = mocked_rows_created.call_args_list[0]
@@ -808,7 +816,7 @@ def test_import_rows(
     mocked_broadcast_to_users.assert_not_called()
     mocked_table_updated.assert_not_called()
 
-    rows, report = handler.import_rows(
+    row_ids, report = handler.import_rows(
         user=user,
         table=table,
         data=[
@@ -830,13 +838,13 @@ def test_import_rows(
         ],
     )
 
-    assert len(rows) == 1
+    assert len(row_ids) == 1
     assert sorted(report.keys()) == sorted([0, 1])
 
     model = table.get_model()
     assert model.objects.count() == 4
 
-    # create_rows_by_batch put the send_realtime_update to False
+    # import_rows puts the send_realtime_update to False
     # for the rows_created signal anyway, but this time the
     # table_updated signal is called and broadcast_to_permitted_users
     assert mocked_rows_created.call_count == 2
@@ -844,7 +852,7 @@ def test_import_rows(
     assert args[1]["send_realtime_update"] is False
     mocked_table_updated.assert_called_once()
 
-    rows, report = handler.import_rows(
+    row_ids, report = handler.import_rows(
         user=user,
         table=table,
         data=[
@@ -861,10 +869,34 @@ def test_import_rows(
         ],
     )
 
-    assert len(rows) == 1
+    assert len(row_ids) == 1
     assert sorted(report.keys()) == sorted([1, 2])
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.handler.BATCH_SIZE", 2)
+@patch(
+    "baserow.contrib.database.rows.handler.RowErrorReport",
+    partial(RowErrorReport, error_limit=1),
+)
+def test_import_rows_rolls_back_created_chunks_when_too_many_errors(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_number_field(table=table, name="Number", order=1)
+
+    # The first chunk is valid and created before the errors of the second chunk
+    # exceed the limit.
+    with pytest.raises(ReportMaxErrorCountExceeded):
+        RowHandler().import_rows(
+            user=user,
+            table=table,
+            data=[[1], [2], ["a"], ["b"]],
+            send_realtime_update=False,
+        )
+
+    assert table.get_model().objects.count() == 0
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.rows_updated.send")
 @patch("baserow.contrib.database.rows.signals.before_rows_update.send")
@@ -3,7 +3,11 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    generated_models_l1_cache,
+    get_cached_model_field_attrs,
+)
+from baserow.contrib.database.table.handler import TableHandler
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +208,84 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_generated_model_l1_cache(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+
+    model = table_a.get_model()
+    stats = generated_models_l1_cache.get_stats()
+
+    # Only the versions of the table and its related table must be fetched.
+    with django_assert_num_queries(1):
+        assert table_a.get_model() is model
+    assert generated_models_l1_cache.get_stats()["hits"] == stats["hits"] + 1
+
+    # A new field in the table itself must invalidate the cached model.
+    field = FieldHandler().create_field(user, table_a, "text", name="new")
+    new_model = table_a.get_model()
+    assert new_model is not model
+    assert field.id in new_model._field_objects
+    assert table_a.get_model() is new_model
+
+    # A change in a related table must invalidate the cached model as well.
+    FieldHandler().create_field(user, table_b, "text", name="related")
+    assert table_a.get_model() is not new_model
+
+    # Different variants of a model are cached separately.
+    filtered_model = table_a.get_model(field_ids=[field.id])
+    assert list(filtered_model._field_objects.keys()) == [field.id]
+    assert table_a.get_model(field_ids=[field.id]) is filtered_model
+    assert table_a.get_model(attribute_names=True) is not filtered_model
+
+
+@pytest.mark.django_db
+def test_generated_model_l1_cache_is_bounded(data_fixture, settings):
+    settings.BASEROW_GENERATED_MODEL_L1_CACHE_SIZE = 2
+    settings.BASEROW_GENERATED_MODEL_L1_CACHE_MAX_FIELDS = 3
+    generated_models_l1_cache.clear()
+    tables = [data_fixture.create_database_table() for _ in range(3)]
+    data_fixture.create_text_field(table=tables[2])
+    data_fixture.create_text_field(table=tables[2])
+
+    models = [table.get_model() for table in tables[:2]]
+    assert generated_models_l1_cache.get_stats()["size"] == 2
+
+    # The least recently used model is evicted when the size is exceeded.
+    assert tables[0].get_model() is models[0]
+    tables[2].get_model()
+    assert generated_models_l1_cache.get_stats()["size"] == 2
+    assert tables[0].get_model() is models[0]
+    assert tables[1].get_model() is not models[1]
+
+    # The total number of fields is bounded as well.
+    for table in tables[:2]:
+        data_fixture.create_text_field(table=table)
+        data_fixture.create_text_field(table=table)
+    tables[0].get_model()
+    tables[1].get_model()
+    assert generated_models_l1_cache.get_stats()["size"] == 1
+    assert generated_models_l1_cache.get_stats()["num_fields"] == 2
+
+
+@pytest.mark.django_db
+def test_generated_model_l1_cache_does_not_share_the_table(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user, name="Table")
+
+    model = table.get_model()
+    assert table.get_model() is model
+    assert model.baserow_table is not table
+    assert model.baserow_table is not model.baserow_table
+
+    # Changing the table of a cached model must not change it for the others.
+    model.baserow_table.name = "Changed"
+    assert model.baserow_table.name == "Table"
+
+    # Renaming the table must invalidate the cached models.
+    TableHandler().update_table(user, table, "Renamed")
+    renamed_model = table.get_model()
+    assert renamed_model is not model
+    assert renamed_model.baserow_table.name == "Renamed"
@@ -1,5 +1,6 @@
 import os
 import random
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
@@ -8,6 +9,7 @@ from django.core.exceptions import FieldDoesNotExist
 from django.core.files.storage import FileSystemStorage
 from django.db import connection
 from django.test.utils import override_settings
+from django.utils import timezone
 
 import pytest
 from pyinstrument import Profiler
@@ -24,6 +26,7 @@ from baserow.contrib.database.fields.models import (
     TextField,
 )
 from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
 )
@@ -619,6 +622,62 @@ def test_counting_many_rows_in_many_tables(data_fixture):
     print(profiler.output_text(unicode=True, color=True))
 
 
+@pytest.mark.django_db
+def test_count_rows_only_counts_stale_tables(data_fixture):
+    counted_table = data_fixture.create_database_table()
+    stale_table = data_fixture.create_database_table()
+    never_counted_table = data_fixture.create_database_table()
+    fill_table_rows(2, counted_table)
+    fill_table_rows(2, stale_table)
+    fill_table_rows(2, never_counted_table)
+
+    Table.objects.filter(id=counted_table.id).update(
+        row_count=1, row_count_updated_at=timezone.now()
+    )
+    Table.objects.filter(id=stale_table.id).update(
+        row_count=1, row_count_updated_at=timezone.now() - timedelta(days=30)
+    )
+
+    assert TableHandler.count_rows() == 2
+
+    counted_table.refresh_from_db()
+    stale_table.refresh_from_db()
+    never_counted_table.refresh_from_db()
+    assert counted_table.row_count == 1
+    assert stale_table.row_count == 2
+    assert never_counted_table.row_count == 2
+
+    assert TableHandler.count_rows(only_stale=False) == 3
+
+    counted_table.refresh_from_db()
+    assert counted_table.row_count == 2
+
+
+@pytest.mark.django_db
+def test_row_count_is_updated_when_rows_are_created_and_deleted(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = TableHandler().create_table_and_fields(
+        user, database, "Table", [("Name", "text", {})]
+    )
+    assert table.row_count == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        rows = RowHandler().create_rows(user, table, [{}, {}, {}])
+
+    table.refresh_from_db()
+    assert table.row_count == 3
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().delete_rows(user, table, [rows[0].id, rows[1].id])
+
+    table.refresh_from_db()
+    assert table.row_count == 1
+    assert TableHandler.get_total_row_count_of_workspace(database.workspace_id) == 1
+
+
 @pytest.mark.django_db
 def test_get_total_row_count_of_workspace(data_fixture):
     workspace = data_fixture.create_workspace()
@@ -1,9 +1,15 @@
 from datetime import datetime
+from io import BytesIO
+from unittest.mock import patch
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from django.test.utils import override_settings
 
 import pytest
 from freezegun import freeze_time
 from pytz import UTC
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import FormulaField, TextField
 from baserow.contrib.database.table.models import Table
 from baserow.core.handler import CoreHandler
@@ -110,6 +116,231 @@ def test_import_export_database(data_fixture):
     assert row_3.id == 3
 
 
+@pytest.mark.django_db
+def test_import_export_database_copy_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database, name="A")
+    related_table = data_fixture.create_database_table(database=database, name="B")
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_1 = data_fixture.create_select_option(field=single_select_field)
+    option_2 = data_fixture.create_select_option(field=multiple_select_field)
+    option_3 = data_fixture.create_select_option(field=multiple_select_field)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="link", link_row_table=related_table
+    )
+
+    related_model = related_table.get_model()
+    related_row_1, related_row_2 = related_model.objects.bulk_create(
+        [related_model(), related_model()]
+    )
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{
+            f"field_{text_field.id}": "Test",
+            f"field_{single_select_field.id}_id": option_1.id,
+        }
+    )
+    row_2 = model.objects.create(**{f"field_{text_field.id}": "Trashed"})
+    getattr(row_1, f"field_{multiple_select_field.id}").set([option_2, option_3])
+    getattr(row_1, f"field_{link_field.id}").set([related_row_1, related_row_2])
+    getattr(row_2, f"field_{link_field.id}").set([related_row_1])
+    model.objects_and_trash.filter(id=row_2.id).update(trashed=True)
+    related_model.objects_and_trash.filter(id=related_row_2.id).update(trashed=True)
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(
+        include_permission_data=True, copy_rows_in_database=True
+    )
+    serialized = database_type.export_serialized(database, config)
+    assert serialized["tables"][0]["rows"] == []
+
+    id_mapping = {}
+    imported_database = database_type.import_serialized(
+        database.workspace, serialized, config, id_mapping, None, None
+    )
+
+    imported_table = imported_database.table_set.get(name="A")
+    imported_related_table = imported_database.table_set.get(name="B")
+    imported_model = imported_table.get_model()
+    imported_related_model = imported_related_table.get_model()
+
+    assert [row.id for row in imported_model.objects.all()] == [row_1.id]
+    assert [row.id for row in imported_related_model.objects.all()] == [
+        related_row_1.id
+    ]
+
+    imported_row = imported_model.objects.get(id=row_1.id)
+    assert imported_row.trashed is False
+    assert imported_row.needs_background_update is True
+    new_field_id = id_mapping["database_fields"]
+    assert getattr(imported_row, f"field_{new_field_id[text_field.id]}") == "Test"
+    imported_option = getattr(
+        imported_row, f"field_{new_field_id[single_select_field.id]}"
+    )
+    assert imported_option.id != option_1.id
+    assert imported_option.value == option_1.value
+    imported_options = getattr(
+        imported_row, f"field_{new_field_id[multiple_select_field.id]}"
+    ).all()
+    assert sorted(o.value for o in imported_options) == sorted(
+        [option_2.value, option_3.value]
+    )
+    assert all(
+        o.field_id == new_field_id[multiple_select_field.id] for o in imported_options
+    )
+    assert [
+        r.id
+        for r in getattr(imported_row, f"field_{new_field_id[link_field.id]}").all()
+    ] == [related_row_1.id]
+    imported_related_row = imported_related_model.objects.get(id=related_row_1.id)
+    related_field_id = new_field_id[link_field.link_row_related_field_id]
+    assert [
+        r.id for r in getattr(imported_related_row, f"field_{related_field_id}").all()
+    ] == [row_1.id]
+
+    # It must still be possible to create a new row in the imported table
+    assert imported_model.objects.create().id > row_1.id
+
+
+@pytest.mark.django_db
+def test_duplicate_database_copies_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database, name="A")
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{text_field.id}": "Test"})
+
+    duplicated_database = CoreHandler().duplicate_application(user, database)
+
+    duplicated_table = duplicated_database.table_set.get(name="A")
+    duplicated_field = duplicated_table.field_set.get(name="text")
+    duplicated_rows = list(duplicated_table.get_model().objects.all())
+    assert [r.id for r in duplicated_rows] == [row.id]
+    assert getattr(duplicated_rows[0], f"field_{duplicated_field.id}") == "Test"
+    assert duplicated_rows[0].trashed is False
+    assert duplicated_rows[0].needs_background_update is True
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.application_types.EXPORT_SERIALIZED_ROWS_CHUNK_SIZE", 2
+)
+def test_import_export_database_rows_in_chunks(data_fixture):
+    database = data_fixture.create_database_application()
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{text_field.id}": f"Row {index}"})
+        for index in range(5)
+    ]
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(
+        include_permission_data=False, export_rows_in_chunks=True
+    )
+    files_buffer = BytesIO()
+    with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
+        serialized = database_type.export_serialized(database, config, files_zip)
+
+    serialized_table = serialized["tables"][0]
+    assert serialized_table["rows"] == []
+    assert [chunk["count"] for chunk in serialized_table["row_chunks"]] == [2, 2, 1]
+
+    id_mapping = {}
+    with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
+        imported_database = database_type.import_serialized(
+            data_fixture.create_workspace(),
+            serialized,
+            config,
+            id_mapping,
+            files_zip,
+            None,
+        )
+
+    imported_table = imported_database.table_set.get()
+    imported_field_name = f"field_{id_mapping['database_fields'][text_field.id]}"
+    assert [
+        (row.id, getattr(row, imported_field_name))
+        for row in imported_table.get_model().objects.all()
+    ] == [(row.id, f"Row {index}") for index, row in enumerate(rows)]
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_EXPORT_TABLE_ROWS_MAX_WORKERS=2)
+def test_export_database_rows_in_chunks_concurrently(data_fixture):
+    database = data_fixture.create_database_application()
+    tables = [data_fixture.create_database_table(database=database) for _ in range(3)]
+    text_fields = [
+        data_fixture.create_text_field(table=table, name="text") for table in tables
+    ]
+    for table_index, (table, text_field) in enumerate(zip(tables, text_fields)):
+        model = table.get_model()
+        for index in range(3):
+            model.objects.create(
+                **{f"field_{text_field.id}": f"Table {table_index} row {index}"}
+            )
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(
+        include_permission_data=False, export_rows_in_chunks=True
+    )
+    files_buffer = BytesIO()
+    with patch.object(
+        database_type,
+        "_export_serialized_row_chunks_in_snapshot",
+        wraps=database_type._export_serialized_row_chunks_in_snapshot,
+    ) as mock_export_in_snapshot, ZipFile(
+        files_buffer, "a", ZIP_DEFLATED, False
+    ) as files_zip:
+        with database_type.export_safe_transaction_context(database):
+            serialized = database_type.export_serialized(database, config, files_zip)
+
+    assert mock_export_in_snapshot.call_count == 3
+
+    with ZipFile(files_buffer, "r") as files_zip:
+        for table_index, (serialized_table, text_field) in enumerate(
+            zip(serialized["tables"], text_fields)
+        ):
+            assert serialized_table["rows"] == []
+            assert [
+                row[f"field_{text_field.id}"]
+                for row in database_type._iterate_serialized_rows(
+                    serialized_table, files_zip
+                )
+            ] == [f"Table {table_index} row {index}" for index in range(3)]
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_EXPORT_TABLE_ROWS_MAX_WORKERS=2)
+def test_export_database_rows_in_chunks_sequentially_after_writes(data_fixture):
+    database = data_fixture.create_database_application()
+    tables = [data_fixture.create_database_table(database=database) for _ in range(2)]
+    for table in tables:
+        text_field = data_fixture.create_text_field(table=table, name="text")
+        table.get_model().objects.create(**{f"field_{text_field.id}": "Row"})
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(
+        include_permission_data=False, export_rows_in_chunks=True
+    )
+    # The test transaction has written the tables and rows, which are not visible
+    # to other threads, so the rows must be exported in the current thread.
+    with patch.object(
+        database_type, "_export_serialized_row_chunks_in_snapshot"
+    ) as mock_export_in_snapshot, ZipFile(
+        BytesIO(), "a", ZIP_DEFLATED, False
+    ) as files_zip:
+        serialized = database_type.export_serialized(database, config, files_zip)
+
+    mock_export_in_snapshot.assert_not_called()
+    assert all(len(table["row_chunks"]) == 1 for table in serialized["tables"])
+
+
 @pytest.mark.django_db
 def test_create_application_and_init_with_data(data_fixture):
     core_handler = CoreHandler()
@@ -5,9 +5,11 @@ import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -467,3 +469,94 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db(transaction=True)
+def test_view_aggregations_are_updated_incrementally(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="hidden"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"},
+            text_field.id: {
+                "aggregation_type": "not_empty_count",
+                "aggregation_raw_type": "not_empty_count",
+            },
+        },
+    )
+
+    row_handler = RowHandler()
+    row_1 = row_handler.create_row(
+        user, table, {number_field.id: 10, text_field.id: "a"}
+    )
+    view_handler.get_view_field_aggregations(user, grid_view)
+
+    def assert_aggregations_are_cached_and_correct():
+        aggregations = GridViewType().get_aggregations(grid_view)
+        cached, need_computation = view_handler._get_aggregations_to_compute(
+            grid_view, aggregations
+        )
+        assert need_computation == {}
+        assert cached == view_handler.get_field_aggregations(
+            user, grid_view, aggregations
+        )
+
+    row_2 = row_handler.create_row(
+        user, table, {number_field.id: 5, text_field.id: "b"}
+    )
+    assert_aggregations_are_cached_and_correct()
+
+    row_handler.create_row(user, table, {number_field.id: 100, text_field.id: "hidden"})
+    assert_aggregations_are_cached_and_correct()
+
+    row_handler.update_row_by_id(
+        user, table, row_1.id, {number_field.id: 20, text_field.id: ""}
+    )
+    assert_aggregations_are_cached_and_correct()
+
+    row_handler.update_row_by_id(user, table, row_2.id, {text_field.id: "hidden"})
+    assert_aggregations_are_cached_and_correct()
+
+    row_handler.delete_row_by_id(user, table, row_1.id)
+    # The sum is zero now, which can't be told apart from an empty sum, so it must
+    # be computed again.
+    aggregations = GridViewType().get_aggregations(grid_view)
+    cached, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, aggregations
+    )
+    assert list(need_computation.keys()) == [number_field.db_column]
+    assert cached == {text_field.db_column: 0}
+
+
+@pytest.mark.django_db
+def test_incremental_aggregation_update_without_cached_values(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"}
+        },
+    )
+    model = table.get_model()
+
+    # No aggregation has been cached yet, so nothing has to be queried.
+    with django_assert_num_queries(0):
+        assert view_handler.prepare_incremental_aggregation_update(table, model) == []
+
+    view_handler.get_view_field_aggregations(user, grid_view)
+    assert len(view_handler.prepare_incremental_aggregation_update(table, model)) == 1
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import override_settings
 
@@ -38,7 +39,16 @@ from baserow.contrib.database.views.exceptions import (
     ViewSortNotSupported,
     ViewTypeDoesNotExist,
 )
+from baserow.contrib.database.views.filter_indexes import (
+    FILTER_INDEX_BTREE,
+    FILTER_INDEX_HASH,
+    FILTER_INDEX_PARTIAL,
+    FILTER_INDEX_TRIGRAM,
+    FILTER_INDEX_UPPER_TRIGRAM,
+    get_view_filter_indexes,
+)
 from baserow.contrib.database.views.handler import (
+    AUTO_INDEX_FILTER_SCANS_CACHE_KEY,
     PublicViewRows,
     ViewHandler,
     ViewIndexingHandler,
@@ -2031,15 +2041,12 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     )
 
     view_ptr_specific = public_grid_view.view_ptr.specific
-    with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
-        # public view
+    with django_assert_num_queries(0):
+        # The equal filter is checked in Python using the already loaded row.
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific
         ]
-    with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
-        # public view
+    with django_assert_num_queries(0):
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
     another_public_grid_view = data_fixture.create_grid_view(
@@ -2059,16 +2066,169 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
     specific_another_view = another_public_grid_view.view_ptr.specific
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(0):
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific,
             specific_another_view,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(0):
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
+    # A filter that can't be checked in Python falls back to one query per view.
+    data_fixture.create_view_filter(
+        view=another_public_grid_view,
+        field=filtered_field,
+        type="contains_word",
+        value="FilterValue",
+    )
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table,
+        model,
+        only_include_views_which_want_realtime_events=True,
+        updated_field_ids=[filtered_field.id, unfiltered_field.id],
+    )
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
+            view_ptr_specific,
+            specific_another_view,
+        ]
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
+
+
+@pytest.mark.django_db
+def test_public_view_row_checker_python_and_sql_checks_agree(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=single_select_field)
+    option_b = data_fixture.create_select_option(field=single_select_field)
+
+    filters = [
+        (text_field, "equal", "apple"),
+        (text_field, "not_equal", "apple"),
+        (text_field, "contains", "PL"),
+        (text_field, "contains_not", "pl"),
+        (text_field, "empty", ""),
+        (text_field, "not_empty", ""),
+        (number_field, "equal", "1.5"),
+        (number_field, "not_equal", "1.5"),
+        (number_field, "higher_than", "1"),
+        (number_field, "lower_than", "2.254"),
+        (number_field, "empty", ""),
+        (boolean_field, "boolean", "1"),
+        (boolean_field, "boolean", "0"),
+        (boolean_field, "not_empty", ""),
+        (single_select_field, "single_select_equal", str(option_a.id)),
+        (single_select_field, "single_select_not_equal", str(option_a.id)),
+        (single_select_field, "empty", ""),
+    ]
+    for field, filter_type, value in filters:
+        view = data_fixture.create_grid_view(user, table=table, public=True)
+        data_fixture.create_view_filter(
+            view=view, field=field, type=filter_type, value=value
+        )
+
+    or_view = data_fixture.create_grid_view(
+        user, table=table, public=True, filter_type="OR"
+    )
+    data_fixture.create_view_filter(
+        view=or_view, field=text_field, type="contains", value="app"
+    )
+    data_fixture.create_view_filter(
+        view=or_view, field=number_field, type="higher_than", value="2"
+    )
+    grouped_view = data_fixture.create_grid_view(user, table=table, public=True)
+    data_fixture.create_view_filter(
+        view=grouped_view, field=boolean_field, type="boolean", value="1"
+    )
+    filter_group = data_fixture.create_view_filter_group(
+        view=grouped_view, filter_type="OR"
+    )
+    data_fixture.create_view_filter(
+        view=grouped_view,
+        field=single_select_field,
+        type="single_select_equal",
+        value=str(option_b.id),
+        group=filter_group,
+    )
+    data_fixture.create_view_filter(
+        view=grouped_view,
+        field=text_field,
+        type="empty",
+        value="",
+        group=filter_group,
+    )
+
+    model = table.get_model()
+    values = [
+        ("apple", Decimal("1.5"), True, option_a),
+        ("Pineapple", Decimal("2.25"), False, option_b),
+        ("", Decimal("0"), True, None),
+        (None, None, False, option_b),
+        ("APPLE pie", Decimal("1.50"), True, None),
+    ]
+    for text, number, boolean, option in values:
+        model.objects.create(
+            **{
+                f"field_{text_field.id}": text,
+                f"field_{number_field.id}": number,
+                f"field_{boolean_field.id}": boolean,
+                f"field_{single_select_field.id}": option,
+            }
+        )
+    rows = list(model.objects.all())
+
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+    assert len(row_checker._views_with_filters) == len(filters) + 2
+    for view, filter_qs, predicate, _ in row_checker._views_with_filters:
+        assert predicate is not None
+        sql_visible_ids = set(filter_qs.values_list("id", flat=True))
+        assert {row.id for row in rows if predicate(row)} == sql_visible_ids
+        assert (
+            set(row_checker._check_rows_visible(filter_qs, predicate, rows))
+            == sql_visible_ids
+        )
+
+
+@pytest.mark.django_db
+def test_public_view_row_checker_falls_back_to_sql_for_unsupported_rows(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    public_grid_view = data_fixture.create_grid_view(user, table=table, public=True)
+    data_fixture.create_view_filter(
+        view=public_grid_view, field=text_field, type="contains", value="clair"
+    )
+    model = table.get_model()
+    ascii_row = model.objects.create(**{f"field_{text_field.id}": "Eclair"})
+    non_ascii_row = model.objects.create(**{f"field_{text_field.id}": "ÉCLAIR"})
+
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+    view = public_grid_view.view_ptr.specific
+    with django_assert_num_queries(0):
+        assert row_checker.get_public_views_where_row_is_visible(ascii_row) == [view]
+    # The case of non ASCII characters is compared by the database.
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_row_is_visible(non_ascii_row) == [
+            view
+        ]
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_rows_are_visible(
+            [ascii_row, non_ascii_row]
+        ) == [PublicViewRows(view, {ascii_row.id, non_ascii_row.id})]
+
 
 @pytest.mark.django_db
 def test_cant_get_view_filter_when_view_trashed(data_fixture):
@@ -3055,7 +3215,7 @@ def test_loading_a_view_checks_for_db_index_without_additional_queries(
     view = view_handler.get_view(
         grid_view.id,
         base_queryset=GridView.objects.prefetch_related(
-            "viewsort_set", "viewgroupby_set"
+            "viewsort_set", "viewgroupby_set", "viewfilter_set"
         ),
     )
     get_collation_name()
@@ -3074,7 +3234,7 @@ def test_loading_a_view_checks_for_db_index_without_additional_queries(
     view = view_handler.get_view(
         grid_view.id,
         base_queryset=GridView.objects.prefetch_related(
-            "viewsort_set", "viewgroupby_set"
+            "viewsort_set", "viewgroupby_set", "viewfilter_set"
         ),
     )
     assert view.db_index_name
@@ -3748,3 +3908,187 @@ def test_filter_builder_is_created_correctly_with_filter_groups(data_fixture):
     rows = view_handler.apply_filters(grid_view, model.objects.all())
     row_ids = [row.id for row in rows]
     assert row_ids == [row_1.id, row_5.id, row_6.id]
+
+
+@pytest.mark.django_db
+def test_get_view_filter_indexes(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=single_select_field)
+    grid_view = data_fixture.create_grid_view(table=table)
+    for field, filter_type, value in [
+        (text_field, "contains", "a"),
+        (text_field, "contains_word", "b"),
+        (text_field, "equal", "c"),
+        (text_field, "contains_not", "d"),
+        (number_field, "higher_than", "1"),
+        (number_field, "lower_than", "10"),
+        (boolean_field, "boolean", "1"),
+        (date_field, "date_after", "UTC?2023-01-01"),
+        (single_select_field, "single_select_equal", str(option.id)),
+        (number_field, "is_even_and_whole", ""),
+    ]:
+        data_fixture.create_view_filter(
+            view=grid_view, field=field, type=filter_type, value=value
+        )
+
+    model = table.get_model()
+    indexes = get_view_filter_indexes(grid_view, model)
+    assert [(index.kind, index.column, index.value) for index in indexes] == [
+        (FILTER_INDEX_UPPER_TRIGRAM, f"field_{text_field.id}", None),
+        (FILTER_INDEX_TRIGRAM, f"field_{text_field.id}", None),
+        (FILTER_INDEX_HASH, f"field_{text_field.id}", None),
+        (FILTER_INDEX_BTREE, f"field_{number_field.id}", None),
+        (FILTER_INDEX_PARTIAL, f"field_{boolean_field.id}", True),
+        (FILTER_INDEX_BTREE, f"field_{date_field.id}", None),
+        (FILTER_INDEX_PARTIAL, f"field_{single_select_field.id}_id", option.id),
+    ]
+    assert len({index.name for index in indexes}) == len(indexes)
+
+    # The filters of a view with the OR filter type don't restrict all the rows.
+    grid_view.filter_type = "OR"
+    assert get_view_filter_indexes(grid_view, model) == []
+
+    grid_view.filter_type = "AND"
+    grid_view.filters_disabled = True
+    assert get_view_filter_indexes(grid_view, model) == []
+
+
+@override_settings(AUTO_INDEX_VIEW_ENABLED=True, AUTO_INDEX_VIEW_FILTERS_ENABLED=True)
+@pytest.mark.django_db(transaction=True)
+def test_view_filters_create_shared_indexes_and_remove_unused_ones(
+    data_fixture, enable_singleton_testing
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(user=user, table=table)
+    number_field = data_fixture.create_number_field(user=user, table=table)
+    handler = ViewHandler()
+    grid_view = handler.create_view(
+        user=user,
+        table=table,
+        type_name="grid",
+        name="Test grid",
+        ownership_type=OWNERSHIP_TYPE_COLLABORATIVE,
+    )
+    grid_view_2 = handler.create_view(
+        user=user,
+        table=table,
+        type_name="grid",
+        name="Test grid 2",
+        ownership_type=OWNERSHIP_TYPE_COLLABORATIVE,
+    )
+
+    contains_filter = handler.create_filter(
+        user, grid_view, text_field, "contains", "test"
+    )
+    handler.create_filter(user, grid_view_2, text_field, "contains", "other")
+    higher_than_filter = handler.create_filter(
+        user, grid_view, number_field, "higher_than", "1"
+    )
+
+    model = table.get_model()
+    contains_index, higher_than_index = get_view_filter_indexes(grid_view, model)
+    assert ViewIndexingHandler.get_existing_filter_index_names(table.id) == {
+        contains_index.name,
+        higher_than_index.name,
+    }
+
+    handler.delete_filter(user, higher_than_filter)
+    assert ViewIndexingHandler.get_existing_filter_index_names(table.id) == {
+        contains_index.name
+    }
+
+    # The index is still needed by the filter of the second view.
+    handler.delete_filter(user, contains_filter)
+    assert ViewIndexingHandler.get_existing_filter_index_names(table.id) == {
+        contains_index.name
+    }
+
+    trash_handler = TrashHandler()
+    trash_handler.trash(user, table.database.workspace, table.database, grid_view_2)
+    trash_handler.permanently_delete(grid_view_2)
+    assert ViewIndexingHandler.get_existing_filter_index_names(table.id) == set()
+
+
+@override_settings(AUTO_INDEX_VIEW_ENABLED=True, AUTO_INDEX_VIEW_FILTERS_ENABLED=True)
+@pytest.mark.django_db(transaction=True)
+def test_drop_unused_view_filter_indexes(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    model = table.get_model()
+    (index,) = ViewIndexingHandler.add_missing_filter_indexes(grid_view, model)
+    grid_view.db_filter_index_names = [index]
+    grid_view.save(update_fields=["db_filter_index_names"])
+    cache.delete(AUTO_INDEX_FILTER_SCANS_CACHE_KEY)
+
+    # The first run only records how many times the indexes have been scanned.
+    assert ViewIndexingHandler.drop_unused_filter_indexes() == []
+    assert ViewIndexingHandler.drop_unused_filter_indexes() == [index]
+    assert ViewIndexingHandler.get_existing_filter_index_names(table.id) == set()
+    grid_view.refresh_from_db()
+    assert grid_view.db_filter_index_names == []
+
+    # The dropped index is not created again right away.
+    assert ViewIndexingHandler.get_missing_filter_indexes(grid_view, model) == []
+    assert ViewIndexingHandler.add_missing_filter_indexes(grid_view, model) == []
+
+    with patch(
+        "baserow.contrib.database.views.handler.ViewIndexingHandler"
+        ".schedule_index_update"
+    ) as schedule_mock:
+        ViewIndexingHandler.schedule_index_creation_if_needed(grid_view, model)
+        schedule_mock.assert_not_called()
+
+        # But the view is updated again once the index is not skipped anymore.
+        cache.delete(ViewIndexingHandler._get_filter_index_skipped_cache_key(index))
+        ViewIndexingHandler.schedule_index_creation_if_needed(grid_view, model)
+        schedule_mock.assert_called_once()
+
+
+@override_settings(AUTO_INDEX_VIEW_ENABLED=True, AUTO_INDEX_VIEW_FILTERS_ENABLED=True)
+@pytest.mark.django_db(transaction=True)
+def test_view_filter_index_names_are_stored_on_the_view(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(user=user, table=table)
+    handler = ViewHandler()
+    grid_view = handler.create_view(
+        user=user,
+        table=table,
+        type_name="grid",
+        name="Test grid",
+        ownership_type=OWNERSHIP_TYPE_COLLABORATIVE,
+    )
+    handler.create_filter(user, grid_view, number_field, "higher_than", "1")
+
+    model = table.get_model()
+    (index,) = get_view_filter_indexes(grid_view, model)
+    grid_view.refresh_from_db()
+    assert grid_view.db_filter_index_names == [index.name]
+
+    with patch(
+        "baserow.contrib.database.views.handler.ViewIndexingHandler"
+        ".schedule_index_update"
+    ) as schedule_mock:
+        ViewIndexingHandler.schedule_index_creation_if_needed(grid_view, model)
+        schedule_mock.assert_not_called()
+
+        # Only the changes of the filters of the view update its indexes.
+        handler.update_view(user=user, view=grid_view, name="Test")
+        schedule_mock.assert_not_called()
+
+        handler.update_view(user=user, view=grid_view, filter_type="OR")
+        schedule_mock.assert_called_once()
+
+        grid_view.db_filter_index_names = []
+        ViewIndexingHandler.schedule_index_creation_if_needed(grid_view, model)
+        assert schedule_mock.call_count == 2
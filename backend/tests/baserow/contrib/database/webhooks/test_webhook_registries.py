@@ -1,6 +1,8 @@
 import uuid
 from unittest.mock import patch
 
+from django.db import transaction
+
 import pytest
 
 from baserow.contrib.database.rows.handler import RowHandler
@@ -39,3 +41,85 @@ def test_signal_listener(mock_call_webhook, data_fixture):
         "event_type": "rows.created",
         "items": [{"id": 1, "order": "1.00000000000000000000"}],
     }
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+def test_signal_listener_merges_events_in_same_transaction(
+    mock_call_webhook, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_table_webhook(
+        user=user,
+        table=table,
+        url="http://localhost/",
+        include_all_events=False,
+        events=["rows.created", "rows.deleted"],
+    )
+
+    with transaction.atomic():
+        row_1 = RowHandler().create_row(user=user, table=table, values={})
+        row_2 = RowHandler().create_row(user=user, table=table, values={})
+        RowHandler().delete_row_by_id(user=user, table=table, row_id=row_1.id)
+        mock_call_webhook.delay.assert_not_called()
+
+    assert mock_call_webhook.delay.call_count == 2
+    created_kwargs = mock_call_webhook.delay.call_args_list[0][1]
+    assert created_kwargs["event_type"] == "rows.created"
+    assert [item["id"] for item in created_kwargs["payload"]["items"]] == [
+        row_1.id,
+        row_2.id,
+    ]
+    deleted_kwargs = mock_call_webhook.delay.call_args_list[1][1]
+    assert deleted_kwargs["event_type"] == "rows.deleted"
+    assert deleted_kwargs["payload"]["row_ids"] == [row_1.id]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+def test_signal_listener_batches_are_limited_and_rolled_back(
+    mock_call_webhook, data_fixture, settings
+):
+    settings.BASEROW_WEBHOOKS_MAX_EVENTS_PER_CALL = 2
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_table_webhook(
+        user=user,
+        table=table,
+        url="http://localhost/",
+        include_all_events=False,
+        events=["rows.created"],
+    )
+
+    with transaction.atomic():
+        rows = [
+            RowHandler().create_row(user=user, table=table, values={}) for _ in range(3)
+        ]
+        try:
+            with transaction.atomic():
+                RowHandler().create_row(user=user, table=table, values={})
+                raise ValueError("Roll back the savepoint.")
+        except ValueError:
+            pass
+
+    assert mock_call_webhook.delay.call_count == 2
+    assert [
+        [item["id"] for item in call[1]["payload"]["items"]]
+        for call in mock_call_webhook.delay.call_args_list
+    ] == [[rows[0].id, rows[1].id], [rows[2].id]]
+
+    # The rolled back transaction doesn't leave anything behind for the next one.
+    mock_call_webhook.delay.reset_mock()
+    try:
+        with transaction.atomic():
+            RowHandler().create_row(user=user, table=table, values={})
+            raise ValueError("Roll back the transaction.")
+    except ValueError:
+        pass
+    with transaction.atomic():
+        row = RowHandler().create_row(user=user, table=table, values={})
+
+    mock_call_webhook.delay.assert_called_once()
+    payload = mock_call_webhook.delay.call_args[1]["payload"]
+    assert [item["id"] for item in payload["items"]] == [row.id]
@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from django.db import transaction
+from django.db import connection, transaction
 from django.test import override_settings
 
 import httpretty
@@ -207,3 +207,29 @@ def test_can_call_webhook_to_localhost_when_private_addresses_allowed(
     assert not call.error
     assert call.response_status == 201
     assert webhook.active
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+def test_call_webhook_makes_request_outside_of_transaction(data_fixture):
+    webhook = data_fixture.create_table_webhook()
+    in_atomic_block = []
+
+    def callback(request):
+        in_atomic_block.append(connection.in_atomic_block)
+        return 200, {}, "{}"
+
+    responses.add_callback(responses.POST, "http://localhost/", callback=callback)
+
+    call_webhook.run(
+        webhook_id=webhook.id,
+        event_id="00000000-0000-0000-0000-000000000000",
+        event_type="rows.created",
+        method="POST",
+        url="http://localhost/",
+        headers={},
+        payload={"type": "rows.created"},
+    )
+
+    assert in_atomic_block == [False]
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 1
@@ -2,6 +2,7 @@ from collections import OrderedDict
 from typing import Any, Dict, List
 from unittest.mock import call, patch
 
+from django.core.cache import cache
 from django.db import transaction
 
 import pytest
@@ -15,6 +16,12 @@ from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
 )
+from baserow.contrib.database.ws.rows.coalescer import (
+    compact_rows_updated_message,
+    flush_rows_updated,
+    group_rows_updated_messages,
+    merge_rows_updated_messages,
+)
 from baserow.test_utils.helpers import AnyInt, register_instance_temporarily
 
 
@@ -309,3 +316,148 @@ def test_rows_history_updated(mock_broadcast_channel_group, data_fixture):
     ]
 
     assert mock_broadcast_channel_group.mock_calls == table_and_row_broadcast_calls
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated_are_coalesced(
+    mock_broadcast_to_channel_group, data_fixture, settings
+):
+    settings.BASEROW_WS_ROWS_UPDATED_COALESCE_WINDOW_MS = 1000
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    row = RowHandler().create_row(user=user, table=table)
+    mock_broadcast_to_channel_group.delay.reset_mock()
+
+    with patch(
+        "baserow.contrib.database.ws.rows.coalescer.flush_rows_updated"
+    ) as mock_flush_rows_updated:
+        for value in ["a", "b", "c"]:
+            RowHandler().update_row_by_id(
+                user=user,
+                table=table,
+                row_id=row.id,
+                values={f"field_{field.id}": value},
+            )
+
+    # Only the first update is broadcast right away, the others are buffered until
+    # the end of the window.
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    mock_flush_rows_updated.apply_async.assert_called_once_with(
+        (table.id,), countdown=1
+    )
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][1]["type"] == "rows_updated"
+    assert args[0][1]["rows"][0][f"field_{field.id}"] == "a"
+
+    mock_broadcast_to_channel_group.delay.reset_mock()
+    settings.BASEROW_WS_ROWS_UPDATED_COALESCE_WINDOW_MS = 0
+    flush_rows_updated(table.id)
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][1]["type"] == "rows_updated"
+    assert len(args[0][1]["rows"]) == 1
+    assert args[0][1]["rows_before_update"][0][f"field_{field.id}"] == "a"
+    assert args[0][1]["rows"][0][f"field_{field.id}"] == "c"
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated_buffered_after_window_expired_are_broadcast_first(
+    mock_broadcast_to_channel_group, data_fixture, settings
+):
+    settings.BASEROW_WS_ROWS_UPDATED_COALESCE_WINDOW_MS = 1000
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    row = RowHandler().create_row(user=user, table=table)
+
+    with patch("baserow.contrib.database.ws.rows.coalescer.flush_rows_updated"):
+        for value in ["a", "b"]:
+            RowHandler().update_row_by_id(
+                user=user,
+                table=table,
+                row_id=row.id,
+                values={f"field_{field.id}": value},
+            )
+
+        # The flush task is delayed until after the window has expired.
+        cache.delete(f"ws_rows_updated_window_{table.id}")
+        mock_broadcast_to_channel_group.delay.reset_mock()
+        RowHandler().update_row_by_id(
+            user=user, table=table, row_id=row.id, values={f"field_{field.id}": "c"}
+        )
+
+    # The buffered update is broadcast together with the new one, and not lost.
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][1]["rows_before_update"][0][f"field_{field.id}"] == "a"
+    assert args[0][1]["rows"][0][f"field_{field.id}"] == "c"
+
+
+def test_group_rows_updated_messages():
+    def message(*row_ids):
+        return {"rows": [{"id": row_id} for row_id in row_ids]}
+
+    a1, b2, a3, a2, b1 = message(1), message(2), message(3), message(2), message(1)
+    groups = group_rows_updated_messages(
+        [("a", a1), ("b", b2), ("a", a3), ("a", a2), ("b", b1)]
+    )
+
+    # The updates of other rows can be merged with an earlier group of the same web
+    # socket, but the second update of row 2 must be broadcast after the one of web
+    # socket `b`.
+    assert groups == [("a", [a1, a3]), ("b", [b2, b1]), ("a", [a2])]
+
+
+def test_merge_rows_updated_messages():
+    assert merge_rows_updated_messages([]) is None
+
+    merged = merge_rows_updated_messages(
+        [
+            {
+                "type": "rows_updated",
+                "table_id": 1,
+                "rows_before_update": [{"id": 1, "v": "a"}, {"id": 2, "v": "a"}],
+                "rows": [{"id": 1, "v": "b"}, {"id": 2, "v": "b"}],
+                "metadata": {1: {"m": 1}},
+            },
+            {
+                "type": "rows_updated",
+                "table_id": 1,
+                "rows_before_update": [{"id": 1, "v": "b"}],
+                "rows": [{"id": 1, "v": "c"}],
+                "metadata": {1: {"m": 2}},
+            },
+        ]
+    )
+
+    assert merged == {
+        "type": "rows_updated",
+        "table_id": 1,
+        "rows_before_update": [{"id": 1, "v": "a"}, {"id": 2, "v": "a"}],
+        "rows": [{"id": 1, "v": "c"}, {"id": 2, "v": "b"}],
+        "metadata": {1: {"m": 2}},
+    }
+
+
+def test_compact_rows_updated_message(settings):
+    message = {
+        "type": "rows_updated",
+        "table_id": 1,
+        "rows_before_update": [{"id": 1, "v": "a" * 100}],
+        "rows": [{"id": 1, "v": "b" * 100}],
+        "metadata": {},
+    }
+
+    settings.BASEROW_WS_ROWS_UPDATED_MAX_PAYLOAD_SIZE = 10000
+    assert compact_rows_updated_message(message) == message
+
+    settings.BASEROW_WS_ROWS_UPDATED_MAX_PAYLOAD_SIZE = 100
+    assert compact_rows_updated_message(message) == {
+        "type": "rows_changed",
+        "table_id": 1,
+        "row_ids": [1],
+    }
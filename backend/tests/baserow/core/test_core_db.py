@@ -2,7 +2,7 @@ from unittest.mock import MagicMock
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
-from django.db.models import CharField, Value
+from django.db.models import CharField, F, Value
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.functions import Concat
 from django.test.utils import override_settings
@@ -23,6 +23,9 @@ from baserow.core.db import (
     LockedAtomicTransaction,
     MultiFieldPrefetchQuerysetMixin,
     QuerySet,
+    bulk_insert_with_copy,
+    keyset_iterator,
+    sample_queryset,
     specific_iterator,
 )
 from baserow.core.models import Settings, Workspace
@@ -503,3 +506,80 @@ def test_multiple_field_prefetch__many_to_many_missing_source(data_fixture):
     )
     row = rows[0]
     assert len(row.field.all()) == 1
+
+
+@pytest.mark.django_db
+def test_keyset_iterator(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    number_field = data_fixture.create_number_field(table=table, name="number")
+    model = table.get_model(attribute_names=True)
+    for text, number in [("b", 1), (None, 2), ("a", None), ("b", None), ("a", 3)]:
+        model.objects.create(text=text, number=number)
+
+    queryset = model.objects.all().order_by(
+        F("text").asc(nulls_first=True), F("number").desc(nulls_last=True)
+    )
+    expected = [(r.text, r.number) for r in queryset]
+
+    # Five rows in chunks of two results in three queries.
+    with django_assert_num_queries(3):
+        rows = list(keyset_iterator(queryset, chunk_size=2))
+
+    assert [(r.text, r.number) for r in rows] == expected
+    assert [(r.text, r.number) for r in keyset_iterator(queryset, 1)] == expected
+    assert [r.id for r in keyset_iterator(model.objects.all(), 2)] == [
+        r.id for r in model.objects.all()
+    ]
+
+
+@pytest.mark.django_db
+def test_sample_queryset(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="text")
+    model = table.get_model(attribute_names=True)
+    for text in ["a", "b", "a"]:
+        model.objects.create(text=text)
+
+    queryset = model.objects.filter(text="a").annotate(other=Value("x"))
+    sampled_queryset = sample_queryset(queryset, 100, seed=0)
+    assert "TABLESAMPLE SYSTEM" in str(sampled_queryset.query)
+    assert "TABLESAMPLE" not in str(queryset.query)
+    assert sampled_queryset.count() == 2
+    assert sample_queryset(model.objects.all(), 0, seed=0).count() == 0
+
+
+@pytest.mark.django_db
+def test_bulk_insert_with_copy(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="text")
+    data_fixture.create_number_field(
+        table=table, name="number", number_decimal_places=2
+    )
+    data_fixture.create_boolean_field(table=table, name="boolean")
+    data_fixture.create_date_field(table=table, name="date")
+    model = table.get_model(attribute_names=True)
+
+    texts = ["a\tb", "back\\slash\nnew line", None]
+    rows = bulk_insert_with_copy(
+        model,
+        [
+            model(text=text, number="1.50", boolean=index == 0, order=index + 1)
+            for index, text in enumerate(texts)
+        ],
+    )
+
+    assert all(row.id is not None for row in rows)
+    assert not any(row._state.adding for row in rows)
+    assert [
+        (r.id, r.text, str(r.number), r.boolean, r.date)
+        for r in model.objects.order_by("id")
+    ] == [
+        (rows[0].id, texts[0], "1.50", True, None),
+        (rows[1].id, texts[1], "1.50", False, None),
+        (rows[2].id, None, "1.50", False, None),
+    ]
+    assert rows[0].created_on is not None
+
+    # The sequence must be in sync with the inserted ids.
+    assert model.objects.create().id > rows[-1].id
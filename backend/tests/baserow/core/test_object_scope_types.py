@@ -1,3 +1,5 @@
+import pytest
+
 from baserow.core.mixins import HierarchicalModelMixin
 from baserow.core.registries import object_scope_type_registry
 
@@ -9,3 +11,28 @@ def test_all_scope_types_with_model_classes_are_hierarchical():
                 "All ObjectScopeType.model_class classes must implement the "
                 "HierarchicalModelMixin"
             )
+
+
+@pytest.mark.django_db
+def test_get_objects_in_scopes(data_fixture):
+    workspace = data_fixture.create_workspace()
+    database1 = data_fixture.create_database_application(workspace=workspace)
+    database2 = data_fixture.create_database_application(workspace=workspace)
+    other_database = data_fixture.create_database_application()
+    table11 = data_fixture.create_database_table(database=database1)
+    table12 = data_fixture.create_database_table(database=database1)
+    table21 = data_fixture.create_database_table(database=database2)
+    other_table = data_fixture.create_database_table(database=other_database)
+    data_fixture.create_database_table()
+
+    table_scope_type = object_scope_type_registry.get("database_table")
+
+    assert table_scope_type.get_objects_in_scopes(
+        [workspace, database1, database2, other_database]
+    ) == {
+        workspace: {table11, table12, table21},
+        database1: {table11, table12},
+        database2: {table21},
+        other_database: {other_table},
+    }
+    assert table_scope_type.get_objects_in_scopes([table11]) == {table11: {table11}}
@@ -1,9 +1,11 @@
 import string
 from io import BytesIO
+from unittest.mock import patch
 
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
 
 import httpretty
 import pytest
@@ -230,6 +232,68 @@ def test_upload_user_file(data_fixture, tmpdir):
     )
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_USER_FILE_THUMBNAILS_ASYNC=True)
+def test_upload_user_file_generates_thumbnails_in_background(
+    data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with patch("baserow.core.user_files.handler.default_storage", new=storage), patch(
+        "baserow.core.user_files.handler.user_file_thumbnails_generated"
+    ) as mock_signal:
+        with django_capture_on_commit_callbacks() as callbacks:
+            user_file = handler.upload_user_file(user, "image.png", image_bytes)
+
+        # The upload doesn't wait for the thumbnails.
+        assert tmpdir.join("user_files", user_file.name).isfile()
+        assert not tmpdir.join("thumbnails", "tiny", user_file.name).isfile()
+        mock_signal.send.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+
+    file_path = tmpdir.join("thumbnails", "tiny", user_file.name)
+    assert file_path.isfile()
+    thumbnail = Image.open(file_path.open("rb"))
+    assert thumbnail.width == 21
+    assert thumbnail.height == 21
+    mock_signal.send.assert_called_once_with(handler, user_file=user_file)
+
+
+@pytest.mark.django_db
+def test_reduce_image_for_thumbnails():
+    handler = UserFileHandler()
+
+    image_bytes = BytesIO()
+    Image.new("RGB", (2000, 1500), color="red").save(image_bytes, format="JPEG")
+    # JPEG images are decoded at a reduced scale of at most 1/8.
+    image = handler.reduce_image_for_thumbnails(Image.open(image_bytes), 100, 100)
+    assert image.size == (250, 188)
+
+    image_bytes = BytesIO()
+    Image.new("RGB", (1000, 800), color="red").save(image_bytes, format="PNG")
+    image = handler.reduce_image_for_thumbnails(Image.open(image_bytes), 100, 100)
+    assert image.size == (125, 100)
+
+    # The image is never reduced below the provided size.
+    image_bytes = BytesIO()
+    Image.new("RGB", (199, 1000), color="red").save(image_bytes, format="PNG")
+    image = handler.reduce_image_for_thumbnails(Image.open(image_bytes), 100, 100)
+    assert image.size == (199, 1000)
+
+    image_bytes = BytesIO()
+    Image.new("P", (1000, 800)).save(image_bytes, format="GIF")
+    image = handler.reduce_image_for_thumbnails(Image.open(image_bytes), 100, 100)
+    assert image.size == (1000, 800)
+
+
 @pytest.mark.django_db
 @httpretty.activate(verbose=True, allow_net_connect=False)
 def test_upload_user_file_by_url(data_fixture, tmpdir):
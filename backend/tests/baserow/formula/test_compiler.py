@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.core.formula import resolve_formula
+from baserow.core.formula.parser import compiler
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    InvalidNumberOfArguments,
+)
+from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.test_utils.helpers import load_test_cases
+
+TEST_DATA = load_test_cases("formula_runtime_cases")
+
+VALID_FORMULA_TESTS = TEST_DATA["VALID_FORMULA_TESTS"]
+INVALID_FORMULA_TESTS = TEST_DATA["INVALID_FORMULA_TESTS"]
+
+
+@pytest.mark.parametrize("test_data", VALID_FORMULA_TESTS)
+def test_valid_compiled_formulas(test_data):
+    formula = test_data["formula"]
+    result = test_data["result"]
+    context = test_data["context"]
+
+    compiled = compiler.compile_formula(formula)
+    assert compiled(formula_runtime_function_registry, context) == result
+    assert resolve_formula(formula, formula_runtime_function_registry, context) == (
+        result
+    )
+
+
+@pytest.mark.parametrize("test_data", INVALID_FORMULA_TESTS)
+def test_invalid_compiled_formulas(test_data):
+    formula = test_data["formula"]
+    context = test_data["context"]
+
+    with pytest.raises(Exception):
+        resolve_formula(formula, formula_runtime_function_registry, context)
+
+
+def test_compiled_formula_function_does_not_exist():
+    with pytest.raises(BaserowFormulaSyntaxError):
+        resolve_formula(
+            "notExistingFunction(1,2,3)", formula_runtime_function_registry, {}
+        )
+
+
+def test_compiled_formula_invalid_number_of_arguments():
+    with pytest.raises(InvalidNumberOfArguments):
+        resolve_formula("get(1,2)", formula_runtime_function_registry, {})
+
+
+def test_compiled_formulas_are_cached():
+    compiler.compile_formula.cache_clear()
+
+    with patch.object(
+        compiler,
+        "get_parse_tree_for_formula",
+        wraps=compiler.get_parse_tree_for_formula,
+    ) as get_parse_tree:
+        for context in [{"a": "1"}, {"a": "2"}]:
+            assert resolve_formula(
+                "concat(get('a'), 'b')", formula_runtime_function_registry, context
+            ) == (context["a"] + "b")
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(BaserowFormulaSyntaxError) as exc_info:
+                resolve_formula("concat(", formula_runtime_function_registry, {})
+            errors.append(exc_info.value)
+
+    assert get_parse_tree.call_count == 2
+    assert errors[0] is not errors[1]
+    assert str(errors[0]) == str(errors[1])
@@ -9,6 +9,7 @@ from pyinstrument import Profiler
 from rest_framework.status import HTTP_200_OK
 
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.formula.parser import ast_mapper
 from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.trash.handler import TrashHandler
@@ -366,3 +367,44 @@ def test_fanout(data_fixture, api_client, django_assert_num_queries):
             )
             print(profiler.output_text(unicode=True, color=True))
     print(results)
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_generating_model_of_table_with_many_formula_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="text", primary=True)
+    for i in range(100):
+        FieldHandler().create_field(
+            user=user,
+            table=table,
+            name=f"formula {i}",
+            type_name="formula",
+            formula=f"concat(upper(field('text')), '{i}', totext(len(field('text'))))",
+        )
+
+    parse_cache = ast_mapper._cached_raw_formula_to_untyped_expression
+    parse_cache.cache_clear()
+    profiler = Profiler()
+    profiler.start()
+    # The generated model cache is bypassed, so that the formulas are typed again.
+    table.get_model(use_cache=False)
+    profiler.stop()
+    print("--------- Generating the model without parsed formulas -------")
+    print(profiler.output_text(unicode=True, color=True))
+    cache_info = parse_cache.cache_info()
+    assert cache_info.misses >= 100
+
+    profiler = Profiler()
+    profiler.start()
+    table.get_model(use_cache=False)
+    profiler.stop()
+    print("--------- Generating the model with parsed formulas -------")
+    print(profiler.output_text(unicode=True, color=True))
+    # All the formulas are served from the parse cache the second time.
+    assert parse_cache.cache_info().misses == cache_info.misses
+    assert parse_cache.cache_info().hits >= cache_info.hits + 100
@@ -0,0 +1,64 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import pytest
+from pyinstrument import Profiler
+from rest_framework.status import HTTP_200_OK
+
+from baserow.contrib.database.fields.handler import FieldHandler
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_listing_rows_of_grid_view_with_many_link_row_fields(data_fixture, api_client):
+    user, token = data_fixture.create_user_and_token()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=table, primary=True)
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+
+    related_tables = []
+    for _ in range(4):
+        related_table = data_fixture.create_database_table(database=database)
+        data_fixture.create_text_field(table=related_table, primary=True)
+        related_model = related_table.get_model()
+        related_model.objects.bulk_create([related_model() for _ in range(50)])
+        related_tables.append(related_table)
+
+    link_fields = [
+        FieldHandler().create_field(
+            user=user,
+            table=table,
+            name=f"link {i}",
+            type_name="link_row",
+            link_row_table=related_tables[i % len(related_tables)],
+        )
+        for i in range(20)
+    ]
+
+    model = table.get_model()
+    rows = model.objects.bulk_create([model() for _ in range(200)])
+    for link_field in link_fields:
+        related_model = link_field.link_row_table.get_model()
+        related_ids = list(related_model.objects.values_list("id", flat=True))
+        for row in rows:
+            getattr(row, f"field_{link_field.id}").set(related_ids[:10])
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+    profiler = Profiler()
+    profiler.start()
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(
+            url, {"size": 200}, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+        )
+    profiler.stop()
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()["results"]) == 200
+    print("--------- Listing 200 rows with 20 link row fields -------")
+    print(f"{len(captured.captured_queries)} queries")
+    print(profiler.output_text(unicode=True, color=True))
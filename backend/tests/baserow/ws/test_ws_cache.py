@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from django.test import override_settings
+
+import pytest
+
+from baserow.core.handler import CoreHandler
+from baserow.ws.cache import get_permitted_user_ids
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_permitted_user_ids_is_cached_until_members_change(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    compute = MagicMock(return_value=[user.id])
+
+    args = (workspace.id, "database.table.read", "database_table", 1, compute)
+    assert get_permitted_user_ids(*args) == [user.id]
+    assert get_permitted_user_ids(*args) == [user.id]
+    assert compute.call_count == 1
+
+    # A different scope or operation has its own entry.
+    get_permitted_user_ids(
+        workspace.id, "database.table.read", "database_table", 2, compute
+    )
+    get_permitted_user_ids(
+        workspace.id, "database.table.update", "database_table", 1, compute
+    )
+    assert compute.call_count == 3
+
+    user_2 = data_fixture.create_user()
+    workspace_user_2 = data_fixture.create_user_workspace(
+        user=user_2, workspace=workspace, permissions="MEMBER"
+    )
+    CoreHandler().update_workspace_user(user, workspace_user_2, permissions="ADMIN")
+
+    compute.return_value = [user.id, user_2.id]
+    assert get_permitted_user_ids(*args) == [user.id, user_2.id]
+    assert compute.call_count == 4
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS=0)
+def test_get_permitted_user_ids_without_cache(data_fixture):
+    compute = MagicMock(return_value=[1])
+
+    get_permitted_user_ids(1, "database.table.read", "database_table", 1, compute)
+    get_permitted_user_ids(1, "database.table.read", "database_table", 1, compute)
+    assert compute.call_count == 2
@@ -6,6 +6,7 @@ from django.utils import timezone
 
 import pytest
 
+from baserow.core import signals
 from baserow.core.handler import CoreHandler
 from baserow.core.models import (
     WORKSPACE_USER_PERMISSION_ADMIN,
@@ -499,3 +500,25 @@ def test_user_password_changed(mock_force_disconnect_user, data_fixture):
     mock_force_disconnect_user.delay.assert_called_once()
     args = mock_force_disconnect_user.delay.call_args
     assert args[0][0] == [user.id]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.signals.broadcast_to_users")
+@pytest.mark.websockets
+def test_user_file_thumbnails_generated(mock_broadcast_to_users, data_fixture):
+    user = data_fixture.create_user()
+    user_file = data_fixture.create_user_file(uploaded_by=user, is_image=True)
+
+    signals.user_file_thumbnails_generated.send(None, user_file=user_file)
+
+    mock_broadcast_to_users.delay.assert_called_once()
+    args = mock_broadcast_to_users.delay.call_args
+    assert args[0][0] == [user.id]
+    assert args[0][1]["type"] == "user_file_thumbnails_generated"
+    assert args[0][1]["user_file"]["name"] == user_file.name
+    assert "tiny" in args[0][1]["user_file"]["thumbnails"]
+
+    mock_broadcast_to_users.reset_mock()
+    anonymous_user_file = data_fixture.create_user_file(uploaded_by=None)
+    signals.user_file_thumbnails_generated.send(None, user_file=anonymous_user_file)
+    mock_broadcast_to_users.delay.assert_not_called()
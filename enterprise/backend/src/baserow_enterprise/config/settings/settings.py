@@ -20,6 +20,13 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", 365)
     )
 
+    # The number of seconds the roles per scope of an actor in a workspace are cached
+    # for the permission checks. They're invalidated when the roles, teams or members
+    # of the workspace change. Set to 0 to disable the cache.
+    settings.BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS = int(
+        os.getenv("BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS", 300)
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
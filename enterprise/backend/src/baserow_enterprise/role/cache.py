@@ -0,0 +1,123 @@
+"""
+Caches the roles per scope of the actors of a workspace. They're needed for every
+permission check, and computing them requires querying the role assignments, the
+teams, the workspace users and the scopes. For list endpoints and real time events
+the same actors are checked many times per second, while their roles rarely change.
+
+The cached snapshot of an actor only contains plain values: the content type id and
+the id of every scope, and the ids of the roles assigned on it. It therefore stays
+small and valid when the models change. The roles are resolved with the in-process
+role cache of the `RoleAssignmentHandler` and the scopes are queried type by type.
+
+Every workspace has a version in the cache that's part of the cache key of the
+snapshots. Changing the roles, teams or members of a workspace bumps the version
+which invalidates all the snapshots of that workspace at once.
+"""
+
+import uuid
+from typing import Callable, Dict, List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from baserow.core.registries import SubjectType
+from baserow.core.types import Subject
+
+# The scopes are identified by their content type id and id.
+ScopeParam = Tuple[int, int]
+RoleIdsPerScope = List[Tuple[ScopeParam, List[int]]]
+
+
+def _workspace_version_cache_key(workspace_id: int) -> str:
+    return f"rbac_roles_per_scope_version_{workspace_id}"
+
+
+def _roles_per_scope_cache_key(
+    workspace_id: int,
+    version: str,
+    actor_subject_type: SubjectType,
+    actor_id: int,
+    include_trash: bool,
+) -> str:
+    return (
+        f"rbac_roles_per_scope_{workspace_id}_{version}_{actor_subject_type.type}_"
+        f"{actor_id}_{int(include_trash)}"
+    )
+
+
+def get_role_ids_per_scope_for_actors(
+    workspace_id: int,
+    actor_subject_type: SubjectType,
+    actors: List[Subject],
+    include_trash: bool,
+    compute: Callable[[List[Subject]], Dict[Subject, RoleIdsPerScope]],
+) -> Dict[Subject, RoleIdsPerScope]:
+    """
+    Returns the role ids per scope of the provided actors. The snapshots of the
+    actors that are not cached yet are computed at once with the `compute` function
+    and stored in the cache.
+
+    :param workspace_id: The workspace the actors are in.
+    :param actor_subject_type: The subject type of all the actors.
+    :param actors: The actors we want the role ids per scope for.
+    :param include_trash: Whether the snapshot is computed for a trashed workspace.
+    :param compute: A function that computes the role ids per scope of the provided
+        actors if they're not in the cache.
+    :return: A dict with the actor as key and the list of (scope param, role ids) as
+        value.
+    """
+
+    timeout = settings.BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS
+    if timeout <= 0:
+        return compute(actors)
+
+    # The version must be fetched before computing the roles, so that a concurrent
+    # invalidation never results in a stale snapshot for the new version.
+    version = cache.get(_workspace_version_cache_key(workspace_id), "0")
+    cache_key_by_actor = {
+        actor: _roles_per_scope_cache_key(
+            workspace_id, version, actor_subject_type, actor.id, include_trash
+        )
+        for actor in actors
+    }
+    cached = cache.get_many(cache_key_by_actor.values())
+
+    result = {}
+    missing_actors = []
+    for actor, cache_key in cache_key_by_actor.items():
+        if cache_key in cached:
+            result[actor] = cached[cache_key]
+        else:
+            missing_actors.append(actor)
+
+    if missing_actors:
+        computed = compute(missing_actors)
+        cache.set_many(
+            {cache_key_by_actor[actor]: computed[actor] for actor in missing_actors},
+            timeout=timeout,
+        )
+        result.update(computed)
+
+    return result
+
+
+def _bump_workspace_version(workspace_id: int):
+    cache.set(_workspace_version_cache_key(workspace_id), str(uuid.uuid4()), None)
+
+
+def invalidate_roles_per_scope_cache(workspace_id: int):
+    """
+    Invalidates all the cached roles per scope of the provided workspace. The
+    version is bumped immediately, so that the rest of the transaction sees the
+    change, and again when the transaction commits, because the snapshots could
+    have been cached based on the old data by concurrent requests in the meantime.
+
+    :param workspace_id: The id of the workspace that must be invalidated.
+    """
+
+    if settings.BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS <= 0:
+        return
+
+    _bump_workspace_version(workspace_id)
+    transaction.on_commit(lambda: _bump_workspace_version(workspace_id))
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
@@ -35,6 +35,7 @@ from baserow_enterprise.signals import (
 )
 from baserow_enterprise.teams.models import Team, TeamSubject
 
+from .cache import RoleIdsPerScope, ScopeParam, get_role_ids_per_scope_for_actors
 from .constants import (
     ALLOWED_SUBJECT_TYPE_BY_PRIORITY,
     NO_ACCESS_ROLE_UID,
@@ -75,12 +76,32 @@ class RoleAssignmentHandler:
             cls._init = True
             cls._role_cache_by_uid = {}
             cls._role_cache_by_id = {}
+            cls._role_operations_cache_by_id = {}
             for role in Role.objects.prefetch_related("operations").all():
                 cls._role_cache_by_uid[role.uid] = role
                 cls._role_cache_by_id[role.id] = role
+                cls._role_operations_cache_by_id[role.id] = frozenset(
+                    op.name for op in role.operations.all()
+                )
 
         return cls._role_cache_by_uid, cls._role_cache_by_id
 
+    def get_role_operations(self, role: Role) -> Set[str]:
+        """
+        Returns the names of the operations of the given role. They're compiled once
+        per process for the cached roles, because they're needed for every
+        permission check.
+
+        :param role: The role we want the operation names for.
+        :return: A set of operation names.
+        """
+
+        self._get_role_caches()
+        operations = self._role_operations_cache_by_id.get(role.id)
+        if operations is None:
+            operations = frozenset(op.name for op in role.operations.all())
+        return operations
+
     def get_role_by_uid(self, role_uid: str, use_fallback=False) -> Role:
         """
         Returns the role for the given uid.
@@ -305,6 +326,74 @@ class RoleAssignmentHandler:
             the object hierarchy, the earlier the tuple is in the list.
         """
 
+        role_ids_per_scope_per_actor = get_role_ids_per_scope_for_actors(
+            workspace.id,
+            actor_subject_type,
+            actors,
+            include_trash,
+            lambda missing_actors: self._compute_role_ids_per_scope_for_actors(
+                workspace, actor_subject_type, missing_actors, include_trash
+            ),
+        )
+
+        scope_by_param = self._get_scopes_by_param(
+            workspace,
+            {
+                scope_param
+                for role_ids_per_scope in role_ids_per_scope_per_actor.values()
+                for scope_param, _ in role_ids_per_scope
+            },
+        )
+
+        # A scope that doesn't exist anymore can't include any context.
+        return {
+            actor: [
+                (
+                    scope_by_param[scope_param],
+                    [self.get_role_by_id(role_id) for role_id in role_ids],
+                )
+                for scope_param, role_ids in role_ids_per_scope
+                if scope_param in scope_by_param
+            ]
+            for actor, role_ids_per_scope in role_ids_per_scope_per_actor.items()
+        }
+
+    def _get_scopes_by_param(
+        self, workspace: Workspace, scope_params: Set[ScopeParam]
+    ) -> Dict[ScopeParam, ScopeObject]:
+        """
+        Returns the scope objects of the provided (content type id, id) scope params
+        by querying them type by type.
+        """
+
+        workspace_scope_param = (
+            ContentType.objects.get_for_model(Workspace).id,
+            workspace.id,
+        )
+        scope_by_param = {workspace_scope_param: workspace}
+
+        scope_ids_per_content_type_id = defaultdict(set)
+        for content_type_id, scope_id in scope_params - {workspace_scope_param}:
+            scope_ids_per_content_type_id[content_type_id].add(scope_id)
+
+        for content_type_id, scope_ids in scope_ids_per_content_type_id.items():
+            for scope in self.get_scopes(content_type_id, scope_ids):
+                scope_by_param[(content_type_id, scope.id)] = scope
+
+        return scope_by_param
+
+    def _compute_role_ids_per_scope_for_actors(
+        self,
+        workspace: Workspace,
+        actor_subject_type: SubjectType,
+        actors: List[Subject],
+        include_trash=False,
+    ) -> Dict[Subject, RoleIdsPerScope]:
+        """
+        Computes the role ids per scope param for all given actors from the
+        database. See `get_roles_per_scope_for_actors` for the parameters.
+        """
+
         content_types = ContentType.objects.get_for_models(
             actor_subject_type.model_class, Team, Workspace
         )
@@ -392,9 +481,6 @@ class RoleAssignmentHandler:
         # Track the latest role priority for each scope of each subject
         priorities_by_scope_per_actor_id = defaultdict(dict)
 
-        # Keep a list of scope params to query later
-        scopes_to_query = defaultdict(set)
-
         roles_by_scope = defaultdict(lambda: {workspace_scope_param: []})
 
         for role_assignment in role_assignments:
@@ -403,8 +489,6 @@ class RoleAssignmentHandler:
             role_assignment_priority = role_assignment.role_priority
             subject_id = role_assignment.subject_id
 
-            scopes_to_query[role_assignment.scope_type_id].add(role_assignment.scope_id)
-
             # Is it a simple actor or a team?
             # If it's a team we need to iterate over all the actor that are
             # subject of the team
@@ -466,19 +550,14 @@ class RoleAssignmentHandler:
                         workspace_level_role
                     ]
 
-        # Populate scope cache by querying all scopes type by type
-        scope_cache = {workspace_scope_param: workspace}
-        for content_type_id, content_ids in scopes_to_query.items():
-            for scope in self.get_scopes(content_type_id, content_ids):
-                scope_cache[(content_type_id, scope.id)] = scope
-
-        # Finally replace scope_params by real scope
-        roles_per_scope_per_user = defaultdict(list)
-        for actor in actors:
-            for key, value in roles_by_scope[actor.id].items():
-                roles_per_scope_per_user[actor].append((scope_cache[key], value))
-
-        return roles_per_scope_per_user
+        # Finally only keep the role ids, so that the result can be cached.
+        return {
+            actor: [
+                (scope_param, [role.id for role in roles])
+                for scope_param, roles in roles_by_scope[actor.id].items()
+            ]
+            for actor in actors
+        }
 
     def get_computed_roles(
         self, roles_per_scopes, context: Any, cache: Optional[Dict] = None
@@ -10,6 +10,7 @@ from baserow_premium.license.handler import LicenseHandler
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.models import Workspace
 from baserow.core.registries import (
+    ObjectScopeType,
     OperationType,
     PermissionManagerType,
     object_scope_type_registry,
@@ -45,15 +46,15 @@ class RolePermissionManagerType(PermissionManagerType):
 
         return LicenseHandler.workspace_has_feature(RBAC, workspace)
 
-    def get_role_operations(self, role: Role) -> List[str]:
+    def get_role_operations(self, role: Role) -> Set[str]:
         """
-        Return the operation name list for the role with the given role_id.
+        Return the operation name set for the role with the given role_id.
 
         :param role: The role we want the operation names for.
-        :return: A list of role operation name.
+        :return: A set of role operation name.
         """
 
-        return set([op.name for op in role.operations.all()])
+        return RoleAssignmentHandler().get_role_operations(role)
 
     @cached_property
     def read_operations(self) -> Set[str]:
@@ -121,11 +122,43 @@ class RolePermissionManagerType(PermissionManagerType):
 
         return result
 
+    def get_allowed_operations_per_scope(
+        self, roles_by_scope: List[Tuple[Any, List[Role]]]
+    ) -> List[Tuple[Any, ObjectScopeType, Set[str]]]:
+        """
+        Compiles the role assignments to the operations allowed on every scope. This
+        only depends on the role assignments, so it can be computed once and reused
+        to compute the policy of all the operations.
+
+        :param roles_by_scope: The role assignments ordered by scope.
+        :return: A list of (scope, scope type, allowed operation names) in the same
+            order as the given role assignments.
+        """
+
+        allowed_operations_per_scope = []
+        for scope, roles in roles_by_scope:
+            allowed_operations = set()
+            for role in roles:
+                allowed_operations.update(self.get_role_operations(role))
+
+            allowed_operations_per_scope.append(
+                (
+                    scope,
+                    object_scope_type_registry.get_by_model(scope),
+                    allowed_operations,
+                )
+            )
+
+        return allowed_operations_per_scope
+
     def get_operation_policy(
         self,
         roles_by_scope: List[Tuple[Any, List[Role]]],
         operation_type: OperationType,
         use_object_scope: bool = False,
+        allowed_operations_per_scope: Optional[
+            List[Tuple[Any, ObjectScopeType, Set[str]]]
+        ] = None,
     ) -> Tuple[bool, Set[Any]]:
         """
         Compute the default policy and exceptions for an operation given the
@@ -135,10 +168,18 @@ class RolePermissionManagerType(PermissionManagerType):
         :param operation_type: The operation type we want the policy for.
         :param use_object_scope: Use the `object_scope` instead of the `context_scope`
             of the scope_type. This change the type of returned objects.
+        :param allowed_operations_per_scope: The result of
+            `get_allowed_operations_per_scope` for the given role assignments if it
+            has already been computed.
         :return: A tuple. The first element is the default policy. The second element
             is a set of context or object that are exceptions to the default policy.
         """
 
+        if allowed_operations_per_scope is None:
+            allowed_operations_per_scope = self.get_allowed_operations_per_scope(
+                roles_by_scope
+            )
+
         base_scope_type = (
             operation_type.object_scope
             if use_object_scope
@@ -146,23 +187,11 @@ class RolePermissionManagerType(PermissionManagerType):
         )
 
         # Default permissions at the workspace level
-        _, default_workspace_roles = roles_by_scope[0]
-        default = any(
-            [
-                operation_type.type in self.get_role_operations(r)
-                for r in default_workspace_roles
-            ]
-        )
+        _, _, default_workspace_operations = allowed_operations_per_scope[0]
+        default = operation_type.type in default_workspace_operations
         exceptions = set()
 
-        for scope, roles in roles_by_scope[1:]:
-            allowed_operations = set()
-
-            for role in roles:
-                allowed_operations.update(self.get_role_operations(role))
-
-            scope_type = object_scope_type_registry.get_by_model(scope)
-
+        for scope, scope_type, allowed_operations in allowed_operations_per_scope[1:]:
             # First case
             # The scope of the role assignment includes the scope of the operation
             # So it has an influence on the result
@@ -234,6 +263,10 @@ class RolePermissionManagerType(PermissionManagerType):
         # Get all role assignments for this actor into this workspace
         roles_by_scope = RoleAssignmentHandler().get_roles_per_scope(workspace, actor)
 
+        allowed_operations_per_scope = self.get_allowed_operations_per_scope(
+            roles_by_scope
+        )
+
         policy_per_operation = defaultdict(lambda: {"default": False, "exceptions": []})
 
         exceptions_with_mixed_types_per_scope = defaultdict(set)
@@ -241,7 +274,9 @@ class RolePermissionManagerType(PermissionManagerType):
         # First, for each operation we want the default policy and exceptions
         for operation_type in operation_type_registry.get_all():
             default, exceptions = self.get_operation_policy(
-                roles_by_scope, operation_type
+                roles_by_scope,
+                operation_type,
+                allowed_operations_per_scope=allowed_operations_per_scope,
             )
 
             if default or exceptions:
@@ -285,6 +320,10 @@ class RolePermissionManagerType(PermissionManagerType):
         """
         Filter the given queryset according to the role given for the specified
         operation.
+
+        The policy is computed in Python from the cached roles per scope, because
+        the role priorities, the team roles and the low priority roles can't be
+        expressed as a single join. The result is one `IN` filter per scope type.
         """
 
         if workspace is None or not self.is_enabled(workspace):
@@ -1,22 +1,32 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
-from baserow.core.signals import permissions_updated, workspace_user_updated
+from baserow.core.signals import (
+    permissions_updated,
+    workspace_user_added,
+    workspace_user_deleted,
+    workspace_user_updated,
+)
 from baserow.core.types import Subject
 from baserow.ws.tasks import broadcast_to_users
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
     role_assignment_updated,
+    team_created,
     team_deleted,
     team_restored,
+    team_updated,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
+
+from .cache import invalidate_roles_per_scope_cache
+from .models import RoleAssignment
 
 User = get_user_model()
 
@@ -66,6 +76,57 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(permissions_updated)
+def invalidate_roles_per_scope_when_permissions_updated(
+    sender, workspace: Workspace, **kwargs
+):
+    invalidate_roles_per_scope_cache(workspace.id)
+
+
+@receiver(workspace_user_added)
+@receiver(workspace_user_updated)
+@receiver(workspace_user_deleted)
+def invalidate_roles_per_scope_when_workspace_user_changed(
+    sender, workspace_user: WorkspaceUser, **kwargs
+):
+    invalidate_roles_per_scope_cache(workspace_user.workspace_id)
+
+
+@receiver(post_save, sender=RoleAssignment)
+@receiver(post_delete, sender=RoleAssignment)
+@receiver(post_save, sender=WorkspaceUser)
+@receiver(post_delete, sender=WorkspaceUser)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_roles_per_scope_when_saved(sender, instance, **kwargs):
+    # Also catches the changes that don't go through the handlers, for example by
+    # the data fixtures in the tests.
+    invalidate_roles_per_scope_cache(instance.workspace_id)
+
+
+@receiver(team_created)
+@receiver(team_updated)
+def invalidate_roles_per_scope_when_team_changed(sender, team: Team, **kwargs):
+    # The subjects of a team are created in bulk when it's created or updated.
+    invalidate_roles_per_scope_cache(team.workspace_id)
+
+
+@receiver(post_save, sender=TeamSubject)
+@receiver(post_delete, sender=TeamSubject)
+def invalidate_roles_per_scope_when_team_subject_changed(
+    sender, instance: TeamSubject, **kwargs
+):
+    # The team is looked up by id, because it's not loaded on the subject and it
+    # might already be deleted when its subjects are deleted in cascade.
+    workspace_id = (
+        Team.objects_and_trash.filter(id=instance.team_id)
+        .values_list("workspace_id", flat=True)
+        .first()
+    )
+    if workspace_id is not None:
+        invalidate_roles_per_scope_cache(workspace_id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
@@ -102,7 +163,12 @@ def cascade_scope_delete(sender, instance, **kwargs):
     from .models import RoleAssignment
 
     scope_ct = ContentType.objects.get_for_model(instance)
-    RoleAssignment.objects.filter(scope_id=instance.id, scope_type=scope_ct).delete()
+    role_assignments = RoleAssignment.objects.filter(
+        scope_id=instance.id, scope_type=scope_ct
+    )
+    for workspace_id in set(role_assignments.values_list("workspace_id", flat=True)):
+        invalidate_roles_per_scope_cache(workspace_id)
+    role_assignments.delete()
 
 
 def connect_to_post_delete_signals_to_cascade_deletion_to_role_assignments():
@@ -1,7 +1,14 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db.models.signals import post_delete
-
+from django.dispatch import receiver
+
+from baserow.ws.cache import invalidate_permitted_users_cache
+from baserow_enterprise.signals import (
+    team_subject_created,
+    team_subject_deleted,
+    team_subject_restored,
+)
 from baserow_enterprise.teams.subjects import TeamSubjectType
 
 User = get_user_model()
@@ -24,6 +31,13 @@ def cascade_workspace_user_delete(sender, instance, **kwargs):
     ).delete()
 
 
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_permitted_users_when_team_subject_changed(sender, subject, **kwargs):
+    invalidate_permitted_users_cache(subject.team.workspace_id)
+
+
 def connect_to_post_delete_signals_to_cascade_deletion_to_team_subjects():
     from baserow.core.models import WorkspaceUser
     from baserow.core.registries import subject_type_registry
@@ -1,3 +1,4 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import IntegrityError, connection, reset_queries
 from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
@@ -46,8 +47,9 @@ from baserow.core.operations import (
     UpdateSettingsOperationType,
     UpdateWorkspaceOperationType,
 )
-from baserow.core.registries import operation_type_registry
+from baserow.core.registries import operation_type_registry, subject_type_registry
 from baserow.core.types import PermissionCheck
+from baserow_enterprise.role.cache import get_role_ids_per_scope_for_actors
 from baserow_enterprise.role.default_roles import default_roles
 from baserow_enterprise.role.handler import RoleAssignmentHandler
 from baserow_enterprise.role.models import Role
@@ -939,6 +941,98 @@ def test_check_multiple_permissions(data_fixture, enterprise_data_fixture):
     ]
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS=300)
+def test_check_multiple_permissions_uses_cached_roles_per_scope(
+    data_fixture, enterprise_data_fixture
+):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(user=admin, workspace=workspace)
+    table1 = data_fixture.create_database_table(user=admin, database=database)
+    table2 = data_fixture.create_database_table(user=admin, database=database)
+    team = enterprise_data_fixture.create_team(workspace=workspace)
+
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="VIEWER"), scope=workspace
+    )
+    RoleAssignmentHandler().assign_role(
+        team, workspace, role=Role.objects.get(uid="BUILDER"), scope=table2
+    )
+
+    permission_manager = RolePermissionManagerType()
+
+    def can_update(table):
+        check = PermissionCheck(user, UpdateDatabaseTableOperationType.type, table)
+        result = permission_manager.check_multiple_permissions(
+            [check], workspace=workspace
+        )
+        return result[check] is True
+
+    assert can_update(table1) is False
+
+    with CaptureQueriesContext(connection) as captured:
+        assert can_update(table1) is False
+    assert not any(
+        "baserow_enterprise_roleassignment" in query["sql"]
+        for query in captured.captured_queries
+    )
+
+    # Changing the role assignments invalidates the cached roles immediately.
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="EDITOR"), scope=table1
+    )
+    assert can_update(table1) is False
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="BUILDER"), scope=table1
+    )
+    assert can_update(table1) is True
+
+    # And so does changing the members of the teams.
+    assert can_update(table2) is False
+    team_subject = enterprise_data_fixture.create_subject(team=team, subject=user)
+    assert can_update(table2) is True
+    team_subject.delete()
+    assert can_update(table2) is False
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS=300)
+def test_cached_roles_per_scope_only_contain_ids(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(user=user, workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="VIEWER"), scope=table
+    )
+
+    roles_per_scope = RoleAssignmentHandler().get_roles_per_scope(workspace, user)
+    assert [scope for scope, _ in roles_per_scope] == [workspace, table]
+
+    def compute(actors):
+        raise AssertionError("The roles per scope should be cached.")
+
+    cached = get_role_ids_per_scope_for_actors(
+        workspace.id, subject_type_registry.get("user"), [user], False, compute
+    )
+    assert cached == {
+        user: [
+            (
+                (ContentType.objects.get_for_model(scope).id, scope.id),
+                [role.id for role in roles],
+            )
+            for scope, roles in roles_per_scope
+        ]
+    }
+
+    # The cached scopes are queried again, and the roles resolved from their ids.
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == (
+        roles_per_scope
+    )
+
+
 @pytest.mark.django_db(transaction=True)
 @override_settings(
     PERMISSION_MANAGERS=["core", "staff", "member", "role", "basic"],
@@ -1378,7 +1472,21 @@ def test_check_permission_performance(data_fixture, enterprise_data_fixture, pro
     print(len(captured.captured_queries))
 
     print("----------- check_permission perfs ---------------")
-    with profiler(html_report_name="enterprise_check_permissions"):
+    with override_settings(
+        BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS=0
+    ), profiler(html_report_name="enterprise_check_permissions"):
+        for i in range(1000):
+            permission_manager.check_permissions(
+                user2,
+                ReadDatabaseTableOperationType.type,
+                workspace=workspace,
+                context=table11,
+            )
+
+    print("----------- check_permission perfs with cached roles ---------------")
+    with override_settings(
+        BASEROW_ENTERPRISE_ROLES_PER_SCOPE_CACHE_TIMEOUT_SECONDS=300
+    ), profiler(html_report_name="enterprise_check_permissions_cached"):
         for i in range(1000):
             permission_manager.check_permissions(
                 user2,
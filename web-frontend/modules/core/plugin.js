@@ -52,6 +52,7 @@ import sidebarStore from '@baserow/modules/core/store/sidebar'
 import undoRedoStore from '@baserow/modules/core/store/undoRedo'
 import integrationStore from '@baserow/modules/core/store/integration'
 import notificationStore from '@baserow/modules/core/store/notification'
+import userFileStore from '@baserow/modules/core/store/userFile'
 
 import en from '@baserow/modules/core/locales/en.json'
 import fr from '@baserow/modules/core/locales/fr.json'
@@ -140,6 +141,7 @@ export default (context, inject) => {
   store.registerModule('sidebar', sidebarStore)
   store.registerModule('undoRedo', undoRedoStore)
   store.registerModule('integration', integrationStore)
+  store.registerModule('userFile', userFileStore)
 
   registry.registerNamespace('integration')
   registry.registerNamespace('service')
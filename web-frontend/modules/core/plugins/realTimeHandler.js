@@ -243,6 +243,10 @@ export class RealTimeHandler {
       store.dispatch('auth/forceUpdateUserData', data.user_data)
     })
 
+    this.registerEvent('user_file_thumbnails_generated', ({ store }, data) => {
+      store.dispatch('userFile/forceSetThumbnailsGenerated', data.user_file)
+    })
+
     this.registerEvent('user_updated', ({ store }, data) => {
       store.dispatch('workspace/forceUpdateWorkspaceUserAttributes', {
         userId: data.user.id,
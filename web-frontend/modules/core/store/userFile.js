@@ -0,0 +1,98 @@
+import Vue from 'vue'
+
+// The thumbnails of a user file that fail to load are loaded again this number
+// of times, with a delay that doubles every time.
+const THUMBNAIL_LOAD_MAX_RETRIES = 5
+const THUMBNAIL_LOAD_RETRY_DELAY_MS = 1000
+
+export const state = () => ({
+  // The thumbnails of uploaded images are generated in the background, so they
+  // can be missing when they're first displayed. This contains the names of the
+  // user files of which the thumbnails have been generated since, with a
+  // timestamp that's added to their urls, so that the browser loads them again.
+  thumbnailsGenerated: {},
+  // The number of times that the thumbnails of a user file have been loaded again
+  // because they failed to load, by user file name.
+  thumbnailLoadRetries: {},
+  // The names of the user files of which the thumbnails are going to be loaded
+  // again.
+  thumbnailLoadRetryPending: {},
+})
+
+export const mutations = {
+  SET_THUMBNAILS_GENERATED(state, { name, timestamp }) {
+    Vue.set(state.thumbnailsGenerated, name, timestamp)
+  },
+  SET_THUMBNAIL_LOAD_RETRY_PENDING(state, { name, pending }) {
+    if (pending) {
+      Vue.set(state.thumbnailLoadRetryPending, name, true)
+      Vue.set(
+        state.thumbnailLoadRetries,
+        name,
+        (state.thumbnailLoadRetries[name] || 0) + 1
+      )
+    } else {
+      Vue.delete(state.thumbnailLoadRetryPending, name)
+    }
+  },
+}
+
+export const actions = {
+  /**
+   * Called when the real time event indicates that the thumbnails of the user
+   * file have been generated.
+   */
+  forceSetThumbnailsGenerated({ commit }, userFile) {
+    commit('SET_THUMBNAILS_GENERATED', {
+      name: userFile.name,
+      timestamp: new Date().getTime(),
+    })
+  },
+  /**
+   * Called when a thumbnail of the user file failed to load. The real time event
+   * is only sent to the user that uploaded the file, so other users, and
+   * anonymous uploaders of a form, can display the file before its thumbnails
+   * have been generated. The thumbnails are then loaded again a few times, with
+   * an increasing delay.
+   */
+  thumbnailLoadFailed({ commit, dispatch, state }, userFile) {
+    const name = userFile?.name
+    const retries = state.thumbnailLoadRetries[name] || 0
+    if (
+      !name ||
+      state.thumbnailLoadRetryPending[name] ||
+      retries >= THUMBNAIL_LOAD_MAX_RETRIES
+    ) {
+      return
+    }
+
+    commit('SET_THUMBNAIL_LOAD_RETRY_PENDING', { name, pending: true })
+    setTimeout(() => {
+      commit('SET_THUMBNAIL_LOAD_RETRY_PENDING', { name, pending: false })
+      dispatch('forceSetThumbnailsGenerated', userFile)
+    }, THUMBNAIL_LOAD_RETRY_DELAY_MS * 2 ** retries)
+  },
+}
+
+export const getters = {
+  /**
+   * Returns the url of the thumbnail of the provided size of the file, which
+   * can for example be the value of a file field.
+   */
+  getThumbnailUrl: (state) => (file, size) => {
+    const url = file?.thumbnails?.[size]?.url
+    const timestamp = state.thumbnailsGenerated[file?.name]
+    if (!url || timestamp === undefined) {
+      return url
+    }
+    return `${url}${url.includes('?') ? '&' : '?'}generated=${timestamp}`
+  },
+}
+
+export default {
+  namespaced: true,
+  state,
+  getters,
+  actions,
+  mutations,
+}
@@ -230,6 +230,16 @@ export const registerRealtimeEvents = (realtime) => {
     }
   })
 
+  realtime.registerEvent('rows_changed', ({ store, app }, data) => {
+    // Sent instead of `rows_updated` if many rows changed in a short time. The
+    // message only contains the ids of the changed rows, so the rows are refetched.
+    if (store.getters['table/getSelectedId'] === data.table_id) {
+      app.$bus.$emit('table-refresh', {
+        tableId: store.getters['table/getSelectedId'],
+      })
+    }
+  })
+
   realtime.registerEvent('row_orders_recalculated', ({ store, app }, data) => {
     if (store.getters['table/getSelectedId'] === data.table_id) {
       app.$bus.$emit('table-refresh', {
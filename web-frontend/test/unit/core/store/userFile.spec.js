@@ -0,0 +1,53 @@
+import { TestApp } from '@baserow/test/helpers/testApp'
+
+describe('User file store', () => {
+  let testApp = null
+  let store = null
+
+  beforeEach(() => {
+    testApp = new TestApp()
+    store = testApp.store
+  })
+
+  afterEach(() => {
+    testApp.afterEach()
+  })
+
+  test('the thumbnail urls change when the thumbnails have been generated', async () => {
+    const url = 'http://localhost/thumbnails/tiny/image.png'
+    const file = { name: 'image.png', thumbnails: { tiny: { url } } }
+    const getThumbnailUrl = store.getters['userFile/getThumbnailUrl']
+    expect(getThumbnailUrl(file, 'tiny')).toBe(url)
+    expect(getThumbnailUrl(file, 'small')).toBeUndefined()
+    expect(getThumbnailUrl(null, 'tiny')).toBeUndefined()
+
+    await store.dispatch('userFile/forceSetThumbnailsGenerated', {
+      name: 'image.png',
+    })
+    expect(getThumbnailUrl(file, 'tiny')).toMatch(/^.*\?generated=\d+$/)
+    expect(getThumbnailUrl(file, 'tiny').startsWith(url)).toBe(true)
+    expect(getThumbnailUrl({ ...file, name: 'other.png' }, 'tiny')).toBe(url)
+  })
+
+  test('the thumbnails are loaded again when they failed to load', async () => {
+    jest.useFakeTimers()
+    const url = 'http://localhost/thumbnails/tiny/image.png'
+    const file = { name: 'image.png', thumbnails: { tiny: { url } } }
+    const getThumbnailUrl = store.getters['userFile/getThumbnailUrl']
+
+    // Failing to load twice before the retry only schedules one retry.
+    await store.dispatch('userFile/thumbnailLoadFailed', file)
+    await store.dispatch('userFile/thumbnailLoadFailed', file)
+    expect(getThumbnailUrl(file, 'tiny')).toBe(url)
+    jest.advanceTimersByTime(1000)
+    expect(getThumbnailUrl(file, 'tiny')).toMatch(/^.*\?generated=\d+$/)
+    expect(store.state.userFile.thumbnailLoadRetries['image.png']).toBe(1)
+
+    for (let i = 0; i < 10; i++) {
+      await store.dispatch('userFile/thumbnailLoadFailed', file)
+      jest.runOnlyPendingTimers()
+    }
+    expect(store.state.userFile.thumbnailLoadRetries['image.png']).toBe(5)
+    jest.useRealTimers()
+  })
+})